@@ -1,8 +1,12 @@
 from manim import *
 import numpy as np
 
+from batched_apply import BatchedApplyMatrix
+from hud import use_hud_overlay
+
 class LinearTransformations3D(ThreeDScene):
     def construct(self):
+        use_hud_overlay(self)
         self.set_camera_orientation(phi=75 * DEGREES, theta=30 * DEGREES)
         
         axes = ThreeDAxes(
@@ -90,22 +94,22 @@ class LinearTransformations3D(ThreeDScene):
             return matrix_tex, matrix_title
         
         matrix_tex, matrix_title = show_matrix(scaling_matrix, "Scaling Matrix")
-        self.play(ApplyMatrix(scaling_matrix, cube))
+        self.play(BatchedApplyMatrix(scaling_matrix, cube))
         self.wait(1)
         self.play(FadeOut(matrix_tex), FadeOut(matrix_title))
         
         matrix_tex, matrix_title = show_matrix(rotation_x_matrix, "X-Axis Rotation Matrix")
-        self.play(ApplyMatrix(rotation_x_matrix_numeric, cube))
+        self.play(BatchedApplyMatrix(rotation_x_matrix_numeric, cube, path="polar"))
         self.wait(1)
         self.play(FadeOut(matrix_tex), FadeOut(matrix_title))
         
         matrix_tex, matrix_title = show_matrix(rotation_y_matrix, "Y-Axis Rotation Matrix")
-        self.play(ApplyMatrix(rotation_y_matrix_numeric, cube))
+        self.play(BatchedApplyMatrix(rotation_y_matrix_numeric, cube, path="polar"))
         self.wait(1)
         self.play(FadeOut(matrix_tex), FadeOut(matrix_title))
         
         matrix_tex, matrix_title = show_matrix(shear_matrix, "Shear Matrix")
-        self.play(ApplyMatrix(shear_matrix, cube))
+        self.play(BatchedApplyMatrix(shear_matrix, cube))
         self.wait(1)
         self.play(FadeOut(matrix_tex), FadeOut(matrix_title))
         
@@ -0,0 +1,165 @@
+from manim import *
+import numpy as np
+
+from batched_apply import BatchedApplyMatrix, prepare_matrix
+from fast_grid import FastGrid
+from matrix_paths import MatrixPath, MatrixTable
+
+# Tip outline in the arrow's own frame, in units of the tip length: x runs
+# along the arrow (0 is the head), y across it. Every arrow's tip is this
+# one triangle, moved, turned and scaled.
+TIP_TEMPLATE = np.array([[-1.0, 0.5], [0.0, 0.0], [-1.0, -0.5], [-1.0, 0.5]])
+
+# Short arrows get a smaller tip, at most this fraction of their length
+MAX_TIP_RATIO = 0.35
+
+# Points per arrow in arrow_points: a shaft curve, then three tip curves. The
+# tail is the first point, the head is where the first tip curve ends
+POINTS_PER_ARROW = 16
+TAIL_POINT, HEAD_POINT = 0, 7
+
+
+def straight_cubics(starts, ends):
+    # (n, 3) anchors -> (n, 4, 3) cubic Bézier control points of straight lines
+    delta = ends - starts
+    return np.stack([starts, starts + delta / 3, starts + 2 * delta / 3, ends], axis=1)
+
+
+def arrow_points(tails, heads, tip_length):
+    # All arrows at once: per arrow one shaft curve and three tip curves,
+    # POINTS_PER_ARROW points, as a single (16 n, 3) array
+    vectors = heads - tails
+    lengths = np.linalg.norm(vectors, axis=1)
+    units = vectors / np.maximum(lengths, 1e-12)[:, None]
+    normals = np.stack([-units[:, 1], units[:, 0], np.zeros(len(units))], axis=1)
+    tips = np.minimum(tip_length, lengths * MAX_TIP_RATIO)[:, None, None]
+
+    corners = (
+        heads[:, None, :]
+        + TIP_TEMPLATE[None, :, 0, None] * tips * units[:, None, :]
+        + TIP_TEMPLATE[None, :, 1, None] * tips * normals[:, None, :]
+    )
+    shaft = straight_cubics(tails, heads - tips[:, 0] * units)
+    tip = straight_cubics(corners[:, :-1].reshape(-1, 3), corners[:, 1:].reshape(-1, 3)).reshape(len(tails), 3, 4, 3)
+    return np.concatenate([shaft[:, None], tip], axis=1).reshape(-1, 3)
+
+
+def sample_field(func, x_range, y_range):
+    x_min, x_max, x_step = x_range
+    y_min, y_max, y_step = y_range
+    xs, ys = np.meshgrid(
+        np.arange(x_min, x_max + x_step / 2, x_step),
+        np.arange(y_min, y_max + y_step / 2, y_step),
+    )
+    tails = np.stack([xs.ravel(), ys.ravel(), np.zeros(xs.size)], axis=1)
+    try:
+        vectors = np.asarray(func(tails), dtype=float)
+        if vectors.shape != tails.shape:
+            raise ValueError
+    except (TypeError, ValueError):
+        vectors = np.array([func(p) for p in tails], dtype=float)
+    return tails, vectors
+
+
+class ArrowField(VMobject):
+    # Thousands of arrows as one VMobject. Each Vector is a mobject of its
+    # own with a separate tip mobject; here the drawing of every arrow is
+    # generated from two (n, 3) arrays of tails and heads in one vectorized
+    # pass. The tails and heads are read back from the points, so they follow
+    # shift, rotate, Transform or anything else that moves the points. Tips
+    # are filled, shafts are open paths so the fill leaves them alone. All
+    # arrows share one color.
+    def __init__(self, tails, vectors, tip_length=0.15, color=YELLOW, stroke_width=2, **kwargs):
+        tails = np.array(tails, dtype=float)
+        self._initial_arrows = (tails, tails + np.array(vectors, dtype=float))
+        self.tip_length = tip_length
+        super().__init__(color=color, stroke_width=stroke_width, fill_opacity=1, **kwargs)
+
+    @classmethod
+    def from_function(cls, func, x_range=(-6, 6, 0.5), y_range=(-3.5, 3.5, 0.5), length_scale=1.0, **kwargs):
+        # `func` maps an (n, 3) array of points to vectors, or one point at a time
+        tails, vectors = sample_field(func, x_range, y_range)
+        return cls(tails, vectors * length_scale, **kwargs)
+
+    def generate_points(self):
+        self.points = arrow_points(*self._initial_arrows, self.tip_length)
+
+    init_points = generate_points
+
+    @property
+    def tails(self):
+        return self.points[TAIL_POINT::POINTS_PER_ARROW].copy()
+
+    @property
+    def heads(self):
+        return self.points[HEAD_POINT::POINTS_PER_ARROW].copy()
+
+    def set_arrows(self, tails, heads):
+        self.points = arrow_points(tails, heads, self.tip_length)
+        return self
+
+    def apply_matrix_to_arrows(self, matrix, about_point=ORIGIN):
+        # Moves tails and heads but keeps tips the same size and shape,
+        # unlike apply_matrix, which shears and scales them with the rest
+        matrix = prepare_matrix(matrix)
+        return self.set_arrows(
+            (self.tails - about_point) @ matrix.T + about_point,
+            (self.heads - about_point) @ matrix.T + about_point,
+        )
+
+
+class TransformArrowField(Animation):
+    # The ArrowField counterpart of BatchedApplyMatrix: per frame one lookup
+    # in a precomputed matrix table, two matmuls and one arrow_points call
+    def __init__(self, matrix, field, about_point=ORIGIN, path="lerp", **kwargs):
+        self.matrix = prepare_matrix(matrix)
+        self.about_point = np.array(about_point, dtype=float)
+        self.path = path if isinstance(path, MatrixPath) else MatrixPath(np.identity(3), self.matrix, mode=path)
+        super().__init__(field, **kwargs)
+
+    def create_starting_mobject(self):
+        return self.mobject
+
+    def begin(self):
+        self.start_tails = self.mobject.tails - self.about_point
+        self.start_heads = self.mobject.heads - self.about_point
+        self.table = MatrixTable(self.path, self.run_time, config.frame_rate, self.rate_func)
+        super().begin()
+
+    def interpolate_mobject(self, alpha):
+        matrix = self.table(alpha)
+        self.mobject.set_arrows(
+            self.start_tails @ matrix.T + self.about_point,
+            self.start_heads @ matrix.T + self.about_point,
+        )
+
+
+class FieldUnderTransformation(Scene):
+    # Demo of the arrow field; not part of the project's videos
+    render_all = False
+
+    def construct(self):
+        grid = FastGrid(x_range=[-7, 7, 1], y_range=[-4, 4, 1], stroke_color=GREY_C, stroke_width=1, stroke_opacity=0.5)
+        field = ArrowField.from_function(
+            lambda points: np.stack([-points[:, 1], points[:, 0], np.zeros(len(points))], axis=1),
+            x_range=(-6, 6, 0.4),
+            y_range=(-3.6, 3.6, 0.4),
+            length_scale=0.15,
+            stroke_width=1.5,
+        )
+        title = Text("A field of vectors under T", font_size=32).to_edge(UP)
+        title.add_background_rectangle()
+        self.add(grid, field, title)
+        self.wait(1)
+
+        for matrix, path in (
+            ([[1, 1], [0, 1]], "lerp"),
+            ([[0, -1], [1, 0]], "polar"),
+            ([[1, 0], [0, 0.5]], "lerp"),
+        ):
+            self.play(
+                BatchedApplyMatrix(matrix, grid, path=path),
+                TransformArrowField(matrix, field, path=path),
+                run_time=2,
+            )
+            self.wait(1)
@@ -0,0 +1,72 @@
+from manim import *
+import numpy as np
+
+from matrix_paths import MatrixPath, MatrixTable
+
+
+def prepare_matrix(matrix):
+    # Same convention as ApplyMatrix: 2x2 matrices act on the xy-plane
+    matrix = np.array(matrix, dtype=float)
+    if matrix.shape == (2, 2):
+        embedded = np.identity(3)
+        embedded[:2, :2] = matrix
+        matrix = embedded
+    elif matrix.shape != (3, 3):
+        raise ValueError("Matrix has bad dimensions")
+    return matrix
+
+
+class BatchedApplyMatrix(Animation):
+    # Drop-in for ApplyMatrix when many submobjects (cube faces, grid lines,
+    # groups of vectors) move under the same matrix.
+    #
+    # ApplyMatrix is a Transform, so every frame interpolates each submobject
+    # against its own copy. Here the points of the whole family are packed
+    # into one array once, every submobject's points become a view into an
+    # output buffer, and each frame is a single matmul into that buffer.
+    # Straight-line interpolation of points is the same as applying
+    # (1 - t) * I + t * A, so the result matches ApplyMatrix.
+    #
+    # `path` picks how the matrix moves from I to A: "lerp" (ApplyMatrix's
+    # behaviour), "polar" (rotations keep lengths and angles, see
+    # matrix_paths.py) or a ready-made MatrixPath. The matrix for every frame
+    # is computed up front in one vectorized call.
+    def __init__(self, matrix, mobject, about_point=ORIGIN, path="lerp", **kwargs):
+        self.matrix = prepare_matrix(matrix)
+        self.about_point = np.array(about_point, dtype=float)
+        if not isinstance(path, MatrixPath):
+            path = MatrixPath(np.identity(3), self.matrix, mode=path)
+        self.path = path
+        super().__init__(mobject, **kwargs)
+
+    def create_starting_mobject(self):
+        # The packed start points replace the usual full copy of the mobject
+        return self.mobject
+
+    def begin(self):
+        self.members = self.mobject.family_members_with_points()
+        sizes = [len(m.points) for m in self.members]
+        self.start_points = np.zeros((sum(sizes), 3))
+        if self.members:
+            np.concatenate([m.points for m in self.members], out=self.start_points)
+        self.start_points -= self.about_point
+        self.buffer = np.empty_like(self.start_points)
+        offset = 0
+        for member, size in zip(self.members, sizes):
+            member.points = self.buffer[offset:offset + size]
+            offset += size
+        self.table = MatrixTable(self.path, self.run_time, config.frame_rate, self.rate_func)
+        super().begin()
+
+    def interpolate_mobject(self, alpha):
+        matrix = self.table(alpha)
+        np.matmul(self.start_points, matrix.T, out=self.buffer)
+        if self.about_point.any():
+            self.buffer += self.about_point
+
+    def finish(self):
+        super().finish()
+        # Give every submobject its own array again
+        for member in self.members:
+            member.points = np.array(member.points)
+        del self.start_points, self.buffer, self.members, self.table
@@ -0,0 +1,277 @@
+import argparse
+import json
+import os
+import platform
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+from manim import *
+
+from arrow_field import ArrowField, TransformArrowField
+from batched_apply import BatchedApplyMatrix
+from fast_grid import FastGrid
+
+ROOT = Path(__file__).resolve().parent
+BASELINE = ROOT / "benchmark_baseline.json"
+
+# A case fails when it gets this much slower / bigger than its baseline
+MAX_SLOWDOWN = 1.25
+MAX_RSS_GROWTH = 1.25
+# Differences below this many seconds are noise, whatever the ratio
+MIN_SECONDS = 0.5
+
+CACHE_MODES = ("cold", "warm")
+
+
+class ManyCubesRank(ThreeDScene):
+    # RankVisualization's matrices applied to 100 cubes instead of one
+    render_all = False
+
+    def construct(self):
+        self.set_camera_orientation(phi=75 * DEGREES, theta=30 * DEGREES)
+        axes = ThreeDAxes(x_range=[-4, 4, 1], y_range=[-4, 4, 1], z_range=[-4, 4, 1])
+        cubes = VGroup(*[
+            Cube(side_length=0.4, fill_color=BLUE, fill_opacity=0.3).move_to([x, y, z])
+            for x in np.linspace(-2, 2, 5)
+            for y in np.linspace(-2, 2, 5)
+            for z in np.linspace(-1.5, 1.5, 4)
+        ])
+        self.add(axes, cubes)
+        for matrix in (
+            [[0.8, 0.1, 0.3], [0.2, 0.9, 0.1], [0.1, 0.3, 0.7]],
+            [[1, 0, 0], [0, 1, 0], [0, 0, 0]],
+            [[1, 0, 0], [0, 0, 0], [0, 0, 0]],
+        ):
+            self.play(BatchedApplyMatrix(matrix, cubes))
+            self.wait(0.5)
+
+
+class DenseNumberPlane(Scene):
+    # A 2D transformation of a plane with ten times the usual grid lines
+    render_all = False
+
+    def construct(self):
+        plane = NumberPlane(
+            x_range=[-8, 8, 0.1],
+            y_range=[-5, 5, 0.1],
+            background_line_style={"stroke_opacity": 0.4, "stroke_width": 1},
+        )
+        self.add(plane)
+        self.play(BatchedApplyMatrix([[1, 1], [0, 1]], plane))
+        self.play(BatchedApplyMatrix([[0, -1], [1, 0]], plane, path="polar"))
+        self.wait(0.5)
+
+
+class DenseFastGrid(Scene):
+    # DenseNumberPlane's transformations on a 201x201-line FastGrid
+    render_all = False
+
+    def construct(self):
+        grid = FastGrid(x_range=[-10, 10, 0.1], y_range=[-10, 10, 0.1], stroke_width=1, stroke_opacity=0.4)
+        self.add(grid)
+        self.play(BatchedApplyMatrix([[1, 1], [0, 1]], grid))
+        self.play(BatchedApplyMatrix([[0, -1], [1, 0]], grid, path="polar"))
+        self.wait(0.5)
+
+
+class DenseArrowField(Scene):
+    # A 101x101 ArrowField (10201 arrows) under the same two matrices
+    render_all = False
+
+    def construct(self):
+        field = ArrowField.from_function(
+            lambda points: np.stack([-points[:, 1], points[:, 0], np.zeros(len(points))], axis=1),
+            x_range=(-5, 5, 0.1),
+            y_range=(-5, 5, 0.1),
+            length_scale=0.05,
+            tip_length=0.03,
+            stroke_width=1,
+        )
+        self.add(field)
+        self.play(TransformArrowField([[1, 1], [0, 1]], field))
+        self.play(TransformArrowField([[0, -1], [1, 0]], field, path="polar"))
+        self.wait(0.5)
+
+
+STRESS_CASES = [
+    ("benchmark.py", "ManyCubesRank"),
+    ("benchmark.py", "DenseNumberPlane"),
+    ("benchmark.py", "DenseFastGrid"),
+    ("benchmark.py", "DenseArrowField"),
+]
+
+
+def run_case(path, scene_name, quality, media_dir):
+    # Runs inside a fresh process so timings and peak RSS belong to one scene
+    from profiling import PlayProfiler, peak_rss_mb
+    from render_all import load_module
+
+    start = time.perf_counter()
+    options = {
+        "quality": quality,
+        "media_dir": media_dir,
+        "input_file": str(path),
+        "progress_bar": "none",
+        "verbosity": "WARNING",
+        # Partial movies would turn the warm run into a copy job
+        "disable_caching": True,
+    }
+    with tempconfig(options):
+        scene = getattr(load_module(path), scene_name)()
+        profiler = PlayProfiler(scene)
+        try:
+            scene.render()
+        finally:
+            profiler.close()
+    seconds = time.perf_counter() - start
+    frames = profiler.summary()["frames"]
+    return {
+        "seconds": seconds,
+        "frames": frames,
+        "fps": frames / seconds if seconds else 0.0,
+        "peak_rss_mb": peak_rss_mb(),
+    }
+
+
+def _spawn(path, scene_name, quality, media_dir):
+    env = dict(os.environ)
+    # A cold run must not be fed by the shared TeX/text cache
+    env.pop("MANIM_SHARED_CACHE", None)
+    proc = subprocess.run(
+        [sys.executable, str(Path(__file__).resolve()), "--run-case", str(path), scene_name, "-q", quality, "--media-dir", media_dir],
+        capture_output=True, text=True, env=env, cwd=ROOT,
+    )
+    if proc.returncode != 0:
+        lines = proc.stderr.strip().splitlines()
+        return {"error": lines[-1] if lines else f"exit code {proc.returncode}"}
+    return json.loads(proc.stdout.strip().splitlines()[-1])
+
+
+def benchmark(cases, quality):
+    # Cold: empty media dir, so every TeX and text SVG is generated. Warm:
+    # same media dir again, so only the frames are rendered.
+    results = {}
+    for path, scene_name in cases:
+        with tempfile.TemporaryDirectory(prefix="bench-") as media_dir:
+            for mode in CACHE_MODES:
+                key = f"{scene_name}/{mode}"
+                results[key] = _spawn(ROOT / path, scene_name, quality, media_dir)
+                print(f"{key}: {_describe(results[key])}", flush=True)
+    return results
+
+
+def _describe(result):
+    if "error" in result:
+        return f"FAILED {result['error']}"
+    return f"{result['seconds']:.2f}s, {result['fps']:.1f} fps, {result['peak_rss_mb']:.0f} MB"
+
+
+def environment(quality):
+    import manim
+
+    return {
+        "quality": quality,
+        "manim": manim.__version__,
+        "python": platform.python_version(),
+        "machine": platform.machine(),
+        "cpus": os.cpu_count(),
+    }
+
+
+def compare(results, baseline, max_slowdown, max_rss_growth):
+    failures = []
+    rows = []
+    for key, result in results.items():
+        old = baseline.get("results", {}).get(key)
+        if "error" in result:
+            failures.append(f"{key}: {result['error']}")
+            rows.append((key, result, old, "FAILED"))
+            continue
+        if not old or "error" in old:
+            rows.append((key, result, None, "new"))
+            continue
+        status = "ok"
+        slower = result["seconds"] > old["seconds"] * max_slowdown and result["seconds"] - old["seconds"] > MIN_SECONDS
+        if slower:
+            status = "SLOWER"
+            failures.append(f"{key}: {old['seconds']:.2f}s -> {result['seconds']:.2f}s")
+        if result["peak_rss_mb"] > old["peak_rss_mb"] * max_rss_growth:
+            status = "BIGGER" if status == "ok" else status + ", BIGGER"
+            failures.append(f"{key}: {old['peak_rss_mb']:.0f} MB -> {result['peak_rss_mb']:.0f} MB")
+        rows.append((key, result, old, status))
+    return rows, failures
+
+
+def print_table(rows):
+    width = max((len(key) for key, *_ in rows), default=4)
+    print(f"\n{'case':<{width}}  {'seconds':>8}  {'base':>8}  {'fps':>6}  {'MB':>6}  {'base MB':>7}  status")
+    for key, result, old, status in rows:
+        if "error" in result:
+            print(f"{key:<{width}}  {'-':>8}  {'-':>8}  {'-':>6}  {'-':>6}  {'-':>7}  {status}")
+            continue
+        base = f"{old['seconds']:.2f}" if old else "-"
+        base_mb = f"{old['peak_rss_mb']:.0f}" if old else "-"
+        print(
+            f"{key:<{width}}  {result['seconds']:>8.2f}  {base:>8}  {result['fps']:>6.1f}  "
+            f"{result['peak_rss_mb']:>6.0f}  {base_mb:>7}  {status}"
+        )
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark scene renders against a stored baseline.")
+    parser.add_argument("scenes", nargs="*", help="scene class names or file names (default: all scenes plus stress cases)")
+    parser.add_argument("-q", "--quality", default="low_quality")
+    parser.add_argument("--baseline", default=str(BASELINE))
+    parser.add_argument("--save-baseline", action="store_true", help="store these results as the new baseline")
+    parser.add_argument("--max-slowdown", type=float, default=MAX_SLOWDOWN, help="fail when a case takes this many times its baseline")
+    parser.add_argument("--max-rss-growth", type=float, default=MAX_RSS_GROWTH, help="fail when peak RSS grows by this factor")
+    parser.add_argument("--no-stress", action="store_true", help="skip the synthetic stress cases")
+    parser.add_argument("--run-case", nargs=2, metavar=("FILE", "SCENE"), help=argparse.SUPPRESS)
+    parser.add_argument("--media-dir", help=argparse.SUPPRESS)
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    if args.run_case:
+        print(json.dumps(run_case(*args.run_case, args.quality, args.media_dir)))
+        return 0
+
+    from render_all import discover_scenes
+
+    cases = [(path.name, name) for path, name, _ in discover_scenes()]
+    if not args.no_stress:
+        cases += STRESS_CASES
+    if args.scenes:
+        wanted = set(args.scenes)
+        cases = [c for c in cases if c[1] in wanted or c[0] in wanted]
+
+    results = benchmark(cases, args.quality)
+    baseline_file = Path(args.baseline)
+    baseline = json.loads(baseline_file.read_text(encoding="utf-8")) if baseline_file.exists() else {}
+    if baseline and baseline.get("environment", {}).get("quality") != args.quality:
+        print(f"baseline was recorded at {baseline['environment'].get('quality')}, not comparing", file=sys.stderr)
+        baseline = {}
+    rows, failures = compare(results, baseline, args.max_slowdown, args.max_rss_growth)
+    print_table(rows)
+
+    if args.save_baseline:
+        # Keep the cases that were not run this time
+        merged = dict(baseline.get("results", {}))
+        merged.update((key, result) for key, result in results.items() if "error" not in result)
+        baseline_file.write_text(json.dumps(
+            {"environment": environment(args.quality), "results": merged}, indent=1
+        ), encoding="utf-8")
+        print(f"\nbaseline written to {baseline_file}")
+        return 0
+    if failures:
+        print("\nregressions:\n  " + "\n  ".join(failures))
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
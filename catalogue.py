@@ -0,0 +1,272 @@
+import argparse
+import hashlib
+import json
+import os
+import shutil
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from pathlib import Path
+
+from manim import *
+import numpy as np
+
+from batched_apply import BatchedApplyMatrix
+
+ROOT = Path(__file__).resolve().parent
+
+# Matrix entries are rounded to this many decimals before comparing, so
+# matrices that agree to about 1e-9 usually share a clip. Values on either
+# side of a rounding boundary (0.4999999999 and 0.5000000001 at the 10th
+# decimal) still round apart and get clips of their own
+DEDUP_DECIMALS = 9
+
+
+def load_catalogue(path):
+    path = Path(path)
+    text = path.read_text(encoding="utf-8")
+    if path.suffix == ".jsonl":
+        entries = [json.loads(line) for line in text.splitlines() if line.strip()]
+    else:
+        entries = json.loads(text)
+    for entry in entries:
+        matrix = np.array(entry["matrix"], dtype=float)
+        if matrix.shape not in ((2, 2), (3, 3)):
+            raise ValueError(f"{entry.get('name', entry['matrix'])}: expected a 2x2 or 3x3 matrix, got {matrix.shape}")
+    return entries
+
+
+def matrix_key(matrix):
+    matrix = np.round(np.asarray(matrix, dtype=float), DEDUP_DECIMALS) + 0.0  # fold -0.0 into 0.0
+    digest = hashlib.sha1(f"{matrix.shape}".encode() + matrix.tobytes()).hexdigest()
+    return f"m{matrix.shape[0]}_{digest[:12]}"
+
+
+def dedupe(entries):
+    # One entry per distinct matrix, the first one in the catalogue; its
+    # "aliases" are the names of every entry that maps to the same clip
+    seen = {}
+    for entry in entries:
+        key = matrix_key(entry["matrix"])
+        name = entry.get("name", key)
+        if key in seen:
+            seen[key]["aliases"].append(name)
+            continue
+        seen[key] = dict(entry, key=key, aliases=[name])
+    return list(seen.values())
+
+
+def compute_properties(entries):
+    # One batched NumPy pass per matrix size instead of a loop over entries
+    properties = {}
+    for size in (2, 3):
+        group = [e for e in entries if len(e["matrix"]) == size]
+        if not group:
+            continue
+        stack = np.array([e["matrix"] for e in group], dtype=float)
+        dets = np.linalg.det(stack)
+        ranks = np.linalg.matrix_rank(stack)
+        traces = np.trace(stack, axis1=1, axis2=2)
+        singular = np.linalg.svd(stack, compute_uv=False)
+        eigenvalues = np.linalg.eigvals(stack)
+        for i, entry in enumerate(group):
+            properties[entry["key"]] = {
+                "det": float(dets[i]),
+                "area_factor": float(abs(dets[i])),
+                "orientation_reversed": bool(dets[i] < 0),
+                "rank": int(ranks[i]),
+                "trace": float(traces[i]),
+                "singular_values": singular[i].tolist(),
+                "eigenvalues": [[float(v.real), float(v.imag)] for v in eigenvalues[i]],
+            }
+    return properties
+
+
+def parse_color(value, default=BLUE):
+    if not value:
+        return default
+    named = globals().get(str(value).upper())
+    if isinstance(named, ManimColor):
+        return named
+    return ManimColor(value)
+
+
+def format_entry(value):
+    if isinstance(value, str):
+        return value
+    value = float(value)
+    return str(int(value)) if value.is_integer() else f"{value:g}"
+
+
+def matrix_tex(matrix, name="T"):
+    rows = [" & ".join(format_entry(v) for v in row) for row in matrix]
+    return name + r" = \begin{bmatrix} " + r" \\ ".join(rows) + r" \end{bmatrix}"
+
+
+class MatrixClip2D(Scene):
+    render_all = False
+    entry = None
+    properties = None
+
+    def construct(self):
+        entry, properties = self.entry, self.properties
+        color = parse_color(entry.get("color"))
+        matrix = np.array(entry["matrix"], dtype=float)
+
+        plane = NumberPlane(
+            x_range=[-5, 5, 1],
+            y_range=[-5, 5, 1],
+            background_line_style={"stroke_opacity": 0.5}
+        )
+        vec_i = Vector([1, 0], color=RED)
+        vec_j = Vector([0, 1], color=GREEN)
+        unit_square = Polygon(ORIGIN, RIGHT, UR, UP, color=color, fill_opacity=0.3)
+        self.add(plane, unit_square, vec_i, vec_j)
+
+        label = MathTex(matrix_tex(entry["matrix"])).to_corner(UL)
+        label.add_background_rectangle()
+        self.play(Write(label))
+
+        self.play(BatchedApplyMatrix(matrix, VGroup(plane, unit_square, vec_i, vec_j)), run_time=2)
+
+        info = VGroup(
+            *([Text(entry["desc"], font_size=24)] if entry.get("desc") else []),
+            MathTex(r"\det(T) = " + f"{properties['det']:.2f}"),
+        ).arrange(DOWN).to_corner(UR)
+        info.add_background_rectangle()
+        self.play(Write(info))
+        self.wait(1)
+
+
+class MatrixClip3D(ThreeDScene):
+    render_all = False
+    entry = None
+    properties = None
+
+    def construct(self):
+        entry, properties = self.entry, self.properties
+        self.set_camera_orientation(phi=75 * DEGREES, theta=30 * DEGREES)
+
+        axes = ThreeDAxes(
+            x_range=[-4, 4, 1],
+            y_range=[-4, 4, 1],
+            z_range=[-4, 4, 1],
+            x_length=8,
+            y_length=8,
+            z_length=8
+        )
+        cube = Cube(side_length=2, fill_color=parse_color(entry.get("color")), fill_opacity=0.3)
+        self.add(axes, cube)
+
+        label = MathTex(matrix_tex(entry["matrix"])).to_corner(DL)
+        info = VGroup(
+            *([Text(entry["desc"], font_size=24)] if entry.get("desc") else []),
+            Text(f"Rank {properties['rank']}", font_size=24),
+            MathTex(r"\det(T) = " + f"{properties['det']:.2f}"),
+        ).arrange(DOWN, aligned_edge=RIGHT).to_corner(DR)
+        self.add_fixed_in_frame_mobjects(label, info)
+        self.play(Write(label), Write(info))
+
+        self.play(BatchedApplyMatrix(entry["matrix"], cube), run_time=2)
+        self.wait(1)
+
+
+def render_clip(entry, properties, settings):
+    start = time.perf_counter()
+    scene_cls = MatrixClip2D if len(entry["matrix"]) == 2 else MatrixClip3D
+    options = dict(
+        settings,
+        input_file=__file__,
+        output_file=entry["key"],
+        # Clips render in parallel; a shared partial movie directory would
+        # mix up their partial_movie_file_list.txt and let clean_cache delete
+        # segments another worker is still writing
+        partial_movie_dir="{media_dir}/videos/{module_name}/{quality}/partial_movie_files/{scene_name}/" + entry["key"],
+    )
+    with tempconfig(options):
+        scene = scene_cls()
+        scene.entry = entry
+        scene.properties = properties
+        scene.render()
+        file_writer = scene.renderer.file_writer
+        output = file_writer.movie_file_path
+        # The segments are only needed for the concat, which is done
+        partial_dir = getattr(file_writer, "partial_movie_directory", None)
+        if partial_dir:
+            shutil.rmtree(partial_dir, ignore_errors=True)
+    return {"key": entry["key"], "aliases": entry["aliases"], "output": str(output), "seconds": time.perf_counter() - start}
+
+
+def _render_job(job):
+    try:
+        return render_clip(*job)
+    except Exception as e:
+        return {"key": job[0]["key"], "aliases": job[0]["aliases"], "error": f"{type(e).__name__}: {e}"}
+
+
+def load_progress(path):
+    # Later lines win, so a retried clip overrides its earlier failure
+    done = {}
+    if path.exists():
+        for line in path.read_text(encoding="utf-8").splitlines():
+            if line.strip():
+                record = json.loads(line)
+                done[record["key"]] = record
+    return {
+        key: record
+        for key, record in done.items()
+        if "error" not in record and Path(record["output"]).exists()
+    }
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Render a clip for every matrix in a catalogue file.")
+    parser.add_argument("catalogue", nargs="?", default=str(ROOT / "catalogue.json"), help="JSON list or JSONL file of matrix entries")
+    parser.add_argument("-j", "--workers", type=int, default=min(4, os.cpu_count() or 1))
+    parser.add_argument("-q", "--quality", default="low_quality")
+    parser.add_argument("--media-dir", default=str(ROOT / "media"))
+    parser.add_argument("--progress", help="progress file (default: <catalogue>.progress.jsonl)")
+    parser.add_argument("--restart", action="store_true", help="ignore previous progress")
+    parser.add_argument("--properties-only", action="store_true", help="write the properties index without rendering")
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    catalogue = Path(args.catalogue)
+    entries = load_catalogue(catalogue)
+    unique = dedupe(entries)
+    properties = compute_properties(unique)
+    print(f"{len(entries)} entries, {len(unique)} unique matrices")
+    for entry in unique:
+        if len(entry["aliases"]) > 1:
+            print(f"merged {', '.join(entry['aliases'][1:])} into {entry['aliases'][0]} (same matrix)")
+
+    index = catalogue.with_suffix(".properties.json")
+    index.write_text(json.dumps(
+        [dict(entry, **properties[entry["key"]]) for entry in unique], indent=2
+    ), encoding="utf-8")
+    if args.properties_only:
+        return 0
+
+    progress_file = Path(args.progress) if args.progress else catalogue.with_suffix(".progress.jsonl")
+    done = {} if args.restart else load_progress(progress_file)
+    todo = [e for e in unique if e["key"] not in done]
+    print(f"{len(done)} clips already rendered, {len(todo)} to go")
+
+    settings = {"quality": args.quality, "media_dir": args.media_dir, "progress_bar": "none"}
+    failures = 0
+    with ProcessPoolExecutor(max_workers=max(1, args.workers)) as pool, progress_file.open("a", encoding="utf-8") as log:
+        futures = [pool.submit(_render_job, (e, properties[e["key"]], settings)) for e in todo]
+        for count, future in enumerate(as_completed(futures), 1):
+            result = future.result()
+            log.write(json.dumps(result) + "\n")
+            log.flush()
+            failures += "error" in result
+            status = result.get("error") or f"{result['seconds']:.1f}s"
+            print(f"[{count}/{len(todo)}] {result['key']}: {status}", flush=True)
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,8 +1,61 @@
 
+from functools import partial
+
 from manim import *
 
-class DeterminantAsArea(Scene):
-    def construct(self):
+from glyph_readout import GlyphReadout
+from layers import use_background_layer
+from mobject_pool import pooled
+from sections import ParallelSections
+
+# Define a series of transformations with increasing complexity
+TRANSFORMATIONS = [
+    {
+        "matrix": [[2, 0], [0, 1]],
+        "desc": "Scaling in x-direction: det = 2",
+        "color": BLUE_C
+    },
+    {
+        "matrix": [[1, 0], [0, 2]],
+        "desc": "Scaling in y-direction: det = 2",
+        "color": PURPLE_C
+    },
+    {
+        "matrix": [[2, 0], [0, 2]],
+        "desc": "Uniform scaling: det = 4",
+        "color": TEAL_C
+    },
+    {
+        "matrix": [[0, 1], [1, 0]],
+        "desc": "Reflection: det = -1",
+        "color": ORANGE
+    },
+    {
+        "matrix": [[1, 1], [0, 1]],
+        "desc": "Shear: det = 1",
+        "color": YELLOW_C
+    },
+    {
+        "matrix": [[2, 1], [1, 1]],
+        "desc": "General transformation: det = 1",
+        "color": MAROON_C
+    }
+]
+
+class DeterminantAsArea(ParallelSections, Scene):
+    # Each transformation is a self-contained clip, so the scene is split into
+    # sections that render_all.py --split-sections can render in parallel
+    def get_sections(self):
+        return [
+            ("intro", self.intro),
+            *[
+                (f"transformation_{index}", partial(self.show_transformation, t))
+                for index, t in enumerate(TRANSFORMATIONS)
+            ],
+            ("conclusion", self.conclusion),
+        ]
+
+    def intro(self):
         # Introduction title
         title = Text("Determinant as Area Visualization").scale(0.8)
         subtitle = Text("The determinant represents the area spanned by transformed basis vectors", font_size=24).next_to(title, DOWN)
@@ -20,22 +73,24 @@ class DeterminantAsArea(Scene):
         )
         axes_labels = axes.get_axis_labels(x_label="x", y_label="y")
         
+        # The axes never move again; draw them once into a cached layer
+        use_background_layer(self, axes, axes_labels)
         self.play(Create(axes), Create(axes_labels))
         
         # Define original basis vectors
-        vec_i = Vector([1, 0], color=RED)
-        vec_j = Vector([0, 1], color=GREEN)
+        self.vec_i = Vector([1, 0], color=RED)
+        self.vec_j = Vector([0, 1], color=GREEN)
         
         # Label the basis vectors
-        i_label = MathTex(r"\vec{i}").next_to(vec_i.get_end(), DOWN)
-        j_label = MathTex(r"\vec{j}").next_to(vec_j.get_end(), LEFT)
+        self.i_label = MathTex(r"\vec{i}").next_to(self.vec_i.get_end(), DOWN)
+        self.j_label = MathTex(r"\vec{j}").next_to(self.vec_j.get_end(), LEFT)
         
         # Draw original basis vectors
-        self.play(Create(vec_i), Create(vec_j))
-        self.play(Write(i_label), Write(j_label))
+        self.play(Create(self.vec_i), Create(self.vec_j))
+        self.play(Write(self.i_label), Write(self.j_label))
         
         # Create unit square using basis vectors
-        unit_square = Polygon(
+        self.unit_square = Polygon(
             np.array([0, 0, 0]), 
             np.array([1, 0, 0]), 
             np.array([1, 1, 0]), 
@@ -44,128 +99,92 @@ class DeterminantAsArea(Scene):
             fill_opacity=0.3
         )
         
-        self.play(Create(unit_square))
+        self.play(Create(self.unit_square))
         
-        # Add label for the area
-        area_label = MathTex(r"\text{Area} = 1").to_edge(UP)
-        det_label = MathTex(r"\det(I) = 1").next_to(area_label, DOWN)
+        # Add live readouts for the area and determinant; they follow the
+        # basis vectors every frame from here on
+        self.det_label = GlyphReadout(r"\det(T) =").track(self.current_det)
+        self.area_label = GlyphReadout(r"\text{Area} =").track(lambda: abs(self.current_det()))
+        VGroup(self.area_label, self.det_label).arrange(DOWN, aligned_edge=LEFT).to_corner(UR)
         
-        self.play(Write(area_label), Write(det_label))
+        self.play(Write(self.area_label), Write(self.det_label))
         self.wait(1)
+
+    def current_det(self):
+        i, j = self.vec_i.get_end(), self.vec_j.get_end()
+        return i[0] * j[1] - i[1] * j[0]
+
+    def show_transformation(self, t):
+        # Fade out the unit square and the current basis vector labels; the
+        # vectors themselves stay and are transformed below
+        self.play(
+            FadeOut(self.unit_square),
+            FadeOut(self.i_label),
+            FadeOut(self.j_label)
+        )
         
-        # Define a series of transformations with increasing complexity
-        transformations = [
-            {
-                "matrix": [[2, 0], [0, 1]],
-                "desc": "Scaling in x-direction: det = 2",
-                "color": BLUE_C
-            },
-            {
-                "matrix": [[1, 0], [0, 2]],
-                "desc": "Scaling in y-direction: det = 2",
-                "color": PURPLE_C
-            },
-            {
-                "matrix": [[2, 0], [0, 2]],
-                "desc": "Uniform scaling: det = 4",
-                "color": TEAL_C
-            },
-            {
-                "matrix": [[0, 1], [1, 0]],
-                "desc": "Reflection: det = -1",
-                "color": ORANGE
-            },
-            {
-                "matrix": [[1, 1], [0, 1]],
-                "desc": "Shear: det = 1",
-                "color": YELLOW_C
-            },
-            {
-                "matrix": [[2, 1], [1, 1]],
-                "desc": "General transformation: det = 1",
-                "color": MAROON_C
-            }
-        ]
+        # Calculate the transformed basis vectors
+        matrix = np.array(t["matrix"])
+        new_i = matrix[:, 0]  # First column
+        new_j = matrix[:, 1]  # Second column
+        det_value = np.linalg.det(matrix)
+        
+        # Create transformed basis vectors
+        transformed_i = pooled(Vector, new_i, color=RED)
+        transformed_j = pooled(Vector, new_j, color=GREEN)
+        
+        # Label the transformed basis vectors
+        self.i_label = pooled(MathTex, r"T(\vec{i})").next_to(transformed_i.get_end(), DOWN)
+        self.j_label = pooled(MathTex, r"T(\vec{j})").next_to(transformed_j.get_end(), LEFT)
         
-        for t in transformations:
-            # Clear previous transformed vectors and parallelogram
-            self.play(
-                FadeOut(area_label),
-                FadeOut(det_label),
-                FadeOut(unit_square),
-                FadeOut(i_label),
-                FadeOut(j_label)
-            )
-            
-            # Calculate the transformed basis vectors
-            matrix = np.array(t["matrix"])
-            new_i = matrix[:, 0]  # First column
-            new_j = matrix[:, 1]  # Second column
-            det_value = np.linalg.det(matrix)
-            
-            # Create transformed basis vectors
-            transformed_i = Vector(new_i, color=RED)
-            transformed_j = Vector(new_j, color=GREEN)
-            
-            # Label the transformed basis vectors
-            i_label = MathTex(r"T(\vec{i})").next_to(transformed_i.get_end(), DOWN)
-            j_label = MathTex(r"T(\vec{j})").next_to(transformed_j.get_end(), LEFT)
-            
-            # Create parallelogram representing transformed unit square
-            # Ensure all vertices are proper 3D arrays for Manim
-            parallelogram = Polygon(
-                np.array([0, 0, 0]), 
-                np.array([new_i[0], new_i[1], 0]), 
-                np.array([new_i[0] + new_j[0], new_i[1] + new_j[1], 0]), 
-                np.array([new_j[0], new_j[1], 0]),
-                color=t["color"],
-                fill_opacity=0.3
-            )
-            
-            # Display matrix
-            matrix_tex = MathTex(
-                r"T = \begin{bmatrix} " + 
-                f"{t['matrix'][0][0]} & {t['matrix'][0][1]} \\\\ " +
-                f"{t['matrix'][1][0]} & {t['matrix'][1][1]}" +
-                r"\end{bmatrix}"
-            ).to_corner(UL)
-            
-            # Display description
-            desc_text = Text(t["desc"], font_size=24).to_edge(UP)
-            
-            # Display area
-            area_label = MathTex(r"\text{Area} = " + f"{abs(det_value):.2f}").next_to(desc_text, DOWN)
-            det_label = MathTex(r"\det(T) = " + f"{det_value:.2f}").next_to(area_label, DOWN)
-            
-            # Animate the transformation
-            self.play(
-                Transform(vec_i, transformed_i),
-                Transform(vec_j, transformed_j),
-                Write(matrix_tex)
-            )
-            self.play(
-                Write(i_label),
-                Write(j_label),
-                Create(parallelogram)
-            )
-            self.play(
-                Write(desc_text),
-                Write(area_label),
-                Write(det_label)
-            )
-            
-            # If determinant is negative, indicate orientation change
-            if det_value < 0:
-                orientation_text = Text("Orientation Reversed", color=RED, font_size=24).to_edge(DOWN)
-                self.play(Write(orientation_text))
-                self.wait(1)
-                self.play(FadeOut(orientation_text))
-            else:
-                self.wait(1)
-            
-            # Clean up for next transformation
-            self.play(FadeOut(matrix_tex), FadeOut(desc_text))
+        # Create the parallelogram the unit square maps to
+        # Ensure all vertices are proper 3D arrays for Manim
+        self.parallelogram = Polygon(
+            np.array([0, 0, 0]), 
+            np.array([new_i[0], new_i[1], 0]), 
+            np.array([new_i[0] + new_j[0], new_i[1] + new_j[1], 0]), 
+            np.array([new_j[0], new_j[1], 0]),
+            color=t["color"],
+            fill_opacity=0.3
+        )
+        
+        # Display matrix
+        matrix_tex = MathTex(
+            r"T = \begin{bmatrix} " + 
+            f"{t['matrix'][0][0]} & {t['matrix'][0][1]} \\\\ " +
+            f"{t['matrix'][1][0]} & {t['matrix'][1][1]}" +
+            r"\end{bmatrix}"
+        ).to_corner(UL)
+        
+        # Display description
+        desc_text = Text(t["desc"], font_size=24).to_edge(UP)
+        
+        # Animate the transformation
+        self.play(
+            Transform(self.vec_i, transformed_i),
+            Transform(self.vec_j, transformed_j),
+            Write(matrix_tex)
+        )
+        self.play(
+            Write(self.i_label),
+            Write(self.j_label),
+            Create(self.parallelogram)
+        )
+        self.play(Write(desc_text))
+        
+        # If determinant is negative, indicate orientation change
+        if det_value < 0:
+            orientation_text = pooled(Text, "Orientation Reversed", color=RED, font_size=24).to_edge(DOWN)
+            self.play(Write(orientation_text))
+            self.wait(1)
+            self.play(FadeOut(orientation_text))
+        else:
+            self.wait(1)
         
+        # Clean up for next transformation
+        self.play(FadeOut(matrix_tex), FadeOut(desc_text))
+
+    def conclusion(self):
         # Final explanation
         conclusion = VGroup(
             Text("The determinant of a transformation matrix:", font_size=30),
@@ -177,11 +196,11 @@ class DeterminantAsArea(Scene):
         ).arrange(DOWN, aligned_edge=LEFT).to_edge(DOWN).shift(UP)
         
         self.play(
-            FadeOut(parallelogram),
-            FadeOut(area_label),
-            FadeOut(det_label),
-            FadeOut(i_label),
-            FadeOut(j_label)
+            FadeOut(self.parallelogram),
+            FadeOut(self.area_label),
+            FadeOut(self.det_label),
+            FadeOut(self.i_label),
+            FadeOut(self.j_label)
         )
         self.play(Write(conclusion), run_time=2)
         self.wait(2)
\ No newline at end of file
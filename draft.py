@@ -0,0 +1,158 @@
+import re
+import sys
+from contextlib import contextmanager
+from pathlib import Path
+
+from manim import BLUE, DEFAULT_FONT_SIZE, LEFT, RIGHT, WHITE, Cube, Matrix, Rectangle, Scene, VGroup
+
+from manifest import local_imports
+from mobject_pool import POOL
+
+# A throwaway render for checking layout and timing of a scene: small frames,
+# few of them, wireframe cubes without depth sorting, boxes instead of text
+# and short waits. Drafts land in their own "<height>p<fps>" video folder,
+# next to the real renders.
+
+DRAFT_SETTINGS = {
+    "pixel_width": 640,
+    "pixel_height": 360,
+    "frame_rate": 10,
+}
+
+# Longest wait() a draft sits through
+DRAFT_WAIT = 0.2
+
+# Rough size of one character / line at DEFAULT_FONT_SIZE, in scene units
+CHAR_WIDTH = 0.27
+LINE_HEIGHT = 0.45
+# Part of its character cell a placeholder box covers
+CHAR_FILL = 0.8
+
+BRACKET_WIDTH = 0.1
+
+PLACEHOLDER_STROKE_WIDTH = 1
+CUBE_STROKE_WIDTH = 2
+
+TEX_COMMAND = re.compile(r"\\[a-zA-Z]+|[{}^_&$]")
+
+
+def draft_settings(settings):
+    # `quality` would override the pixel size, so the draft replaces it
+    settings = {k: v for k, v in settings.items() if k != "quality"}
+    settings.update(DRAFT_SETTINGS)
+    return settings
+
+
+def _character_boxes(lines, font_size, color):
+    # One box per visible character, laid out like the text, so the stand-in
+    # has a submobject wherever Text and MathTex have a glyph (text[0], ...)
+    scale = font_size / DEFAULT_FONT_SIZE
+    box = Rectangle(
+        width=CHAR_WIDTH * scale * CHAR_FILL,
+        height=LINE_HEIGHT * scale * CHAR_FILL,
+        color=color,
+        stroke_width=PLACEHOLDER_STROKE_WIDTH,
+    )
+    boxes = VGroup()
+    for row, line in enumerate(lines):
+        for column, char in enumerate(line.strip()):
+            if not char.isspace():
+                boxes.add(box.copy().move_to([column * CHAR_WIDTH * scale, -row * LINE_HEIGHT * scale, 0]))
+    return boxes.center()
+
+
+def draft_text(text, font_size=DEFAULT_FONT_SIZE, color=WHITE, **kwargs):
+    return POOL.get(_character_boxes, tuple(text.split("\n")), font_size, color)
+
+
+def draft_tex(*tex_strings, font_size=DEFAULT_FONT_SIZE, color=WHITE, **kwargs):
+    # One group of boxes per string, like MathTex's parts. Matrix rows are
+    # separated by \\, everything else is one line
+    parts = VGroup(*(
+        POOL.get(_character_boxes, tuple(TEX_COMMAND.sub("", row) for row in str(tex).split(r"\\")), font_size, color)
+        for tex in tex_strings
+    ))
+    return parts.arrange(RIGHT, buff=CHAR_WIDTH * font_size / DEFAULT_FONT_SIZE * (1 - CHAR_FILL))
+
+
+class DraftMatrix(Matrix):
+    # Boxes for the entries and plain bars for the brackets, which Matrix
+    # would otherwise typeset with MathTex
+    def __init__(self, matrix, **kwargs):
+        kwargs["element_to_mobject"] = draft_tex
+        super().__init__(matrix, **kwargs)
+
+    def _add_brackets(self, left="[", right="]", **kwargs):
+        height = self.height + 2 * self.bracket_v_buff
+        bracket = POOL.get(Rectangle, width=BRACKET_WIDTH, height=height, color=WHITE, stroke_width=PLACEHOLDER_STROKE_WIDTH)
+        l_bracket, r_bracket = bracket, bracket.copy()
+        l_bracket.next_to(self, LEFT, self.bracket_h_buff)
+        r_bracket.next_to(self, RIGHT, self.bracket_h_buff)
+        self.brackets = VGroup(l_bracket, r_bracket)
+        self.add(l_bracket, r_bracket)
+        return self
+
+
+class DraftCube(Cube):
+    # Outline only: no fill to blend and, without shade_in_3d, nothing for
+    # the 3D camera to shade or depth sort
+    def __init__(self, side_length=2, fill_opacity=0.75, fill_color=BLUE, **kwargs):
+        kwargs.pop("stroke_width", None)
+        kwargs.setdefault("stroke_color", fill_color)
+        super().__init__(
+            side_length=side_length,
+            fill_opacity=0,
+            fill_color=fill_color,
+            stroke_width=CUBE_STROKE_WIDTH,
+            **kwargs,
+        )
+        for face in self:
+            face.shade_in_3d = False
+
+
+DRAFT_NAMES = {
+    "Text": draft_text,
+    "MarkupText": draft_text,
+    "MathTex": draft_tex,
+    "Tex": draft_tex,
+    "Cube": DraftCube,
+    "Matrix": DraftMatrix,
+}
+
+
+def _patched_modules(module):
+    # The scene module and every project module it imports (e.g.
+    # glyph_readout), which look up `from manim import *` names in their own
+    # namespaces
+    modules = [module]
+    for path in local_imports(module.__file__, Path(module.__file__).parent):
+        helper = sys.modules.get(path.stem)
+        if helper is not None and getattr(helper, "__file__", None) and Path(helper.__file__).resolve() == path:
+            modules.append(helper)
+    return modules
+
+
+@contextmanager
+def drafting(module):
+    # Swap the stand-ins into the scene's and its helpers' namespaces and
+    # shorten every wait()
+    saved = [
+        (patched, name, patched.__dict__[name])
+        for patched in _patched_modules(module)
+        for name in DRAFT_NAMES
+        if name in patched.__dict__
+    ]
+    for patched, name, _ in saved:
+        patched.__dict__[name] = DRAFT_NAMES[name]
+    original_wait = Scene.wait
+
+    def wait(self, duration=DRAFT_WAIT, *args, **kwargs):
+        return original_wait(self, min(duration, DRAFT_WAIT), *args, **kwargs)
+
+    Scene.wait = wait
+    try:
+        yield
+    finally:
+        Scene.wait = original_wait
+        for patched, name, original in saved:
+            patched.__dict__[name] = original
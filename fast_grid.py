@@ -0,0 +1,63 @@
+from manim import *
+import numpy as np
+
+
+def grid_segments(x_range, y_range, segments_per_line=1):
+    # Start and end point of every piece of every grid line, vertical lines
+    # first: two (n, 3) arrays
+    x_min, x_max, x_step = x_range
+    y_min, y_max, y_step = y_range
+    xs = np.arange(x_min, x_max + x_step / 2, x_step)
+    ys = np.arange(y_min, y_max + y_step / 2, y_step)
+    cuts = np.linspace(0, 1, segments_per_line + 1)
+    lows, highs = cuts[:-1], cuts[1:]
+
+    def lines(fixed, low, high, axis):
+        # One row per (line, piece); `axis` is the coordinate that varies
+        start = np.zeros((len(fixed), segments_per_line, 3))
+        end = np.zeros_like(start)
+        start[..., 1 - axis] = fixed[:, None]
+        end[..., 1 - axis] = fixed[:, None]
+        start[..., axis] = low + (high - low) * lows
+        end[..., axis] = low + (high - low) * highs
+        return start.reshape(-1, 3), end.reshape(-1, 3)
+
+    vertical = lines(xs, y_min, y_max, axis=1)
+    horizontal = lines(ys, x_min, x_max, axis=0)
+    return np.concatenate([vertical[0], horizontal[0]]), np.concatenate([vertical[1], horizontal[1]])
+
+
+class FastGrid(VMobject):
+    # A grid drawn as a single VMobject. NumberPlane makes one Line mobject
+    # per grid line, so building, transforming and drawing it costs Python
+    # work per line; here every line is a straight cubic (handles at 1/3 and
+    # 2/3) in one point array, so apply_matrix and BatchedApplyMatrix move the
+    # whole grid with one matmul and the camera strokes it as one path.
+    #
+    # Lines are split into `segments_per_line` pieces so that non-linear
+    # apply_function calls can bend them; linear maps only need one.
+    def __init__(
+        self,
+        x_range=(-7, 7, 1),
+        y_range=(-4, 4, 1),
+        segments_per_line=1,
+        stroke_color=BLUE_D,
+        stroke_width=2,
+        stroke_opacity=1,
+        **kwargs,
+    ):
+        self.x_range = tuple(x_range)
+        self.y_range = tuple(y_range)
+        self.segments_per_line = segments_per_line
+        super().__init__(stroke_color=stroke_color, stroke_width=stroke_width, stroke_opacity=stroke_opacity, **kwargs)
+
+    def generate_points(self):
+        start, end = grid_segments(self.x_range, self.y_range, self.segments_per_line)
+        points = np.empty((len(start), 4, 3))
+        points[:, 0] = start
+        points[:, 1] = start + (end - start) / 3
+        points[:, 2] = start + 2 * (end - start) / 3
+        points[:, 3] = end
+        self.points = points.reshape(-1, 3)
+
+    init_points = generate_points
@@ -0,0 +1,102 @@
+from manim import *
+import numpy as np
+
+from mobject_pool import pooled
+
+# Every glyph a formatted number can contain, compiled together in one
+# MathTex so they share a baseline and TeX's digit spacing
+GLYPHS = "0123456789.-"
+
+# Length of the invisible anchor segment that records where the number
+# starts and how much the readout has been scaled
+ANCHOR_LENGTH = 0.01
+
+
+class GlyphAtlas:
+    # Digit, point and minus glyphs cut out of one compiled MathTex, stored as
+    # point arrays relative to the number's origin (left edge of "0", bottom
+    # of "1"). Composing a number is a concatenation of shifted arrays.
+    def __init__(self, digits):
+        glyphs = digits.submobjects
+        if len(glyphs) != len(GLYPHS):
+            if not config.dry_run:
+                raise ValueError(f"expected {len(GLYPHS)} glyphs in {GLYPHS!r}, got {len(glyphs)}")
+            # Placeholder SVGs (tex_batch.collect_tex) have at most one glyph
+            # per string; nothing is drawn in a dry run, so any shape will do
+            glyphs = (glyphs or [digits]) * len(GLYPHS)
+        self.origin = np.array([glyphs[0].get_left()[0], glyphs[1].get_bottom()[1], 0.0])
+        digit_advance = (glyphs[9].get_left()[0] - glyphs[0].get_left()[0]) / 9
+        gap = max(digit_advance - glyphs[0].width, 0.0)
+        self.points = {}
+        self.advance = {}
+        for char, glyph in zip(GLYPHS, glyphs):
+            left = np.array([glyph.get_left()[0], self.origin[1], 0.0])
+            self.points[char] = glyph.points - left
+            self.advance[char] = digit_advance if char.isdigit() else glyph.width + gap
+        self.style = glyphs[0]
+
+    def compose(self, text):
+        # Points of `text` laid out from x = 0 on the baseline y = 0
+        pieces = []
+        x = 0.0
+        for char in text:
+            pieces.append(self.points[char] + [x, 0.0, 0.0])
+            x += self.advance[char]
+        return np.concatenate(pieces) if pieces else np.zeros((0, 3))
+
+
+class GlyphReadout(VMobject):
+    # A label like "Area = 1.73" whose number can change every frame. The
+    # label and the glyphs are compiled once (through the mobject pool, so
+    # every readout with the same label shares the work); set_value only
+    # rearranges cached glyph points, with no LaTeX or Pango call.
+    #
+    # The number follows an invisible anchor segment, so shift, scale and
+    # next_to work as usual; rotating a readout is not supported.
+    def __init__(self, label="", value=0, num_decimal_places=2, font_size=DEFAULT_FONT_SIZE, **kwargs):
+        super().__init__(**kwargs)
+        self.num_decimal_places = num_decimal_places
+        if label:
+            reference = pooled(MathTex, label, GLYPHS, font_size=font_size)
+            self.label, digits = reference.submobjects
+        else:
+            digits = pooled(MathTex, GLYPHS, font_size=font_size).submobjects[0]
+            self.label = VMobject()
+        self.atlas = GlyphAtlas(digits)
+
+        self.number = VMobject()
+        self.number.match_style(self.atlas.style)
+        self.anchor = VMobject(stroke_opacity=0, fill_opacity=0)
+        origin = self.atlas.origin
+        self.anchor.set_points_as_corners([origin, origin + ANCHOR_LENGTH * RIGHT])
+        self.add(self.label, self.number, self.anchor)
+
+        self.text = None
+        self.value = None
+        self.set_value(value)
+
+    def format(self, value):
+        text = f"{value:.{self.num_decimal_places}f}"
+        # No "-0.00"
+        if text.startswith("-") and not text.strip("-0."):
+            text = text[1:]
+        return text
+
+    def set_value(self, value):
+        self.value = value
+        text = self.format(value)
+        if text != self.text:
+            self.text = text
+            start, end = self.anchor.points[0], self.anchor.points[-1]
+            scale = np.linalg.norm(end - start) / ANCHOR_LENGTH
+            self.number.points = start + scale * self.atlas.compose(text)
+        return self
+
+    def get_value(self):
+        return self.value
+
+    def track(self, source):
+        # Follow a ValueTracker, or any zero-argument callable, every frame
+        get_value = source.get_value if isinstance(source, ValueTracker) else source
+        self.add_updater(lambda readout: readout.set_value(get_value()))
+        return self.set_value(get_value())
@@ -0,0 +1,78 @@
+import numpy as np
+
+from layers import FrameLayer
+
+# Titles, matrices and bullet lists added with add_fixed_in_frame_mobjects
+# are screen-space, but ThreeDCamera still runs them through its 3D pipeline
+# every frame they're not part of manim's per-play static image, which is
+# any frame after something listed before them moved.
+#
+# HudOverlay hides the fixed-in-frame mobjects from the camera and draws them
+# instead into a transparent overlay image of their own, which is
+# alpha-composited onto every finished frame. Only the pixels the overlay
+# covers are touched. The overlay is keyed on the points and colors of the
+# fixed-in-frame mobjects in the scene, so it is drawn again only on frames
+# where one of them changes (a Write or FadeOut in progress) or they are
+# added or removed. The HUD is always on top of the 3D content. It is a
+# layers.FrameLayer, so it shares the background layer's hooks into the
+# camera and renderer and its cheap per-play change checks.
+#
+# Cairo draws premultiplied colors, so compositing the overlay on a frame is
+# frame = overlay + frame * (1 - alpha) in every channel.
+
+
+class HudOverlay(FrameLayer):
+    def __init__(self, scene):
+        super().__init__(scene)
+        self.redraws = 0
+        # One scratch buffer for the lifetime of the overlay: cairo contexts
+        # are cached per pixel array
+        self.scratch = np.zeros_like(self.camera.pixel_array)
+        self.index = None
+
+    def members(self):
+        # Fixed-in-frame mobjects in the scene, in drawing order
+        fixed = self.camera.fixed_in_frame_mobjects
+        return [m for m in self.scene.get_mobject_family_members() if m in fixed]
+
+    def refresh(self):
+        # The overlay goes on top of finished frames, so the renderer's
+        # static image never needs redrawing for it
+        members = self.members()
+        if not self.changed(members):
+            return False
+        self.hidden = {id(m) for m in members}
+        if not members:
+            self.index = None
+            return False
+        self.redraws += 1
+        camera = self.camera
+        frame, camera.pixel_array = camera.pixel_array, self.scratch
+        try:
+            self.scratch[:] = 0
+            self.hooks.draw(members)
+        finally:
+            camera.pixel_array = frame
+        ys, xs = np.nonzero(self.scratch[:, :, 3])
+        self.index = (ys, xs)
+        self.pixels = self.scratch[ys, xs].astype(np.uint16)
+        self.inverse_alpha = 255 - self.pixels[:, 3:]
+        return False
+
+    def composite(self, frame):
+        if self.index is None:
+            return
+        below = frame[self.index].astype(np.uint16)
+        frame[self.index] = self.pixels + (below * self.inverse_alpha + 127) // 255
+
+    def close(self):
+        super().close()
+        self.index = None
+
+
+def use_hud_overlay(scene):
+    # One overlay per scene; call at the start of construct()
+    overlay = getattr(scene, "hud_overlay", None)
+    if overlay is None:
+        overlay = scene.hud_overlay = HudOverlay(scene)
+    return overlay
@@ -0,0 +1,120 @@
+import json
+import linecache
+import sys
+from collections import Counter
+from pathlib import Path
+
+# A report on manim's partial movie cache, not an incremental renderer of its
+# own. manim keys every play() by "<camera>_<animations>_<mobjects>" hashes and
+# reuses the partial movie of any hash it has already rendered; the scene's
+# construct() still runs in full, and a call whose hash shifts is rendered
+# again even if the edit was elsewhere. This module ties those hashes to the
+# play()/wait() call sites in the scene source so a render can report what
+# was reused and why anything was rebuilt.
+
+STATE_FILE = "incremental.json"
+
+HASH_PARTS = ("camera", "animation arguments", "scene state")
+
+# Keep enough partial movies around that edits don't evict reusable ones
+MAX_FILES_CACHED = 1000
+
+
+def call_site(scene_file):
+    frame = sys._getframe(2)
+    while frame is not None:
+        if Path(frame.f_code.co_filename).resolve() == scene_file:
+            lineno = frame.f_lineno
+            return lineno, linecache.getline(str(scene_file), lineno).strip()
+        frame = frame.f_back
+    return None, ""
+
+
+class IncrementalTracker:
+    def __init__(self, scene):
+        self.scene = scene
+        self.scene_file = Path(sys.modules[type(scene).__module__].__file__).resolve()
+        self.records = []
+        self._occurrences = Counter()
+
+        renderer = scene.renderer
+        play = renderer.play
+
+        def tracked_play(scene, *args, **kwargs):
+            lineno, source = call_site(self.scene_file)
+            play(scene, *args, **kwargs)
+            self.record(lineno, source)
+
+        renderer.play = tracked_play
+
+    def record(self, lineno, source):
+        renderer = self.scene.renderer
+        animation_hash = renderer.animations_hashes[-1]
+        # The same line can run many times (loops, helper methods), so the
+        # n-th execution of a line is what identifies a call across edits
+        self._occurrences[source] += 1
+        if animation_hash is None:
+            status = "skipped"
+        elif renderer.skip_animations:
+            status = "reused"
+        else:
+            status = "rebuilt"
+        self.records.append({
+            "index": len(self.records),
+            "line": lineno,
+            "source": source,
+            "occurrence": self._occurrences[source],
+            "animations": [type(a).__name__ for a in self.scene.animations or []],
+            "hash": animation_hash,
+            "status": status,
+        })
+
+    def state_file(self):
+        file_writer = self.scene.renderer.file_writer
+        directory = getattr(file_writer, "partial_movie_directory", None)
+        return Path(directory) / STATE_FILE if directory else None
+
+    def explain(self, previous):
+        # Attach a reason to every rebuilt segment by comparing with the
+        # previous render of the same call site
+        by_site = {(r["source"], r["occurrence"]): r for r in previous}
+        for record in self.records:
+            if record["status"] != "rebuilt":
+                continue
+            old = by_site.get((record["source"], record["occurrence"]))
+            if old is None or not old.get("hash"):
+                record["reason"] = "new or edited call"
+                continue
+            changed = [
+                part
+                for part, new, before in zip(HASH_PARTS, record["hash"].split("_"), old["hash"].split("_"))
+                if new != before
+            ]
+            record["reason"] = ", ".join(changed) + " changed" if changed else "cached file missing"
+
+    def finish(self):
+        state_file = self.state_file()
+        previous = []
+        if state_file and state_file.exists():
+            previous = json.loads(state_file.read_text(encoding="utf-8"))
+        self.explain(previous)
+        if state_file:
+            state_file.write_text(json.dumps(self.records, indent=1), encoding="utf-8")
+        return self.records
+
+    def report(self):
+        counts = Counter(r["status"] for r in self.records)
+        lines = [
+            f"{type(self.scene).__name__}: {counts['reused']} reused, "
+            f"{counts['rebuilt']} rebuilt, {counts['skipped']} skipped"
+        ]
+        for r in self.records:
+            if r["status"] == "reused":
+                continue
+            reason = f"  ({r['reason']})" if r.get("reason") else ""
+            lines.append(f"  {r['status']:>7} #{r['index']:<3} line {r['line']}: {r['source']}{reason}")
+        return "\n".join(lines)
+
+
+def track(scene):
+    return IncrementalTracker(scene)
@@ -0,0 +1,232 @@
+import argparse
+import hashlib
+import json
+import re
+import sys
+from pathlib import Path
+
+import numpy as np
+from manim import Arrow, MarkupText, SingleStringMathTex, Text, ThreeDScene, Transform, config, tempconfig
+
+from batched_apply import BatchedApplyMatrix
+
+ROOT = Path(__file__).resolve().parent
+
+# Replays a scene without rendering a single frame and records its state
+# after every play()/wait(): the 2D geometry of every visible path (cubic
+# Bézier control points, the way manim stores them), text and TeX as plain
+# labels, and the matrices of BatchedApplyMatrix animations. Geometry goes
+# into one float32 file and is stored once no matter how many keyframes
+# share it; everything else is a small JSON index. index.html can load the
+# pair and replay the scene on its canvas.
+#
+# Scenes that move shapes with Transform or ApplyMatrix get a matrix too when
+# there is one: the Transforms of a play are fitted together with a single
+# 2D matrix about the origin, which is recorded if it takes every start point
+# to its target. Arrows only count their start and end, since their tips keep
+# their size, so the basis vectors of determinants.py fit as well.
+
+TEX_COMMAND = re.compile(r"\\[a-zA-Z]+|[{}^_$]")
+
+# How far (relative to the size of the geometry) a fitted matrix may miss a
+# Transform's target points
+FIT_TOLERANCE = 1e-6
+
+
+def plain_tex(tex):
+    text = TEX_COMMAND.sub("", tex.replace(r"\\", " ; ").replace("&", " "))
+    return " ".join(text.split())
+
+
+def _hex(color):
+    return color.to_hex() if color is not None else None
+
+
+def _point_pairs(start, target):
+    # Matching points of a Transform's start and aligned target
+    if isinstance(start, Arrow) and isinstance(target, Arrow):
+        return [start.get_start(), start.get_end()], [target.get_start(), target.get_end()]
+    sources, images = list(start.points), list(target.points)
+    for start_member, target_member in zip(start.submobjects, target.submobjects):
+        more_sources, more_images = _point_pairs(start_member, target_member)
+        sources += more_sources
+        images += more_images
+    return sources, images
+
+
+def transform_matrix(transforms):
+    # The 3x3 matrix (acting on x and y) that takes every one of a play's
+    # finished Transforms from its start to its target; None if there is no
+    # such matrix or it is the identity
+    sources, images = [], []
+    for transform in transforms:
+        more_sources, more_images = _point_pairs(transform.starting_mobject, transform.target_copy)
+        if len(more_sources) != len(more_images):
+            return None
+        sources += more_sources
+        images += more_images
+    if not sources:
+        return None
+    sources = np.array(sources)[:, :2]
+    images = np.array(images)[:, :2]
+    if np.linalg.matrix_rank(sources) < 2:
+        return None
+    solution = np.linalg.lstsq(sources, images, rcond=None)[0]
+    scale = max(1.0, np.abs(images).max())
+    if np.abs(sources @ solution - images).max() > FIT_TOLERANCE * scale:
+        return None
+    matrix = np.identity(3)
+    matrix[:2, :2] = solution.T
+    return None if np.allclose(matrix, np.identity(3)) else matrix
+
+
+class KeyframeRecorder:
+    def __init__(self, scene):
+        self.scene = scene
+        self.keyframes = []
+        self.chunks = []
+        self.offsets = {}
+        self.size = 0
+        # Strong references keep id() values from being reused by new
+        # mobjects, so an object id means the same object for the whole scene
+        self.ids = {}
+
+        renderer = scene.renderer
+        play = renderer.play
+
+        def recording_play(scene, *args, **kwargs):
+            if not self.keyframes:
+                self.snapshot(0.0, 0.0, [])
+            start = renderer.time
+            play(scene, *args, **kwargs)
+            self.snapshot(start, renderer.time - start, scene.animations or [])
+
+        renderer.play = recording_play
+
+    def object_id(self, mobject):
+        entry = self.ids.get(id(mobject))
+        if entry is None:
+            entry = self.ids[id(mobject)] = (len(self.ids), mobject)
+        return entry[0]
+
+    def store(self, points):
+        # float32 xy pairs, deduplicated by content
+        data = np.ascontiguousarray(points[:, :2], dtype=np.float32).tobytes()
+        digest = hashlib.sha1(data).digest()
+        if digest not in self.offsets:
+            self.offsets[digest] = self.size
+            self.chunks.append(data)
+            self.size += len(data) // 4
+        return self.offsets[digest]
+
+    def describe(self, mobject, objects):
+        if isinstance(mobject, (Text, MarkupText)):
+            text = mobject.text
+        elif isinstance(mobject, SingleStringMathTex):
+            text = plain_tex(mobject.tex_string)
+        else:
+            text = None
+        if text is not None:
+            x, y, _ = mobject.get_center()
+            objects.append({
+                "id": self.object_id(mobject),
+                "kind": "label",
+                "text": text,
+                "x": round(float(x), 4),
+                "y": round(float(y), 4),
+                "height": round(float(mobject.height), 4),
+                "color": _hex(mobject.get_color()),
+            })
+            return
+        if len(mobject.points) and (mobject.get_stroke_opacity() > 0 or mobject.get_fill_opacity() > 0):
+            objects.append({
+                "id": self.object_id(mobject),
+                "kind": "path",
+                "offset": self.store(mobject.points),
+                "count": len(mobject.points),
+                "stroke": _hex(mobject.get_stroke_color()),
+                "stroke_width": round(float(mobject.get_stroke_width()), 3),
+                "stroke_opacity": round(float(mobject.get_stroke_opacity()), 3),
+                "fill": _hex(mobject.get_fill_color()),
+                "fill_opacity": round(float(mobject.get_fill_opacity()), 3),
+            })
+        for submobject in mobject.submobjects:
+            self.describe(submobject, objects)
+
+    def snapshot(self, start, duration, animations):
+        objects = []
+        for mobject in self.scene.mobjects:
+            self.describe(mobject, objects)
+        matrices = [
+            {
+                "matrix": np.round(a.matrix, 6).tolist(),
+                "path": a.path.mode,
+                "about": np.round(a.about_point[:2], 6).tolist(),
+                "ids": [self.object_id(m) for m in a.mobject.family_members_with_points()],
+            }
+            for a in animations
+            if isinstance(a, BatchedApplyMatrix)
+        ]
+        transforms = [a for a in animations if isinstance(a, Transform) and a.path_arc == 0]
+        matrix = transform_matrix(transforms)
+        if matrix is not None:
+            # Transform interpolates points in a straight line, i.e. along
+            # the lerp path from the identity
+            matrices.append({
+                "matrix": np.round(matrix, 6).tolist(),
+                "path": "lerp",
+                "about": [0.0, 0.0],
+                "ids": [self.object_id(m) for a in transforms for m in a.mobject.family_members_with_points()],
+            })
+        self.keyframes.append({
+            "t": round(start, 4),
+            "duration": round(duration, 4),
+            "animations": [type(a).__name__ for a in animations],
+            "matrices": matrices,
+            "objects": objects,
+        })
+
+    def write(self, directory, name):
+        directory.mkdir(parents=True, exist_ok=True)
+        bin_file = directory / f"{name}.keyframes.bin"
+        bin_file.write_bytes(b"".join(self.chunks))
+        index = {
+            "scene": name,
+            "binary": bin_file.name,
+            "frame": {"width": config.frame_width, "height": config.frame_height},
+            "duration": round(self.scene.renderer.time, 4),
+            "floats": self.size,
+            "keyframes": self.keyframes,
+        }
+        json_file = directory / f"{name}.keyframes.json"
+        json_file.write_text(json.dumps(index, separators=(",", ":")), encoding="utf-8")
+        return json_file, bin_file
+
+
+def export(path, scene_name, directory):
+    from render_all import load_module
+
+    with tempconfig({"dry_run": True, "input_file": str(path)}):
+        scene_cls = getattr(load_module(path), scene_name)
+        if issubclass(scene_cls, ThreeDScene):
+            print(f"{scene_name} is a 3D scene; only x and y are exported", file=sys.stderr)
+        scene = scene_cls(skip_animations=True)
+        recorder = KeyframeRecorder(scene)
+        scene.render()
+        return recorder.write(Path(directory), scene_name)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Export a scene's geometry as keyframes for index.html.")
+    parser.add_argument("file", help="scene file, e.g. determinants.py")
+    parser.add_argument("scene", help="scene class name")
+    parser.add_argument("-o", "--output", default=str(ROOT / "keyframes"), help="output directory")
+    args = parser.parse_args(argv)
+
+    json_file, bin_file = export(Path(args.file).resolve(), args.scene, args.output)
+    print(f"{json_file} ({json_file.stat().st_size} bytes), {bin_file} ({bin_file.stat().st_size} bytes)")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
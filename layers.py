@@ -0,0 +1,273 @@
+import hashlib
+
+import numpy as np
+
+# Axes, grids and their labels sit still through most of a scene, yet the
+# camera draws them again for every frame they aren't covered by manim's
+# per-play static image (anything listed after a moving mobject, every
+# play's static image itself, every frame of a play with updaters).
+#
+# A BackgroundLayer draws the mobjects marked as background once onto the
+# camera's background image, which every frame starts from, and hides them
+# from the normal draw. The layer is keyed on the points and colors of those
+# mobjects and the camera's position, and is redrawn only when the key
+# changes: while the axes are being created or faded out, or the camera
+# moves. Marked mobjects that leave the scene leave the layer too.
+#
+# The layer is always beneath everything else, whatever the order the
+# mobjects were added in. Cairo renderer only.
+#
+# FrameHooks is the one place that patches the camera and renderer for
+# layers, this one and hud.HudOverlay alike. It hides the layers' mobjects
+# from the camera, lets every layer refresh before a frame is drawn and
+# composite onto it afterwards, and puts the original methods back when the
+# scene tears down.
+#
+# Hashing every point of a layer on every frame is not free, so a layer
+# first checks cheap signals: within one play, the same members that no
+# animation targets and no updater (on them or on a group holding them)
+# runs for can't have changed, and the digest is only computed at the first
+# frame of each play. Members that can move are hashed every frame.
+
+
+def _array_digest(digest, array):
+    array = np.ascontiguousarray(array)
+    digest.update(str(array.shape).encode())
+    digest.update(array.data)
+
+
+def state_digest(mobjects, *extra):
+    # Changes whenever anything that affects how the mobjects are drawn does
+    digest = hashlib.sha1(repr(extra).encode())
+    for mobject in mobjects:
+        for member in mobject.family_members_with_points():
+            digest.update(f"{id(member)}:{member.z_index}".encode())
+            _array_digest(digest, member.points)
+            for name in ("fill_rgbas", "stroke_rgbas", "background_stroke_rgbas"):
+                if hasattr(member, name):
+                    _array_digest(digest, getattr(member, name))
+            if hasattr(member, "stroke_width"):
+                digest.update(f"{member.stroke_width}:{member.background_stroke_width}".encode())
+    return digest.digest()
+
+
+def camera_key(camera):
+    values = [*camera.frame_center, camera.frame_width, camera.frame_height]
+    if hasattr(camera, "get_value_trackers"):
+        # ThreeDCamera: angles, focal distance and zoom
+        values += [tracker.get_value() for tracker in camera.get_value_trackers()]
+    return tuple(float(v) for v in values)
+
+
+class FrameHooks:
+    def __init__(self, scene):
+        renderer = scene.renderer
+        self.scene = scene
+        self.renderer = renderer
+        self.camera = renderer.camera
+        self.layers = []
+        # Layers draw their own members through the camera unhidden
+        self.bypass = False
+        self.building_static = False
+        # The renderer's static image predates the last rebuild of a layer
+        self.stale = False
+        self._moving_play = None
+        self._moving = set()
+        self._restore = []
+
+        self._wrap(self.camera, "get_mobjects_to_display", self._hiding)
+        self._wrap(renderer, "update_frame", self._layered_update_frame)
+        self._wrap(renderer, "save_static_frame_data", self._static_frame_data)
+        self._wrap(scene, "tear_down", self._closing)
+
+    def _wrap(self, owner, name, make_wrapper):
+        self._restore.append((owner, name, owner.__dict__.get(name)))
+        setattr(owner, name, make_wrapper(getattr(owner, name)))
+
+    def _hiding(self, original):
+        def get_mobjects_to_display(*args, **kwargs):
+            mobjects = original(*args, **kwargs)
+            hidden = [layer.hidden for layer in self.layers if layer.hidden]
+            if self.bypass or not hidden:
+                return mobjects
+            return [m for m in mobjects if not any(id(m) in h for h in hidden)]
+
+        return get_mobjects_to_display
+
+    def _layered_update_frame(self, original):
+        renderer = self.renderer
+
+        def update_frame(scene, mobjects=None, include_submobjects=True, ignore_skipping=True, **kwargs):
+            if renderer.skip_animations and not ignore_skipping:
+                return
+            for layer in self.layers:
+                if layer.refresh():
+                    self.stale = True
+            if renderer.static_image is None:
+                # e.g. save_static_frame_data building a new static image
+                self.stale = False
+            if not self.stale:
+                original(scene, mobjects, include_submobjects, ignore_skipping, **kwargs)
+            else:
+                # A layer changed under the static image; draw everything
+                # else from scratch on top of it
+                static_image, renderer.static_image = renderer.static_image, None
+                try:
+                    original(scene, None, include_submobjects, ignore_skipping, **kwargs)
+                finally:
+                    renderer.static_image = static_image
+            if not self.building_static:
+                for layer in self.layers:
+                    layer.composite(self.camera.pixel_array)
+
+        return update_frame
+
+    def _static_frame_data(self, original):
+        def save_static_frame_data(scene, static_mobjects):
+            # The static image is a starting point for later frames, which
+            # get the layers composited themselves
+            self.building_static = True
+            try:
+                return original(scene, static_mobjects)
+            finally:
+                self.building_static = False
+
+        return save_static_frame_data
+
+    def _closing(self, original):
+        def tear_down(*args, **kwargs):
+            try:
+                return original(*args, **kwargs)
+            finally:
+                self.close()
+
+        return tear_down
+
+    def moving(self):
+        # Ids of every mobject the current play animates or runs an updater
+        # for, with their families; worked out once per play
+        if self._moving_play != self.renderer.num_plays:
+            self._moving_play = self.renderer.num_plays
+            movers = [animation.mobject for animation in self.scene.animations or []]
+            movers += [m for m in self.scene.get_mobject_family_members() if m.updaters]
+            self._moving = {id(m) for mover in movers for m in mover.get_family()}
+        return self._moving
+
+    def may_change(self, mobjects):
+        # Whether the current play can move or restyle any of the mobjects
+        moving = self.moving()
+        return any(id(m) in moving for mobject in mobjects for m in mobject.get_family())
+
+    def draw(self, mobjects):
+        # Capture mobjects onto the camera's pixel array, hidden or not
+        self.bypass = True
+        try:
+            self.camera.capture_mobjects(mobjects)
+        finally:
+            self.bypass = False
+
+    def close(self):
+        # Plain rendering from here on, e.g. for the last frame manim saves
+        # after tear_down
+        for layer in self.layers:
+            layer.close()
+        for owner, name, original in reversed(self._restore):
+            if original is None:
+                delattr(owner, name)
+            else:
+                setattr(owner, name, original)
+        self._restore.clear()
+        self.layers.clear()
+        self.scene.frame_hooks = None
+
+
+def frame_hooks(scene):
+    # One set of hooks per scene, shared by all of its layers
+    hooks = getattr(scene, "frame_hooks", None)
+    if hooks is None:
+        hooks = scene.frame_hooks = FrameHooks(scene)
+    return hooks
+
+
+class FrameLayer:
+    # Something FrameHooks draws: refresh() before every frame returns True
+    # when the renderer's static image is out of date, composite() gets every
+    # finished frame
+    def __init__(self, scene):
+        self.scene = scene
+        self.hooks = frame_hooks(scene)
+        self.camera = self.hooks.camera
+        self.hidden = set()
+        self.key = None
+        self.signature = None
+        self.dynamic = True
+        self.hooks.layers.append(self)
+
+    def changed(self, members, *extra):
+        signature = (self.hooks.renderer.num_plays, tuple(id(m) for m in members), extra)
+        if signature == self.signature and not self.dynamic:
+            return False
+        if signature != self.signature:
+            self.signature = signature
+            self.dynamic = self.hooks.may_change(members)
+        key = state_digest(members, *extra)
+        if key == self.key:
+            return False
+        self.key = key
+        return True
+
+    def refresh(self):
+        return False
+
+    def composite(self, frame):
+        pass
+
+    def close(self):
+        self.hidden = set()
+
+
+class BackgroundLayer(FrameLayer):
+    def __init__(self, scene, *mobjects):
+        super().__init__(scene)
+        self.marked = list(mobjects)
+        self.base = self.camera.background
+        self.rebuilds = 0
+
+    def add(self, *mobjects):
+        self.marked.extend(m for m in mobjects if m not in self.marked)
+        return self
+
+    def remove(self, *mobjects):
+        self.marked = [m for m in self.marked if m not in mobjects]
+        return self
+
+    def members(self):
+        # Marked mobjects that are in the scene right now, with their families
+        in_scene = {id(m) for m in self.scene.get_mobject_family_members()}
+        return [m for m in self.marked if id(m) in in_scene]
+
+    def refresh(self):
+        members = self.members()
+        if not self.changed(members, camera_key(self.camera)):
+            return False
+        self.rebuilds += 1
+        camera = self.camera
+        camera.background = self.base
+        camera.reset()
+        if members:
+            self.hooks.draw(members)
+            camera.background = np.array(camera.pixel_array)
+        self.hidden = {id(m) for mobject in members for m in mobject.get_family()}
+        return True
+
+    def close(self):
+        super().close()
+        self.camera.background = self.base
+
+
+def use_background_layer(scene, *mobjects):
+    # Mark mobjects as background; keeps one layer per scene
+    layer = getattr(scene, "background_layer", None)
+    if layer is None:
+        layer = scene.background_layer = BackgroundLayer(scene)
+    return layer.add(*mobjects)
@@ -1,5 +1,7 @@
 from manim import *
 
+from layers import use_background_layer
+
 class LinearTransformationScene2D(Scene):
     def construct(self):
         # Set up axes
@@ -13,6 +15,7 @@ class LinearTransformationScene2D(Scene):
         )
 
         labels = axes.get_axis_labels(x_label="x", y_label="y")
+        use_background_layer(self, axes, labels)
         self.play(Create(axes), Write(labels))
 
         # Add a square for reference
@@ -0,0 +1,233 @@
+import argparse
+import subprocess
+import sys
+import time
+from multiprocessing import shared_memory
+from pathlib import Path
+
+import numpy as np
+
+ROOT = Path(__file__).resolve().parent
+
+# Frames a render can get ahead of the viewer before it overwrites them
+SLOTS = 8
+# Widest frame the viewer shows; bigger frames are subsampled
+VIEW_WIDTH = 960
+# Seconds the viewer keeps showing the last frame after the render is done
+LINGER = 3.0
+MAGIC = 0x4D50524556  # "MPREV"
+
+# Header fields, one int64 each, before the frame slots
+MAGIC_FIELD, HEIGHT, WIDTH, CHANNELS, SLOT_COUNT, WRITTEN, ABORT, DONE = range(8)
+HEADER_BYTES = 64
+
+# A live preview of a render in progress. The renderer copies every frame it
+# hands to the encoder into one of SLOTS preallocated slots of a shared
+# memory block; a viewer process maps the same block and shows the newest
+# frame. Nothing waits on the viewer: when it falls behind, old slots are
+# simply overwritten, and the encoder gets every frame as before. The viewer
+# can ask the render to stop; the scene then ends after the current play()
+# and its movie is written with what was rendered so far, but the render is
+# reported as stopped rather than done.
+
+
+def shared_name(name):
+    return f"manim_preview_{name}"
+
+
+class FrameRing:
+    def __init__(self, shm):
+        self.shm = shm
+        self.header = np.ndarray((8,), dtype=np.int64, buffer=shm.buf)
+        height, width, channels, slots = self.header[[HEIGHT, WIDTH, CHANNELS, SLOT_COUNT]]
+        self.slots = np.ndarray(
+            (slots, height, width, channels), dtype=np.uint8, buffer=shm.buf, offset=HEADER_BYTES
+        )
+
+    @classmethod
+    def create(cls, name, height, width, channels=4, slots=SLOTS):
+        size = HEADER_BYTES + slots * height * width * channels
+        try:
+            shm = shared_memory.SharedMemory(shared_name(name), create=True, size=size)
+        except FileExistsError:
+            # Left behind by a render that crashed
+            stale = shared_memory.SharedMemory(shared_name(name))
+            stale.close()
+            stale.unlink()
+            shm = shared_memory.SharedMemory(shared_name(name), create=True, size=size)
+        header = np.ndarray((8,), dtype=np.int64, buffer=shm.buf)
+        header[:] = [MAGIC, height, width, channels, slots, 0, 0, 0]
+        del header
+        return cls(shm)
+
+    @classmethod
+    def attach(cls, name):
+        # track=False: the viewer must not unlink the block when it exits
+        ring = cls(shared_memory.SharedMemory(shared_name(name), track=False))
+        if ring.header[MAGIC_FIELD] != MAGIC:
+            ring.close()
+            raise ValueError(f"{shared_name(name)} is not a preview buffer")
+        return ring
+
+    @property
+    def written(self):
+        return int(self.header[WRITTEN])
+
+    def write(self, frame):
+        # One copy into a preallocated slot; the count is published after
+        # the pixels, so a reader never sees a slot before it is filled
+        index = self.written
+        np.copyto(self.slots[index % len(self.slots)], frame)
+        self.header[WRITTEN] = index + 1
+
+    def latest(self, out):
+        # Copy the newest frame into `out`; None if no frame is there yet or
+        # the writer lapped the slot while it was being copied
+        index = self.written - 1
+        if index < 0:
+            return None
+        np.copyto(out, self.slots[index % len(self.slots)])
+        if self.written - 1 - index >= len(self.slots) - 1:
+            return None
+        return index
+
+    def request_abort(self):
+        self.header[ABORT] = 1
+
+    @property
+    def aborted(self):
+        return bool(self.header[ABORT])
+
+    def finish(self):
+        self.header[DONE] = 1
+
+    @property
+    def done(self):
+        return bool(self.header[DONE])
+
+    def close(self):
+        # The arrays are views into the mapping and must go first
+        del self.header, self.slots
+        self.shm.close()
+
+    def unlink(self):
+        self.shm.unlink()
+
+
+class LivePreview:
+    # Attach to a freshly constructed scene, before it renders
+    def __init__(self, scene, name=None, spawn_viewer=True):
+        from manim.utils.exceptions import EndSceneEarlyException
+
+        self.name = name or type(scene).__name__
+        camera = scene.renderer.camera
+        self.ring = FrameRing.create(self.name, camera.pixel_height, camera.pixel_width)
+        self.stopped_early = False
+        self.viewer = None
+        if spawn_viewer:
+            self.viewer = subprocess.Popen([sys.executable, str(ROOT / "live_preview.py"), self.name])
+
+        renderer = scene.renderer
+        write_frame = renderer.file_writer.write_frame
+        play = renderer.play
+
+        def previewed_write_frame(frame, num_frames=1):
+            write_frame(frame, num_frames)
+            if self.ring is not None:
+                self.ring.write(frame)
+
+        def abortable_play(scene, *args, **kwargs):
+            # Checked between plays, so no partial movie is left half open
+            if self.aborted:
+                raise EndSceneEarlyException()
+            play(scene, *args, **kwargs)
+
+        renderer.file_writer.write_frame = previewed_write_frame
+        renderer.play = abortable_play
+
+    @property
+    def aborted(self):
+        return self.ring is not None and self.ring.aborted
+
+    def close(self):
+        # The viewer keeps its own mapping and shows the last frame for
+        # LINGER seconds before it exits
+        self.stopped_early = self.ring.aborted
+        self.ring.finish()
+        self.ring.close()
+        self.ring.unlink()
+        self.ring = None
+        if self.viewer is not None:
+            try:
+                self.viewer.wait(timeout=LINGER + 2)
+            except subprocess.TimeoutExpired:
+                self.viewer.terminate()
+                self.viewer.wait()
+            self.viewer = None
+
+
+def view(name, wait=30.0, linger=LINGER):
+    import tkinter as tk
+
+    deadline = time.monotonic() + wait
+    while True:
+        try:
+            ring = FrameRing.attach(name)
+            break
+        except FileNotFoundError:
+            if time.monotonic() > deadline:
+                print(f"no render is previewing {name}", file=sys.stderr)
+                return 1
+            time.sleep(0.1)
+
+    height, width = ring.slots.shape[1:3]
+    step = max(1, -(-width // VIEW_WIDTH))
+    frame = np.empty(ring.slots.shape[1:], dtype=np.uint8)
+    header = f"P6 {len(range(0, width, step))} {len(range(0, height, step))} 255\n".encode()
+
+    root = tk.Tk()
+    root.title(f"{name} (a: abort render)")
+    label = tk.Label(root)
+    label.pack()
+    state = {"shown": -1, "done": False}
+
+    def abort(_event=None):
+        if not state["done"]:
+            ring.request_abort()
+            root.title(f"{name}: aborting after the current play")
+
+    def poll():
+        done = ring.done
+        index = ring.latest(frame)
+        if index is not None and index != state["shown"]:
+            pixels = np.ascontiguousarray(frame[::step, ::step, :3])
+            label.image = tk.PhotoImage(data=header + pixels.tobytes())
+            label.configure(image=label.image)
+            state["shown"] = index
+            if not ring.aborted:
+                root.title(f"{name}: frame {index + 1} (a: abort render)")
+        if done:
+            state["done"] = True
+            root.title(f"{name}: finished after {state['shown'] + 1} frames")
+            root.after(int(linger * 1000), root.destroy)
+            return
+        root.after(15, poll)
+
+    root.bind("a", abort)
+    poll()
+    root.mainloop()
+    ring.close()
+    return 0
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Show the frames of a render in progress (render_all.py --preview).")
+    parser.add_argument("name", help="scene name (or section output name) being rendered")
+    parser.add_argument("--wait", type=float, default=30.0, help="seconds to wait for the render to start")
+    parser.add_argument("--linger", type=float, default=LINGER, help="seconds to keep showing the last frame once the render is done")
+    args = parser.parse_args(argv)
+    return view(args.name, args.wait, args.linger)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
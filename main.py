@@ -1,5 +1,8 @@
 from manim import *
 
+from fast_grid import FastGrid
+from layers import use_background_layer
+
 class GeometricTransformations(Scene):
     def construct(self):
         # Introduction title
@@ -19,16 +22,23 @@ class GeometricTransformations(Scene):
             axis_config={"color": GREY}
         )
         axes_labels = axes.get_axis_labels(x_label="x", y_label="y")
-        grid = NumberPlane(
-            x_range=[-5, 5, 1],
-            y_range=[-5, 5, 1],
-            background_line_style={
-                "stroke_color": GREY_C,
-                "stroke_width": 0.5,
-                "stroke_opacity": 0.5
-            }
+        # FastGrid has no axes of its own; add the two white lines NumberPlane
+        # draws through the origin
+        grid = VGroup(
+            FastGrid(
+                x_range=[-5, 5, 1],
+                y_range=[-5, 5, 1],
+                stroke_color=GREY_C,
+                stroke_width=0.5,
+                stroke_opacity=0.5
+            ),
+            Line(5 * LEFT, 5 * RIGHT, stroke_width=2),
+            Line(5 * DOWN, 5 * UP, stroke_width=2),
         )
         
+        # The grid and axes stay put until the end; draw them once into a
+        # cached layer
+        use_background_layer(self, grid, axes, axes_labels)
         self.play(Create(grid), Create(axes), Write(axes_labels))
         self.play(Create(square))
         
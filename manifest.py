@@ -0,0 +1,138 @@
+import ast
+import hashlib
+import json
+import time
+from importlib import metadata
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent
+DEFAULT_STATE = ROOT / "render_all.progress.jsonl"
+DRIVER = ROOT / "render_all.py"
+
+# A scene's render is identified by everything that can change its output:
+# the scene file, every project module it imports (directly or through other
+# project modules), render_all.py and every helper it imports, the manim
+# version, the settings it renders with and the driver flags that change the
+# movie (draft, streaming, split sections, pruning). The
+# state file is append-only JSONL, one line per finished job, so a batch that
+# dies halfway keeps every scene finished before the crash; the next run
+# skips those and renders the rest.
+
+
+def manim_version():
+    # Read from the package metadata so the parent process never imports manim
+    try:
+        return metadata.version("manim")
+    except metadata.PackageNotFoundError:
+        return "unknown"
+
+
+def _imported_names(path):
+    tree = ast.parse(Path(path).read_text(encoding="utf-8"), filename=str(path))
+    for node in ast.walk(tree):
+        if isinstance(node, ast.Import):
+            for alias in node.names:
+                yield alias.name.split(".")[0]
+        elif isinstance(node, ast.ImportFrom) and node.module and not node.level:
+            yield node.module.split(".")[0]
+
+
+def local_imports(path, root=ROOT):
+    # The project modules a file depends on, transitively, including those
+    # imported inside functions. Helpers render_all loads for a scene are not
+    # among a scene file's imports; job_hash adds them separately
+    seen = set()
+    todo = [Path(path).resolve()]
+    while todo:
+        current = todo.pop()
+        if current in seen:
+            continue
+        seen.add(current)
+        for name in _imported_names(current):
+            candidate = Path(root) / f"{name}.py"
+            if candidate.exists():
+                todo.append(candidate.resolve())
+    seen.discard(Path(path).resolve())
+    return sorted(seen)
+
+
+def job_hash(job, version=None):
+    digest = hashlib.sha256()
+    path = Path(job["path"]).resolve()
+    # The driver imports helpers like draft, streaming and scene_audit
+    # lazily in the workers, so its imports count as the scene's
+    sources = {path, *local_imports(path, path.parent)}
+    if DRIVER.exists():
+        sources.update([DRIVER, *local_imports(DRIVER, ROOT)])
+    for source in sorted(sources):
+        digest.update(source.name.encode() + b"\0")
+        digest.update(source.read_bytes() + b"\0")
+    options = {
+        "scene": job["scene"],
+        "manim": version or manim_version(),
+        "settings": job["settings"],
+        "draft": bool(job.get("draft")),
+        "stream": job.get("stream"),
+        "split": bool(job.get("split")),
+        "audit": job.get("audit") == "prune",
+    }
+    digest.update(json.dumps(options, sort_keys=True, default=str).encode())
+    return digest.hexdigest()
+
+
+def job_key(file, scene):
+    return f"{Path(file).name}:{scene}"
+
+
+def load_state(path):
+    # Later lines win, so a re-render overrides its earlier failure
+    state = {}
+    if Path(path).exists():
+        for line in Path(path).read_text(encoding="utf-8").splitlines():
+            if line.strip():
+                record = json.loads(line)
+                state[record["key"]] = record
+    return state
+
+
+class Manifest:
+    def __init__(self, path=DEFAULT_STATE):
+        self.path = Path(path)
+        self.state = load_state(self.path)
+        self.hashes = {}
+
+    def is_current(self, key, digest):
+        record = self.state.get(key)
+        return (
+            record is not None
+            and record["status"] == "done"
+            and record["hash"] == digest
+            and record.get("output") is not None
+            and Path(record["output"]).exists()
+        )
+
+    def pending(self, jobs):
+        # Split jobs into the ones to render and the ones that are up to date
+        version = manim_version()
+        todo, skipped = [], []
+        for job in jobs:
+            key = job_key(job["path"], job["scene"])
+            self.hashes[key] = job_hash(job, version)
+            (skipped if self.is_current(key, self.hashes[key]) else todo).append(job)
+        return todo, skipped
+
+    def record(self, result):
+        key = job_key(result["file"], result["scene"])
+        record = {
+            "key": key,
+            "hash": self.hashes.get(key),
+            "status": "failed" if "error" in result else result.get("status", "done"),
+            "output": result.get("output"),
+            "seconds": round(result["seconds"], 3),
+            "time": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        }
+        if "error" in result:
+            record["error"] = result["error"]
+        self.state[key] = record
+        with self.path.open("a", encoding="utf-8") as log:
+            log.write(json.dumps(record) + "\n")
@@ -0,0 +1,111 @@
+import numpy as np
+
+PATH_MODES = ("lerp", "polar")
+
+# Below this angle a relative rotation is treated as no rotation at all
+ANGLE_EPSILON = 1e-9
+
+
+def polar_decompose(matrix):
+    # A = R S with R a proper rotation and S symmetric. For matrices that
+    # reflect, the reflection is pushed into S so R stays a rotation.
+    u, sigma, vt = np.linalg.svd(matrix)
+    flip = np.identity(3)
+    if np.linalg.det(u @ vt) < 0:
+        flip[2, 2] = -1
+    rotation = u @ flip @ vt
+    stretch = vt.T @ flip @ np.diag(sigma) @ vt
+    return rotation, stretch
+
+
+def rotation_axis_angle(rotation):
+    angle = np.arccos(np.clip((np.trace(rotation) - 1) / 2, -1, 1))
+    if angle < ANGLE_EPSILON:
+        return np.array([0.0, 0.0, 1.0]), 0.0
+    if np.pi - angle < 1e-6:
+        # Near a half turn the skew part vanishes; read the axis off R + I
+        column = rotation + np.identity(3)
+        axis = column[:, np.argmax(np.linalg.norm(column, axis=0))]
+        return axis / np.linalg.norm(axis), angle
+    axis = np.array([
+        rotation[2, 1] - rotation[1, 2],
+        rotation[0, 2] - rotation[2, 0],
+        rotation[1, 0] - rotation[0, 1],
+    ])
+    return axis / np.linalg.norm(axis), angle
+
+
+def rotations_about(axis, angles):
+    # Rodrigues' formula for a whole array of angles at once: (n, 3, 3)
+    x, y, z = axis
+    k = np.array([[0, -z, y], [z, 0, -x], [-y, x, 0]])
+    angles = np.asarray(angles)[:, None, None]
+    return np.identity(3) + np.sin(angles) * k + (1 - np.cos(angles)) * (k @ k)
+
+
+class MatrixPath:
+    # Matrices along the way from `start` to `end`, evaluated for a whole
+    # array of progress values in one vectorized pass.
+    #
+    # "lerp" blends the entries, which is what ApplyMatrix does and why a
+    # rotating cube visibly shrinks halfway. "polar" splits both ends into
+    # rotation and stretch, turns at constant speed about a single axis and
+    # blends only the stretch, so pure rotations keep their shape.
+    #
+    # A reflection has no rotation to follow: polar_decompose would push the
+    # flip into the stretch along whatever axis the SVD picks. Paths to or
+    # from a reflection fall back to "lerp", like index.html does.
+    def __init__(self, start, end, mode="lerp"):
+        if mode not in PATH_MODES:
+            raise ValueError(f"mode must be one of {PATH_MODES}, got {mode!r}")
+        self.start = np.array(start, dtype=float)
+        self.end = np.array(end, dtype=float)
+        if mode == "polar" and min(np.linalg.det(self.start), np.linalg.det(self.end)) < 0:
+            mode = "lerp"
+        self.mode = mode
+        if mode == "polar":
+            start_rotation, self.start_stretch = polar_decompose(self.start)
+            end_rotation, self.end_stretch = polar_decompose(self.end)
+            self.start_rotation = start_rotation
+            self.axis, self.angle = rotation_axis_angle(start_rotation.T @ end_rotation)
+
+    def at(self, ts):
+        ts = np.asarray(ts, dtype=float)[:, None, None]
+        if self.mode == "lerp":
+            return (1 - ts) * self.start + ts * self.end
+        rotations = self.start_rotation @ rotations_about(self.axis, ts[:, 0, 0] * self.angle)
+        stretches = (1 - ts) * self.start_stretch + ts * self.end_stretch
+        return rotations @ stretches
+
+
+def frame_alphas(run_time, frame_rate):
+    # The alpha values Scene.play_internal will ask for, plus the final 1
+    return np.append(np.arange(0, run_time, 1 / frame_rate) / run_time, 1.0)
+
+
+def sample_rate_func(rate_func, alphas):
+    try:
+        values = np.asarray(rate_func(alphas), dtype=float)
+        if values.shape == alphas.shape:
+            return values
+    except (TypeError, ValueError):
+        pass
+    return np.array([rate_func(a) for a in alphas], dtype=float)
+
+
+class MatrixTable:
+    # Per-frame matrices of an animation, computed before the first frame so
+    # drawing a frame is a lookup plus the matmul that applies it
+    def __init__(self, path, run_time, frame_rate, rate_func):
+        self.path = path
+        self.rate_func = rate_func
+        self.alphas = frame_alphas(run_time, frame_rate)
+        self.steps = run_time * frame_rate
+        self.matrices = path.at(sample_rate_func(rate_func, self.alphas))
+
+    def __call__(self, alpha):
+        index = min(int(round(alpha * self.steps)), len(self.alphas) - 1)
+        if abs(self.alphas[index] - alpha) < 1e-9:
+            return self.matrices[index]
+        # Off-grid alpha (e.g. a scene scrubbing the animation); compute it
+        return self.path.at([self.rate_func(alpha)])[0]
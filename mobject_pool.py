@@ -0,0 +1,104 @@
+import sys
+from collections import OrderedDict
+from contextlib import contextmanager
+from functools import partialmethod
+
+import numpy as np
+
+# Building a Text or MathTex means rendering and parsing an SVG, and even a
+# Vector generates its tip and stroke points from scratch. Scenes keep asking
+# for the same labels and arrows, so the pool builds each distinct
+# (class, arguments) once as a template and hands out copies of it.
+#
+# The pool lives for the whole process, so render_all.py workers share it
+# across every scene they render.
+
+MAX_TEMPLATES = 256
+
+
+def _freeze(value):
+    # Turn constructor arguments into something hashable; TypeError for
+    # anything that can't be compared safely (then the call is not pooled)
+    if isinstance(value, (str, int, float, bool, type(None))):
+        return value
+    if isinstance(value, np.ndarray):
+        return ("array", value.shape, tuple(value.ravel().tolist()))
+    if isinstance(value, (list, tuple)):
+        return (type(value).__name__, tuple(_freeze(v) for v in value))
+    if isinstance(value, dict):
+        return ("dict", tuple(sorted((k, _freeze(v)) for k, v in value.items())))
+    if hasattr(value, "to_hex"):
+        # ManimColor
+        return ("color", value.to_hex(with_alpha=True))
+    raise TypeError(f"can't pool on a {type(value).__name__} argument")
+
+
+def _context(cls):
+    # What changes the built mobject besides the arguments: defaults set with
+    # Mobject.set_default (e.g. Text.set_default(font=...)) anywhere in the
+    # class hierarchy, and manim's global TeX template
+    defaults = tuple(
+        (klass.__name__, _freeze(klass.__dict__["__init__"].keywords))
+        for klass in getattr(cls, "__mro__", ())
+        if isinstance(klass.__dict__.get("__init__"), partialmethod)
+    )
+    manim = sys.modules.get("manim")
+    template = manim.config.tex_template.body if manim is not None else None
+    return defaults, template
+
+
+def _key(cls, args, kwargs):
+    try:
+        return cls, _freeze(args), _freeze(kwargs), _context(cls)
+    except TypeError:
+        return None
+
+
+class MobjectPool:
+    def __init__(self, max_size=MAX_TEMPLATES):
+        self.max_size = max_size
+        self.templates = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.enabled = True
+
+    def get(self, cls, *args, **kwargs):
+        key = _key(cls, args, kwargs) if self.enabled else None
+        if key is None:
+            self.misses += 1
+            return cls(*args, **kwargs)
+        template = self.templates.get(key)
+        if template is None:
+            self.misses += 1
+            template = cls(*args, **kwargs)
+            self.templates[key] = template
+            if len(self.templates) > self.max_size:
+                self.templates.popitem(last=False)
+        else:
+            self.hits += 1
+            self.templates.move_to_end(key)
+        return template.copy()
+
+    def clear(self):
+        self.templates.clear()
+        self.hits = self.misses = 0
+
+    @contextmanager
+    def disabled(self):
+        # For dry runs that build mobjects from stand-ins (e.g. placeholder
+        # TeX SVGs) which must not end up as templates
+        enabled, self.enabled = self.enabled, False
+        try:
+            yield
+        finally:
+            self.enabled = enabled
+
+    def stats(self):
+        return {"templates": len(self.templates), "hits": self.hits, "misses": self.misses}
+
+
+POOL = MobjectPool()
+
+
+def pooled(cls, *args, **kwargs):
+    return POOL.get(cls, *args, **kwargs)
@@ -0,0 +1,199 @@
+import argparse
+import hashlib
+import json
+import os
+import sys
+import tempfile
+from collections import defaultdict
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent
+
+MOVIE_SUFFIXES = {".mp4", ".mov", ".webm", ".gif"}
+LIST_FILE = "partial_movie_file_list.txt"
+INDEX_FILE = ".partial_movie_index.json"
+
+
+class Segment:
+    def __init__(self, path, videos_dir):
+        self.path = path
+        # <module>/<quality>/partial_movie_files/<scene>[/<section>]/<hash>.mp4
+        parts = path.relative_to(videos_dir).parts
+        self.module, self.quality = parts[0], parts[1]
+        self.scene = "/".join(parts[3:-1])
+        self.hash = path.stem
+        st = path.stat()
+        self.size, self.mtime, self.inode = st.st_size, st.st_mtime, (st.st_dev, st.st_ino)
+        self.digest = None
+        self.referenced = True
+
+    @property
+    def key(self):
+        return f"{self.module}/{self.quality}/{self.scene}"
+
+
+def read_list_file(list_file):
+    # The list is written by manim for the latest render of a scene; paths may
+    # come from another machine, so only the file names are compared
+    names = set()
+    for line in list_file.read_text(encoding="utf-8").splitlines():
+        line = line.strip()
+        if line.startswith("file "):
+            names.add(line[5:].strip("'").replace("\\", "/").rsplit("/", 1)[-1])
+    return names
+
+
+def index_segments(videos_dir):
+    segments = []
+    for partial_dir in videos_dir.glob("*/*/partial_movie_files"):
+        for scene_dir in [partial_dir, *(p for p in partial_dir.rglob("*") if p.is_dir())]:
+            files = [p for p in scene_dir.iterdir() if p.is_file() and p.suffix in MOVIE_SUFFIXES]
+            if not files:
+                continue
+            list_file = scene_dir / LIST_FILE
+            referenced = read_list_file(list_file) if list_file.exists() else None
+            for path in files:
+                segment = Segment(path, videos_dir)
+                # Without a list file we can't tell what the last render used
+                segment.referenced = referenced is None or path.name in referenced
+                segments.append(segment)
+    return segments
+
+
+def content_digests(segments, videos_dir, dry_run):
+    # Hash file contents, reusing digests from the previous run for files
+    # whose size and mtime have not changed; a dry run doesn't save them
+    index_file = videos_dir / INDEX_FILE
+    previous = json.loads(index_file.read_text()) if index_file.exists() else {}
+    current = {}
+    for segment in segments:
+        rel = segment.path.relative_to(videos_dir).as_posix()
+        entry = previous.get(rel)
+        if entry and entry["size"] == segment.size and entry["mtime"] == segment.mtime:
+            segment.digest = entry["digest"]
+        else:
+            hasher = hashlib.sha256()
+            with segment.path.open("rb") as fp:
+                for chunk in iter(lambda: fp.read(1 << 20), b""):
+                    hasher.update(chunk)
+            segment.digest = hasher.hexdigest()
+        current[rel] = {"size": segment.size, "mtime": segment.mtime, "digest": segment.digest}
+    if dry_run:
+        return
+    tmp = index_file.with_suffix(".tmp")
+    tmp.write_text(json.dumps(current))
+    os.replace(tmp, index_file)
+
+
+def unique_bytes(segments):
+    return sum({s.inode: s.size for s in segments}.values())
+
+
+def remove(segments, dry_run):
+    for segment in segments:
+        if not dry_run:
+            segment.path.unlink(missing_ok=True)
+    return len(segments)
+
+
+def evict_unreferenced(segments, dry_run):
+    stale = [s for s in segments if not s.referenced]
+    remove(stale, dry_run)
+    return stale
+
+
+def dedupe(segments, dry_run):
+    # Replace identical segments with hard links to a single copy
+    by_digest = defaultdict(list)
+    for segment in segments:
+        by_digest[segment.digest].append(segment)
+    linked = 0
+    for group in by_digest.values():
+        canonical = min(group, key=lambda s: s.mtime)
+        for segment in group:
+            if segment.inode == canonical.inode:
+                continue
+            if not dry_run:
+                fd, tmp = tempfile.mkstemp(dir=segment.path.parent, prefix=".tmp-")
+                os.close(fd)
+                os.unlink(tmp)
+                try:
+                    os.link(canonical.path, tmp)
+                except OSError:
+                    # Different filesystem; nothing to gain here
+                    continue
+                os.replace(tmp, segment.path)
+            segment.inode = canonical.inode
+            linked += 1
+    return linked
+
+
+def enforce_budget(segments, budget_bytes, dry_run):
+    # Drop the least recently written segments until the unique size fits.
+    # Final movies are never touched; the next render just re-encodes.
+    removed = []
+    by_inode = defaultdict(list)
+    for segment in segments:
+        by_inode[segment.inode].append(segment)
+    total = unique_bytes(segments)
+    for inode, group in sorted(by_inode.items(), key=lambda item: max(s.mtime for s in item[1])):
+        if total <= budget_bytes:
+            break
+        removed.extend(group)
+        total -= group[0].size
+    remove(removed, dry_run)
+    return removed
+
+
+def print_stats(segments):
+    per_scene = defaultdict(lambda: [0, 0, 0])
+    for segment in segments:
+        entry = per_scene[segment.key]
+        entry[0] += 1
+        entry[1] += segment.size
+        entry[2] += not segment.referenced
+    width = max((len(k) for k in per_scene), default=5)
+    print(f"{'scene':<{width}}  {'files':>5}  {'stale':>5}  {'MB':>8}")
+    for key in sorted(per_scene):
+        files, size, stale = per_scene[key]
+        print(f"{key:<{width}}  {files:>5}  {stale:>5}  {size / 1e6:>8.1f}")
+    apparent = sum(s.size for s in segments)
+    print(f"\n{len(segments)} segments, {apparent / 1e6:.1f} MB apparent, {unique_bytes(segments) / 1e6:.1f} MB on disk")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Index, deduplicate and trim manim's partial movie files.")
+    parser.add_argument("command", choices=["stats", "gc"])
+    parser.add_argument("--media-dir", default=str(ROOT / "media"))
+    parser.add_argument("--budget-mb", type=float, help="keep partial movies under this many MB")
+    parser.add_argument("--keep-stale", action="store_true", help="keep segments the latest render did not use")
+    parser.add_argument("--no-dedupe", action="store_true")
+    parser.add_argument("-n", "--dry-run", action="store_true")
+    args = parser.parse_args(argv)
+
+    videos_dir = Path(args.media_dir).resolve() / "videos"
+    segments = index_segments(videos_dir)
+    if args.command == "stats":
+        print_stats(segments)
+        return 0
+
+    before = unique_bytes(segments)
+    prefix = "would " if args.dry_run else ""
+    if not args.keep_stale:
+        stale = evict_unreferenced(segments, args.dry_run)
+        segments = [s for s in segments if s.referenced]
+        print(f"{prefix}evict {len(stale)} stale segments")
+    if not args.no_dedupe:
+        content_digests(segments, videos_dir, args.dry_run)
+        print(f"{prefix}hard link {dedupe(segments, args.dry_run)} duplicate segments")
+    if args.budget_mb is not None:
+        removed = enforce_budget(segments, args.budget_mb * 1e6, args.dry_run)
+        print(f"{prefix}remove {len(removed)} segments to fit {args.budget_mb:g} MB")
+        removed = set(removed)
+        segments = [s for s in segments if s not in removed]
+    print(f"{before / 1e6:.1f} MB -> {unique_bytes(segments) / 1e6:.1f} MB")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,212 @@
+import json
+import resource
+import sys
+import threading
+import time
+from collections import defaultdict
+from contextlib import contextmanager
+from pathlib import Path
+
+from manim import MarkupText, Text, config
+from manim.mobject.text import tex_mobject
+from manim.utils.file_ops import write_to_movie
+
+from incremental import call_site
+
+# Where the time of a render goes, per play()/wait() call. Every call gets
+# a record with the time spent in
+#
+#   update   Scene.update_to_time: animations and updaters moving mobjects
+#   raster   drawing frames with the camera
+#   encode   encoding frames and closing the segment
+#   tex      LaTeX and Pango SVG generation, including the mobject building
+#            in the code that leads up to the call
+#   other    the rest of the call: hashing, static frame caching, ...
+#
+# plus the number of frames written and the process' peak RSS so far.
+#
+# manim encodes on a writer thread while the next frames are drawn, and the
+# streaming writer never closes a segment per call, so timing write_frame
+# alone only measures a queue put. While profiling, write_frame waits until
+# the writer thread has encoded the frame, so encoding is timed on its own
+# and lands in the call that produced the frame. Profiled renders lose that
+# overlap and run a little slower.
+#
+# The peak RSS is ru_maxrss: the high-water mark of the whole process up to
+# the end of the call. It never goes down, so a call only shows up there if
+# it pushed the peak higher than anything before it.
+
+PHASES = ("update", "raster", "encode", "tex")
+
+
+def peak_rss_mb():
+    # The process' peak RSS so far, in MB (10^6 bytes); shared by the
+    # profiler, scene_audit.py and benchmark.py. ru_maxrss is in KiB on Linux
+    # and bytes on macOS
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak * (1 if sys.platform == "darwin" else 1024) / 1e6
+
+
+class PlayProfiler:
+    def __init__(self, scene):
+        self.scene = scene
+        self.scene_file = Path(sys.modules[type(scene).__module__].__file__).resolve()
+        self.records = []
+        self.times = defaultdict(float)
+        self.frames = 0
+        self.start = time.perf_counter()
+        self._restore = []
+        # Frame messages handed to the writer thread and encoded by it
+        self.queued = 0
+        self.encoded = 0
+        self._encoder_progress = threading.Condition()
+
+        renderer = scene.renderer
+        self._wrap(renderer, "play", self._profiled_play)
+        self._wrap(renderer, "update_frame", self._timed("raster"))
+        self._wrap(renderer.file_writer, "write_frame", self._count_frames)
+        self._wrap(renderer.file_writer, "encode_and_write_frame", self._counted_encode)
+        self._wrap(renderer.file_writer, "end_animation", self._timed("encode"))
+        self._wrap(scene, "update_to_time", self._timed("update"))
+        self._wrap(tex_mobject, "tex_to_svg_file", self._timed("tex"))
+        for cls in (Text, MarkupText):
+            self._wrap(cls, "_text2svg", self._timed("tex"))
+
+    def _wrap(self, owner, name, make_wrapper):
+        self._restore.append((owner, name, owner.__dict__.get(name)))
+        setattr(owner, name, make_wrapper(getattr(owner, name)))
+
+    def _timed(self, phase):
+        def make_wrapper(original):
+            def timed(*args, **kwargs):
+                start = time.perf_counter()
+                try:
+                    return original(*args, **kwargs)
+                finally:
+                    self.times[phase] += time.perf_counter() - start
+
+            return timed
+
+        return make_wrapper
+
+    def _count_frames(self, original):
+        file_writer = self.scene.renderer.file_writer
+
+        def write_frame(frame, num_frames=1):
+            start = time.perf_counter()
+            try:
+                result = original(frame, num_frames=num_frames)
+                if write_to_movie():
+                    self.queued += 1
+                    self._wait_for_encoder(file_writer)
+                return result
+            finally:
+                self.times["encode"] += time.perf_counter() - start
+                self.frames += num_frames
+
+        return write_frame
+
+    def _counted_encode(self, original):
+        # Runs on the writer thread
+        def encode_and_write_frame(*args, **kwargs):
+            try:
+                return original(*args, **kwargs)
+            finally:
+                with self._encoder_progress:
+                    self.encoded += 1
+                    self._encoder_progress.notify()
+
+        return encode_and_write_frame
+
+    def _wait_for_encoder(self, file_writer):
+        with self._encoder_progress:
+            while self.encoded < self.queued:
+                writer_thread = getattr(file_writer, "writer_thread", None)
+                if writer_thread is None or not writer_thread.is_alive():
+                    # The writer died; its error surfaces when the segment closes
+                    self.encoded = self.queued
+                    break
+                self._encoder_progress.wait(0.1)
+
+    def _profiled_play(self, original):
+        def play(scene, *args, **kwargs):
+            lineno, source = call_site(self.scene_file)
+            # TeX/text built since the previous call belongs to this one
+            lead_tex = self.times["tex"]
+            self.times.clear()
+            frames = self.frames
+            start = time.perf_counter()
+            original(scene, *args, **kwargs)
+            total = time.perf_counter() - start
+            phases = {phase: self.times[phase] for phase in PHASES}
+            other = total - sum(phases.values())
+            phases["tex"] += lead_tex
+            self.records.append({
+                "index": len(self.records),
+                "line": lineno,
+                "source": source,
+                "animations": [type(a).__name__ for a in scene.animations or []],
+                "frames": self.frames - frames,
+                "total": total + lead_tex,
+                **phases,
+                "other": other,
+                "peak_rss_mb": peak_rss_mb(),
+            })
+            self.times.clear()
+
+        return play
+
+    def close(self):
+        for owner, name, original in reversed(self._restore):
+            if original is None:
+                delattr(owner, name)
+            else:
+                setattr(owner, name, original)
+        self._restore.clear()
+
+    def summary(self):
+        totals = {phase: sum(r[phase] for r in self.records) for phase in (*PHASES, "other")}
+        return {
+            "scene": type(self.scene).__name__,
+            "seconds": time.perf_counter() - self.start,
+            "plays": len(self.records),
+            "frames": sum(r["frames"] for r in self.records),
+            "peak_rss_mb": peak_rss_mb(),
+            **totals,
+        }
+
+    def report(self):
+        summary = self.summary()
+        lines = [
+            f"{summary['scene']}: {summary['plays']} calls, {summary['frames']} frames, "
+            f"{summary['seconds']:.2f}s, process peak RSS {summary['peak_rss_mb']:.0f} MB",
+            "  " + "  ".join(f"{phase} {summary[phase]:.2f}s" for phase in (*PHASES, "other")),
+            "",
+            f"{'#':>4} {'line':>5} {'total':>7} {'update':>7} {'raster':>7} {'encode':>7} {'tex':>7} {'other':>7} {'frames':>6} {'peak MB':>7}  call",
+        ]
+        for r in sorted(self.records, key=lambda r: r["total"], reverse=True):
+            animations = ", ".join(r["animations"])
+            lines.append(
+                f"{r['index']:>4} {r['line'] or '-':>5} {r['total']:>7.3f} {r['update']:>7.3f} {r['raster']:>7.3f} "
+                f"{r['encode']:>7.3f} {r['tex']:>7.3f} {r['other']:>7.3f} {r['frames']:>6} {r['peak_rss_mb']:>7.0f}  "
+                f"{r['source']}  [{animations}]"
+            )
+        return "\n".join(lines)
+
+    def write(self, directory=None, name=None):
+        directory = Path(directory or Path(config.media_dir) / "profiles")
+        directory.mkdir(parents=True, exist_ok=True)
+        name = name or type(self.scene).__name__
+        json_file = directory / f"{name}.json"
+        json_file.write_text(json.dumps({"summary": self.summary(), "calls": self.records}, indent=1), encoding="utf-8")
+        (directory / f"{name}.txt").write_text(self.report() + "\n", encoding="utf-8")
+        return json_file
+
+
+@contextmanager
+def profile(scene):
+    profiler = PlayProfiler(scene)
+    try:
+        yield profiler
+    finally:
+        profiler.close()
@@ -1,8 +1,15 @@
 from manim import *
 import numpy as np
 
+from batched_apply import BatchedApplyMatrix
+from hud import use_hud_overlay
+from rank_collapse import RankAwareApplyMatrix
+
 class RankVisualization(ThreeDScene):
     def construct(self):
+        # Titles and matrices are fixed in frame; composite them as a cached
+        # overlay instead of drawing them through the 3D camera every frame
+        use_hud_overlay(self)
         # Set up the scene
         self.set_camera_orientation(phi=75 * DEGREES, theta=30 * DEGREES)
         
@@ -74,7 +81,7 @@ class RankVisualization(ThreeDScene):
         self.play(Write(rank_info))
         
         # Apply the transformation
-        self.play(ApplyMatrix(full_rank_matrix, cube))
+        self.play(BatchedApplyMatrix(full_rank_matrix, cube))
         self.wait(2)
         
         # Clean up for the next transformation
@@ -121,14 +128,14 @@ class RankVisualization(ThreeDScene):
         self.play(Write(rank_info2))
         
         # Create another matrix that will collapse to rank 2
-        # This simulates a rank 2 transformation by flattening in one direction
+        # Flattening in one direction leaves the cube as a flat polygon
         collapse_matrix = [
             [1, 0, 0],
             [0, 1, 0],
-            [0, 0, 0.01]  # Almost zero to show the collapse
+            [0, 0, 0]
         ]
         
-        self.play(ApplyMatrix(collapse_matrix, cube2))
+        self.play(RankAwareApplyMatrix(collapse_matrix, cube2))
         self.wait(1)
         
         # Apply another transformation to show how it stays in a plane
@@ -138,7 +145,7 @@ class RankVisualization(ThreeDScene):
             [0, 0, 1]
         ]
         
-        self.play(ApplyMatrix(shear_matrix, cube2))
+        self.play(BatchedApplyMatrix(shear_matrix, cube2))
         self.wait(2)
         
         # Clean up for the next transformation
@@ -187,20 +194,20 @@ class RankVisualization(ThreeDScene):
         # First flatten in one direction (simulate part of rank 1 transformation)
         collapse_matrix1 = [
             [1, 0, 0],
-            [0, 0.01, 0],  # Almost zero
+            [0, 0, 0],
             [0, 0, 1]
         ]
         
-        self.play(ApplyMatrix(collapse_matrix1, cube3))
+        self.play(RankAwareApplyMatrix(collapse_matrix1, cube3))
         
         # Then flatten in another direction to get a line (rank 1)
         collapse_matrix2 = [
             [1, 0, 0],
             [0, 1, 0],
-            [0, 0, 0.01]  # Almost zero
+            [0, 0, 0]
         ]
         
-        self.play(ApplyMatrix(collapse_matrix2, cube3))
+        self.play(RankAwareApplyMatrix(collapse_matrix2, cube3))
         
         # Apply a final stretching to emphasize the line
         stretch_matrix = [
@@ -209,7 +216,7 @@ class RankVisualization(ThreeDScene):
             [0, 0, 1]
         ]
         
-        self.play(ApplyMatrix(stretch_matrix, cube3))
+        self.play(BatchedApplyMatrix(stretch_matrix, cube3))
         self.wait(2)
         
         # ---------- Rank 0 Transformation (Zero Matrix) ----------
@@ -251,12 +258,12 @@ class RankVisualization(ThreeDScene):
         
         # Apply transformation that collapses everything to the origin
         zero_matrix = [
-            [0.001, 0, 0],  # Almost zero
-            [0, 0.001, 0],  # Almost zero
-            [0, 0, 0.001]   # Almost zero
+            [0, 0, 0],
+            [0, 0, 0],
+            [0, 0, 0]
         ]
         
-        self.play(ApplyMatrix(zero_matrix, cube4))
+        self.play(RankAwareApplyMatrix(zero_matrix, cube4))
         self.wait(2)
         
         # Final summary
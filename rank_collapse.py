@@ -0,0 +1,105 @@
+from manim import *
+import numpy as np
+
+from batched_apply import BatchedApplyMatrix
+
+# Singular values below this (relative to the size of the geometry) count
+# as zero
+RANK_TOLERANCE = 1e-6
+
+
+def matrix_rank(matrix, tolerance=RANK_TOLERANCE):
+    singular = np.linalg.svd(np.asarray(matrix, dtype=float), compute_uv=False)
+    return int(np.sum(singular > tolerance * max(1.0, singular.max(initial=0.0))))
+
+
+def affine_frame(points, tolerance=RANK_TOLERANCE):
+    # Dimension of the smallest point/line/plane containing the points, with
+    # its centroid and an orthonormal basis of its directions
+    centroid = points.mean(axis=0)
+    _, singular, vt = np.linalg.svd(points - centroid, full_matrices=False)
+    scale = max(1.0, np.abs(points).max(initial=0.0))
+    dimension = int(np.sum(singular > tolerance * scale * np.sqrt(len(points))))
+    return dimension, centroid, vt[:dimension]
+
+
+def convex_hull_2d(coords):
+    # Andrew's monotone chain; returns hull indices counter-clockwise
+    order = sorted(range(len(coords)), key=lambda i: (coords[i][0], coords[i][1]))
+
+    def cross(o, a, b):
+        return (a[0] - o[0]) * (b[1] - o[1]) - (a[1] - o[1]) * (b[0] - o[0])
+
+    def chain(indices):
+        hull = []
+        for i in indices:
+            while len(hull) >= 2 and cross(coords[hull[-2]], coords[hull[-1]], coords[i]) <= 1e-12:
+                hull.pop()
+            hull.append(i)
+        return hull[:-1]
+
+    return chain(order) + chain(order[::-1])
+
+
+def collapsed_primitive(points, dimension, centroid, basis, style):
+    color, opacity, stroke_color, stroke_width, stroke_opacity = style
+    if dimension == 0:
+        return Dot(centroid, color=color)
+    coords = (points - centroid) @ basis.T
+    if dimension == 1:
+        return Line(
+            centroid + coords[:, 0].min() * basis[0],
+            centroid + coords[:, 0].max() * basis[0],
+            color=color,
+        )
+    hull = convex_hull_2d(coords.tolist())
+    # The hull stands in for the faces, so it takes their outline too (none
+    # for a Cube) instead of Polygon's default stroke
+    return Polygon(
+        *(centroid + coords[i] @ basis for i in hull),
+        color=color,
+        fill_opacity=opacity,
+        stroke_color=stroke_color,
+        stroke_width=stroke_width,
+        stroke_opacity=stroke_opacity,
+    )
+
+
+def collapse_to_rank(mobject):
+    # Replace the submobjects of a flattened 3D shape (a Cube after a
+    # singular matrix) with one primitive of the right dimension. The
+    # mobject itself stays, so the scene's references to it keep working.
+    members = mobject.family_members_with_points()
+    if not members:
+        return 3
+    points = np.concatenate([m.points for m in members])
+    dimension, centroid, basis = affine_frame(points)
+    if dimension == 3:
+        return dimension
+    face = members[0]
+    style = (
+        face.get_fill_color(),
+        face.get_fill_opacity(),
+        face.get_stroke_color(),
+        face.get_stroke_width(),
+        face.get_stroke_opacity(),
+    )
+    primitive = collapsed_primitive(points, dimension, centroid, basis, style)
+    mobject.remove(*mobject.submobjects)
+    mobject.clear_points()
+    mobject.add(primitive)
+    return dimension
+
+
+class RankAwareApplyMatrix(BatchedApplyMatrix):
+    # BatchedApplyMatrix for singular matrices: once the animation lands on
+    # a plane, line or point, the 3D faces are swapped for a polygon, segment
+    # or dot, so later frames don't fill and depth sort faces with no area
+    def __init__(self, matrix, mobject, **kwargs):
+        super().__init__(matrix, mobject, **kwargs)
+        self.rank = matrix_rank(self.matrix)
+
+    def finish(self):
+        super().finish()
+        if self.rank < 3:
+            self.collapsed_dimension = collapse_to_rank(self.mobject)
@@ -0,0 +1,455 @@
+import argparse
+import ast
+import importlib.util
+import json
+import os
+import sys
+import time
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from contextlib import nullcontext
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent
+
+# Base classes that mark a class as something `manim render` could pick up
+SCENE_BASES = {"Scene", "ThreeDScene", "MovingCameraScene", "ZoomedScene"}
+
+# Mixins from sections.py that let a scene be rendered section by section
+SECTIONED_BASES = {"ParallelSections"}
+
+DEFAULT_SETTINGS = {
+    "quality": "high_quality",
+    "media_dir": str(ROOT / "media"),
+}
+
+# Per-scene overrides; anything here is passed straight to manim's config
+SCENE_SETTINGS = {}
+
+
+def _base_names(node):
+    for base in node.bases:
+        if isinstance(base, ast.Name):
+            yield base.id
+        elif isinstance(base, ast.Attribute):
+            yield base.attr
+
+
+def _opted_out(node):
+    # A scene can keep itself out of batch renders with `render_all = False`
+    for stmt in node.body:
+        if (
+            isinstance(stmt, ast.Assign)
+            and any(isinstance(t, ast.Name) and t.id == "render_all" for t in stmt.targets)
+            and isinstance(stmt.value, ast.Constant)
+            and stmt.value.value is False
+        ):
+            return True
+    return False
+
+
+def find_scenes_in_file(path):
+    # Parse instead of importing so discovery never pays for `from manim import *`
+    tree = ast.parse(Path(path).read_text(encoding="utf-8"), filename=str(path))
+    scene_names = set(SCENE_BASES)
+    sectioned = set()
+    found = []
+    for node in tree.body:
+        if not isinstance(node, ast.ClassDef):
+            continue
+        bases = set(_base_names(node))
+        if not scene_names.intersection(bases):
+            continue
+        scene_names.add(node.name)
+        if bases & (SECTIONED_BASES | sectioned):
+            sectioned.add(node.name)
+        if node.name.startswith("_") or _opted_out(node):
+            continue
+        found.append((node.name, node.name in sectioned))
+    return found
+
+
+def discover_scenes(root=ROOT):
+    scenes = []
+    for path in sorted(Path(root).glob("*.py")):
+        if path.resolve() == Path(__file__).resolve():
+            continue
+        try:
+            names = find_scenes_in_file(path)
+        except SyntaxError as e:
+            print(f"skipping {path.name}: {e}", file=sys.stderr)
+            continue
+        scenes.extend((path, name, sectioned) for name, sectioned in names)
+    return scenes
+
+
+def load_module(path):
+    # Files like 3d.py are not valid module names, so load them by path
+    path = Path(path).resolve()
+    name = "_scene_" + path.stem.replace("-", "_")
+    if name in sys.modules:
+        return sys.modules[name]
+    if str(path.parent) not in sys.path:
+        sys.path.insert(0, str(path.parent))
+    spec = importlib.util.spec_from_file_location(name, path)
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[name] = module
+    spec.loader.exec_module(module)
+    return module
+
+
+def settings_for(scene_name, base=None, overrides=None):
+    settings = dict(DEFAULT_SETTINGS)
+    settings.update(base or {})
+    settings.update(SCENE_SETTINGS.get(scene_name, {}))
+    settings.update((overrides or {}).get(scene_name, {}))
+    return settings
+
+
+def _init_worker():
+    from shared_cache import install_from_env
+
+    install_from_env()
+
+
+def render_scene(path, scene_name, settings, section=None, batch_tex=False, incremental=False, profile=False, stream=None, preview=False, audit=None):
+    from manim import tempconfig
+
+    from mobject_pool import POOL
+    from sections import section_output_name
+
+    start = time.perf_counter()
+    pool_before = POOL.stats()
+    options = dict(settings)
+    options["input_file"] = str(path)
+    if section is not None:
+        options["output_file"] = section_output_name(scene_name, section)
+        # manim rewrites partial_movie_file_list.txt in the partial movie
+        # directory, so concurrent sections each need their own
+        options["partial_movie_dir"] = (
+            "{media_dir}/videos/{module_name}/{quality}/partial_movie_files/{scene_name}/"
+            + section_output_name(scene_name, section)
+        )
+    if incremental:
+        from incremental import MAX_FILES_CACHED
+
+        options["disable_caching"] = False
+        options["max_files_cached"] = max(options.get("max_files_cached", 0), MAX_FILES_CACHED)
+    if stream:
+        # One encoder per scene; there are no per-play files to reuse
+        options["disable_caching"] = True
+    with tempconfig(options):
+        scene_cls = getattr(load_module(path), scene_name)
+        if batch_tex:
+            from tex_batch import precompile_tex
+
+            precompile_tex(scene_cls)
+        scene = scene_cls()
+        scene.render_section = section
+        if stream:
+            from streaming import use_streaming
+
+            use_streaming(scene, checkpoint_sections=stream == "sections")
+        if preview:
+            from live_preview import LivePreview
+
+            live = LivePreview(scene, name=options.get("output_file"))
+        if incremental:
+            from incremental import track
+
+            tracker = track(scene)
+        if profile:
+            from profiling import PlayProfiler
+
+            profiler = PlayProfiler(scene)
+        if audit:
+            from scene_audit import SceneAudit
+
+            auditor = SceneAudit(scene, prune=audit == "prune")
+        try:
+            scene.render()
+        finally:
+            if profile:
+                profiler.close()
+            if preview:
+                live.close()
+        if incremental:
+            tracker.finish()
+            print(tracker.report(), flush=True)
+        stopped = preview and live.stopped_early
+        if stopped:
+            print(f"{scene_name} stopped from the preview window", flush=True)
+        if profile:
+            # Sections get their own report, named like their clip
+            report = profiler.write(name=options.get("output_file"))
+            print(f"profile of {scene_name}: {report}", flush=True)
+        if audit:
+            report = auditor.write(name=options.get("output_file"))
+            print(f"audit of {scene_name}: {report}", flush=True)
+        output = scene.renderer.file_writer.movie_file_path
+        if output and not Path(output).exists():
+            # e.g. a section whose plays were all skipped
+            output = None
+
+    from shared_cache import active
+
+    if active():
+        active().flush()
+    pool = POOL.stats()
+    return {
+        "scene": scene_name,
+        "file": Path(path).name,
+        "output": str(output) if output else None,
+        # A stopped render's movie only holds part of the scene
+        "status": "stopped" if stopped else "done",
+        "seconds": time.perf_counter() - start,
+        "pool_hits": pool["hits"] - pool_before["hits"],
+        "pool_misses": pool["misses"] - pool_before["misses"],
+    }
+
+
+def probe_sections(path, scene_name, settings, batch_tex=False):
+    from manim import tempconfig
+
+    from sections import count_sections
+
+    scene_cls = getattr(load_module(path), scene_name)
+    with tempconfig(dict(settings, input_file=str(path))):
+        if batch_tex:
+            # Compile once here rather than racing in every section worker
+            from tex_batch import precompile_tex
+
+            precompile_tex(scene_cls)
+        return count_sections(scene_cls)
+
+
+def stitch_sections(scene_name, outputs):
+    from sections import concat_movies, stitched_output_path
+
+    outputs = [p for p in outputs if p]
+    return str(concat_movies(outputs, stitched_output_path(outputs, scene_name)))
+
+
+def _drafting(job):
+    if not job.get("draft") or job["kind"] == "stitch":
+        return nullcontext()
+    from draft import drafting
+
+    return drafting(load_module(job["path"]))
+
+
+def _run_job(job):
+    start = time.perf_counter()
+    result = {"scene": job["scene"], "file": Path(job["path"]).name, "kind": job["kind"]}
+    try:
+        if job.get("draft"):
+            # draft.py imports manim, so this happens in the worker
+            from draft import draft_settings
+
+            job = dict(job, settings=draft_settings(job["settings"]))
+        with _drafting(job):
+            _dispatch(job, result)
+    except Exception as e:
+        result["error"] = f"{type(e).__name__}: {e}"
+    result.setdefault("seconds", time.perf_counter() - start)
+    return result
+
+
+def _dispatch(job, result):
+    if job["kind"] == "probe":
+        result["sections"] = probe_sections(job["path"], job["scene"], job["settings"], job["batch_tex"])
+    elif job["kind"] == "stitch":
+        result["output"] = stitch_sections(job["scene"], job["outputs"])
+    else:
+        # Split scenes had their TeX compiled by the probe job
+        batch_tex = job["batch_tex"] and job.get("section") is None
+        result.update(render_scene(
+            job["path"], job["scene"], job["settings"], job.get("section"), batch_tex,
+            incremental=job["incremental"], profile=job["profile"], stream=job["stream"],
+            preview=job["preview"], audit=job["audit"],
+        ))
+        result["section"] = job.get("section")
+
+
+class _SectionedRender:
+    # Bookkeeping for one scene that is rendered as parallel sections
+    def __init__(self, job):
+        self.job = job
+        self.outputs = []
+        self.pending = 0
+        self.seconds = 0.0
+        self.finished = False
+
+    def section_jobs(self, count):
+        self.outputs = [None] * count
+        self.pending = count
+        return [dict(self.job, kind="render", section=index) for index in range(count)]
+
+    def add_section(self, result):
+        self.outputs[result["section"]] = result.get("output")
+        self.seconds += result["seconds"]
+        self.pending -= 1
+        return self.pending == 0
+
+
+def _report(result, results, on_result=None):
+    status = "FAILED" if "error" in result else result.get("status", "done")
+    pool = ""
+    if result.get("pool_hits") or result.get("pool_misses"):
+        pool = f", pool {result['pool_hits']} hits/{result['pool_misses']} misses"
+    print(f"[{status}] {result['scene']} ({result['seconds']:.1f}s{pool})", flush=True)
+    results.append(result)
+    if on_result:
+        on_result(result)
+
+
+def run_jobs(jobs, workers, on_result=None):
+    results = []
+    sectioned = {}
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker) as pool:
+        futures = set()
+
+        def submit(job):
+            futures.add(pool.submit(_run_job, job))
+
+        for job in jobs:
+            if job.get("split"):
+                sectioned[job["scene"]] = _SectionedRender(job)
+                submit(dict(job, kind="probe"))
+            else:
+                submit(dict(job, kind="render"))
+
+        while futures:
+            done, _ = wait(futures, return_when=FIRST_COMPLETED)
+            futures -= done
+            for future in done:
+                result = future.result()
+                scene = sectioned.get(result["scene"])
+                if scene is None:
+                    _report(result, results, on_result)
+                elif scene.finished:
+                    # A section already failed; drop the rest of this scene
+                    continue
+                elif "error" in result or result.get("status") == "stopped":
+                    # Stitching a partial section would pass for the whole scene
+                    scene.finished = True
+                    result["seconds"] += scene.seconds
+                    _report(result, results, on_result)
+                elif result["kind"] == "probe":
+                    print(f"[split] {result['scene']} into {result['sections']} sections", flush=True)
+                    for section_job in scene.section_jobs(result["sections"]):
+                        submit(section_job)
+                elif result["kind"] == "render":
+                    if scene.add_section(result):
+                        submit(dict(scene.job, kind="stitch", outputs=scene.outputs))
+                else:
+                    scene.finished = True
+                    result["seconds"] += scene.seconds
+                    _report(result, results, on_result)
+    return results
+
+
+def print_summary(results, wall):
+    width = max((len(r["scene"]) for r in results), default=5)
+    print()
+    print(f"{'scene':<{width}}  {'seconds':>8}  output")
+    for r in sorted(results, key=lambda r: r["seconds"], reverse=True):
+        output = r.get("error") or r.get("output") or "-"
+        if r.get("status") == "stopped":
+            output += " (stopped early)"
+        print(f"{r['scene']:<{width}}  {r['seconds']:>8.1f}  {output}")
+    busy = sum(r["seconds"] for r in results)
+    print(f"\n{len(results)} scenes, {busy:.1f}s of render time in {wall:.1f}s wall")
+
+
+def build_jobs(args):
+    scenes = discover_scenes()
+    if args.scenes:
+        wanted = set(args.scenes)
+        scenes = [s for s in scenes if s[1] in wanted or s[0].name in wanted]
+    overrides = json.loads(Path(args.config).read_text()) if args.config else {}
+    base = {"quality": args.quality} if args.quality else {}
+    return [
+        {
+            "path": str(path),
+            "scene": name,
+            "settings": settings_for(name, base, overrides),
+            "split": sectioned and args.split_sections,
+            "batch_tex": args.batch_tex,
+            "incremental": args.incremental,
+            "draft": args.draft,
+            "profile": args.profile,
+            "preview": args.preview,
+            "audit": "prune" if args.prune_invisible else "report" if args.audit else None,
+            "stream": "sections" if args.stream_checkpoints else "scene" if args.stream else None,
+        }
+        for path, name, sectioned in scenes
+    ]
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Render every scene in the project in parallel.")
+    parser.add_argument("scenes", nargs="*", help="scene class names or file names to render (default: all)")
+    parser.add_argument("-j", "--workers", type=int, default=min(4, os.cpu_count() or 1))
+    parser.add_argument("-q", "--quality", choices=["low_quality", "medium_quality", "high_quality", "production_quality", "fourk_quality"])
+    parser.add_argument("--config", help="JSON file mapping scene names to manim config overrides")
+    parser.add_argument("--split-sections", action="store_true", help="render the sections of ParallelSections scenes in separate workers and stitch them")
+    parser.add_argument("--batch-tex", action="store_true", help="compile all missing TeX of a scene in one LaTeX run before rendering it")
+    parser.add_argument("--cache-report", "--incremental", dest="incremental", action="store_true", help="report which play()/wait() calls manim's partial movie cache reused or rebuilt, and why (see incremental.py)")
+    parser.add_argument("--shared-cache", metavar="DIR", default=os.environ.get("MANIM_SHARED_CACHE"), help="share compiled TeX/text SVGs through this directory (default: $MANIM_SHARED_CACHE)")
+    parser.add_argument("--cache-mb", type=float, help="size cap of the shared cache in MB")
+    parser.add_argument("--profile", action="store_true", help="time every play()/wait() call and write a report to <media_dir>/profiles")
+    parser.add_argument("--audit", action="store_true", help="record scene-graph size, points and invisible mobjects per play()/wait() in <media_dir>/audits (see scene_audit.py)")
+    parser.add_argument("--prune-invisible", action="store_true", help="like --audit, and also remove fully transparent mobjects from the scene before every play")
+    parser.add_argument("--stream", action="store_true", help="encode each scene through one long-lived encoder instead of partial movies (see streaming.py)")
+    parser.add_argument("--stream-checkpoints", action="store_true", help="like --stream, but write one file per section and join them at the end")
+    parser.add_argument("--preview", action="store_true", help="show frames in a live viewer window while rendering; press a in it to stop the scene early (see live_preview.py)")
+    parser.add_argument("--draft", action="store_true", help="quick low-fidelity render for layout review (see draft.py)")
+    parser.add_argument("--manifest", nargs="?", const=str(ROOT / "render_all.progress.jsonl"), metavar="STATE", help="skip scenes whose source, helpers, manim version and settings are unchanged since their last successful render, and record every result in STATE (see manifest.py)")
+    parser.add_argument("--list", action="store_true", help="only list the discovered scenes")
+    args = parser.parse_args(argv)
+    if args.cache_mb is not None and not args.shared_cache:
+        parser.error("--cache-mb needs --shared-cache (or MANIM_SHARED_CACHE)")
+    return args
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    if args.incremental and (args.stream or args.stream_checkpoints):
+        print("--cache-report reports on partial movies, which streaming doesn't write", file=sys.stderr)
+        return 2
+    jobs = build_jobs(args)
+    if args.list:
+        for job in jobs:
+            split = " (sections)" if job["split"] else ""
+            print(f"{Path(job['path']).name}: {job['scene']}{split}")
+        return 0
+    if not jobs:
+        print("no scenes found", file=sys.stderr)
+        return 1
+
+    manifest = None
+    if args.manifest:
+        from manifest import Manifest
+
+        manifest = Manifest(args.manifest)
+        jobs, skipped = manifest.pending(jobs)
+        for job in skipped:
+            print(f"[unchanged] {job['scene']}", flush=True)
+        if not jobs:
+            print("all scenes are up to date")
+            return 0
+
+    if args.shared_cache:
+        # Workers pick the cache up from the environment in _init_worker
+        os.environ["MANIM_SHARED_CACHE"] = args.shared_cache
+        if args.cache_mb is not None:
+            os.environ["MANIM_SHARED_CACHE_MB"] = str(args.cache_mb)
+
+    start = time.perf_counter()
+    results = run_jobs(jobs, max(1, args.workers), on_result=manifest.record if manifest else None)
+    print_summary(results, time.perf_counter() - start)
+    return 1 if any("error" in r for r in results) else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,258 @@
+import argparse
+import importlib
+import json
+import os
+import socket
+import socketserver
+import sys
+import threading
+import time
+from pathlib import Path
+
+import render_all
+from manifest import Manifest, job_key, local_imports
+
+ROOT = Path(__file__).resolve().parent
+SOCKET = ROOT / ".render_daemon.sock"
+
+# Seconds between two looks at the watched files' modification times
+POLL_INTERVAL = 0.5
+
+# render_all.py flags the daemon can't honour: it renders scenes one after
+# another in a single process, and installs the shared cache once at startup
+UNSUPPORTED = {
+    "split_sections": "--split-sections (the daemon renders whole scenes one at a time)",
+    "list": "--list (use `render_daemon.py ping`)",
+}
+
+# A long-lived render process. It imports manim and every scene module once;
+# after that a render request only pays for the render itself. The scene
+# files and the project modules they import are watched by polling their
+# modification times: a changed file is reloaded, together with the modules
+# that import it, and everything else stays loaded. The mobject pool and
+# manim's in-process caches also survive between renders.
+#
+# Requests come in over a Unix socket, one JSON line each, and take the same
+# arguments as render_all.py:
+#
+#     python render_daemon.py serve --watch &
+#     python render_daemon.py render main.py -q low_quality
+#     python render_daemon.py stop
+#
+# --manifest works as in render_all.py. --split-sections and --list are
+# rejected, and so is a --shared-cache or --cache-mb other than the one the
+# daemon was started with (MANIM_SHARED_CACHE, MANIM_SHARED_CACHE_MB).
+
+
+def _scene_module_name(path):
+    # The name render_all.load_module gives a scene file
+    return "_scene_" + Path(path).stem.replace("-", "_")
+
+
+class ModuleWatcher:
+    def __init__(self, root=ROOT):
+        self.root = Path(root)
+        self.scene_files = sorted({path.resolve() for path, _, _ in render_all.discover_scenes(self.root)})
+        self.refresh()
+
+    def refresh(self):
+        # Dependencies of every watched file, and the mtimes they were loaded at
+        self.imports = {path: local_imports(path, self.root) for path in self.scene_files}
+        helpers = {helper for deps in self.imports.values() for helper in deps}
+        for helper in list(helpers):
+            self.imports[helper] = local_imports(helper, self.root)
+        self.mtimes = {path: path.stat().st_mtime_ns for path in self.imports}
+
+    def changed(self):
+        return sorted(
+            path for path, mtime in self.mtimes.items()
+            if not path.exists() or path.stat().st_mtime_ns != mtime
+        )
+
+    def affected(self, changed):
+        # The changed files plus every watched file that imports one of them,
+        # dependencies before the modules that import them
+        changed = set(changed)
+        dirty = [path for path in self.imports if path in changed or changed.intersection(self.imports[path])]
+        return sorted(dirty, key=lambda path: (path in self.scene_files, len(self.imports[path])))
+
+    def reload(self, changed):
+        dirty = self.affected(changed)
+        for path in dirty:
+            if path in self.scene_files:
+                sys.modules.pop(_scene_module_name(path), None)
+                if path.exists():
+                    render_all.load_module(path)
+            elif path.stem in sys.modules:
+                importlib.reload(sys.modules[path.stem])
+        self.refresh()
+        return dirty
+
+    def load_all(self):
+        for path in self.scene_files:
+            render_all.load_module(path)
+
+
+def parse_render_args(argv):
+    # render_all.py arguments; ValueError for bad ones and for the ones the
+    # daemon can't honour, so a request never takes the daemon down
+    try:
+        args = render_all.parse_args(argv)
+    except SystemExit:
+        raise ValueError(f"invalid render_all.py arguments: {' '.join(argv)}") from None
+    for name, flag in UNSUPPORTED.items():
+        if getattr(args, name):
+            raise ValueError(f"{flag} is not supported by the render daemon")
+    if args.incremental and (args.stream or args.stream_checkpoints):
+        raise ValueError("--cache-report reports on partial movies, which streaming doesn't write")
+    if args.shared_cache != os.environ.get("MANIM_SHARED_CACHE"):
+        raise ValueError("--shared-cache must be set when the daemon starts (MANIM_SHARED_CACHE)")
+    if args.cache_mb is not None and args.cache_mb != float(os.environ.get("MANIM_SHARED_CACHE_MB", "nan")):
+        raise ValueError("--cache-mb must be set when the daemon starts (MANIM_SHARED_CACHE_MB)")
+    return args
+
+
+class RenderDaemon:
+    def __init__(self, root=ROOT, auto_args=None):
+        self.watcher = ModuleWatcher(root)
+        # Reloading and rendering touch the same modules and manim's global
+        # config, so they never run at the same time
+        self.lock = threading.Lock()
+        self.auto_args = auto_args
+        self.stopping = threading.Event()
+
+    def start(self):
+        start = time.perf_counter()
+        render_all._init_worker()
+        self.watcher.load_all()
+        print(f"loaded {len(self.watcher.scene_files)} scene files in {time.perf_counter() - start:.1f}s", flush=True)
+
+    def check(self):
+        with self.lock:
+            changed = self.watcher.changed()
+            if not changed:
+                return []
+            try:
+                dirty = self.watcher.reload(changed)
+            except Exception as e:
+                # Keep serving the last good modules until the file is fixed
+                print(f"[reload failed] {type(e).__name__}: {e}", flush=True)
+                self.watcher.mtimes.update((p, p.stat().st_mtime_ns) for p in changed if p.exists())
+                return []
+        print(f"[reloaded] {', '.join(p.name for p in dirty)}", flush=True)
+        return [p for p in dirty if p in self.watcher.scene_files]
+
+    def watch(self):
+        while not self.stopping.wait(POLL_INTERVAL):
+            scenes = self.check()
+            if scenes and self.auto_args is not None:
+                self.render(self.auto_args + [p.name for p in scenes])
+
+    def render(self, argv):
+        # Same arguments as render_all.py; scenes render one after another
+        args = parse_render_args(argv)
+        results = []
+        with self.lock:
+            jobs = render_all.build_jobs(args)
+            manifest = None
+            if args.manifest:
+                manifest = Manifest(args.manifest)
+                jobs, skipped = manifest.pending(jobs)
+                for job in skipped:
+                    record = manifest.state[job_key(job["path"], job["scene"])]
+                    print(f"[unchanged] {job['scene']}", flush=True)
+                    results.append({"scene": job["scene"], "status": "unchanged", "seconds": 0.0, "output": record["output"]})
+            for job in jobs:
+                result = render_all._run_job(dict(job, kind="render"))
+                render_all._report(result, results, manifest.record if manifest else None)
+        return results
+
+
+class _Handler(socketserver.StreamRequestHandler):
+    def handle(self):
+        daemon = self.server.render_daemon
+        request = json.loads(self.rfile.readline())
+        if request["command"] == "stop":
+            reply = {"stopped": True}
+            daemon.stopping.set()
+            threading.Thread(target=self.server.shutdown).start()
+        elif request["command"] == "ping":
+            reply = {"scenes": [p.name for p in daemon.watcher.scene_files]}
+        else:
+            # Pick up edits made since the last poll before rendering
+            daemon.check()
+            try:
+                reply = {"results": daemon.render(request["argv"])}
+            except ValueError as e:
+                reply = {"error": str(e)}
+        self.wfile.write(json.dumps(reply).encode() + b"\n")
+
+
+def serve(socket_path, watch=False, auto_args=None):
+    daemon = RenderDaemon(auto_args=auto_args)
+    daemon.start()
+    socket_path = Path(socket_path)
+    if socket_path.exists():
+        socket_path.unlink()
+    with socketserver.UnixStreamServer(str(socket_path), _Handler) as server:
+        server.render_daemon = daemon
+        if watch:
+            threading.Thread(target=daemon.watch, daemon=True).start()
+        print(f"listening on {socket_path}", flush=True)
+        try:
+            server.serve_forever()
+        finally:
+            daemon.stopping.set()
+            socket_path.unlink(missing_ok=True)
+    return 0
+
+
+def request(socket_path, message):
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as client:
+        client.connect(str(socket_path))
+        client.sendall(json.dumps(message).encode() + b"\n")
+        with client.makefile("rb") as reply:
+            return json.loads(reply.readline())
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Keep manim and the scene modules loaded and render on request.")
+    parser.add_argument("--socket", default=os.environ.get("RENDER_DAEMON_SOCKET", str(SOCKET)))
+    commands = parser.add_subparsers(dest="command", required=True)
+    serve_parser = commands.add_parser("serve", help="start the daemon in the foreground")
+    serve_parser.add_argument("--watch", action="store_true", help="reload changed scene and helper modules as soon as they are saved")
+    serve_parser.add_argument("--auto", nargs=argparse.REMAINDER, metavar="ARGS", help="with --watch, also re-render the affected scenes on every change, with these render_all.py arguments")
+    render_parser = commands.add_parser("render", help="render scenes in the running daemon")
+    render_parser.add_argument("argv", nargs=argparse.REMAINDER, metavar="ARGS", help="render_all.py arguments")
+    commands.add_parser("ping", help="list the scene files the daemon has loaded")
+    commands.add_parser("stop", help="stop the daemon")
+    args = parser.parse_args(argv)
+
+    if args.command == "serve":
+        if args.auto is not None:
+            try:
+                parse_render_args(args.auto)
+            except ValueError as e:
+                parser.error(f"--auto: {e}")
+        return serve(args.socket, watch=args.watch, auto_args=args.auto)
+    try:
+        reply = request(args.socket, {"command": args.command, "argv": getattr(args, "argv", [])})
+    except (FileNotFoundError, ConnectionRefusedError):
+        print(f"no daemon listening on {args.socket}; start one with `python render_daemon.py serve`", file=sys.stderr)
+        return 1
+    if args.command == "ping":
+        print("\n".join(reply["scenes"]))
+        return 0
+    if args.command == "stop":
+        return 0
+    if "error" in reply:
+        print(reply["error"], file=sys.stderr)
+        return 2
+    for result in reply["results"]:
+        output = result.get("error") or result.get("output") or "-"
+        print(f"{result['scene']}: {result['seconds']:.1f}s  {output}")
+    return 1 if any("error" in r for r in reply["results"]) else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,171 @@
+import json
+import sys
+from collections import Counter
+from pathlib import Path
+
+import numpy as np
+from manim import ThreeDScene, VMobject, config
+
+from incremental import call_site
+from profiling import peak_rss_mb
+
+# What the scene holds after every play()/wait(): how many top-level
+# mobjects and family members the renderer walks each frame, how many points
+# they carry, and which top-level mobjects can't be seen. A mobject is
+#
+#   transparent  every member with points has zero fill, stroke and
+#                background stroke opacity (e.g. after FadeOut-style
+#                set_opacity(0) without a remove)
+#   off-screen   its bounding box is completely outside the camera frame
+#                (not checked for 3D scenes, where the camera turns)
+#   empty        nothing in its family has points
+#
+# Only VMobject families are judged; trackers and images always count as
+# visible. The same mobject flagged in play after play usually means a
+# missing self.remove(). With prune=True transparent mobjects are removed
+# from the scene before every play, so they are no longer traversed or
+# rasterized; a play that animates one adds it back as usual. Mobjects with
+# updaters are never pruned, since an updater may be what brings them back,
+# and neither are empty ones, which cost nothing and may be filled later.
+
+
+def _drawn(member):
+    return bool(
+        member.fill_rgbas[:, 3].any()
+        or (member.stroke_width > 0 and member.stroke_rgbas[:, 3].any())
+        or (member.background_stroke_width > 0 and member.background_stroke_rgbas[:, 3].any())
+    )
+
+
+def visibility(mobject, camera=None):
+    # "transparent", "off-screen", "empty" or None for a visible mobject
+    members = mobject.family_members_with_points()
+    if not members:
+        return "empty"
+    if not all(isinstance(m, VMobject) for m in members):
+        return None
+    if not any(_drawn(m) for m in members):
+        return "transparent"
+    if camera is not None:
+        points = np.concatenate([m.points for m in members])
+        low, high = points.min(axis=0), points.max(axis=0)
+        center = camera.frame_center
+        half = np.array([camera.frame_width / 2, camera.frame_height / 2])
+        if np.any(low[:2] > center[:2] + half) or np.any(high[:2] < center[:2] - half):
+            return "off-screen"
+    return None
+
+
+def _has_updaters(mobject):
+    return any(m.updaters for m in mobject.get_family())
+
+
+class SceneAudit:
+    def __init__(self, scene, prune=False):
+        self.scene = scene
+        self.prune = prune
+        self.scene_file = Path(sys.modules[type(scene).__module__].__file__).resolve()
+        self.records = []
+        self.flagged = Counter()
+        # Strong references keep ids unique for the whole scene
+        self.ids = {}
+
+        renderer = scene.renderer
+        play = renderer.play
+
+        def audited_play(scene, *args, **kwargs):
+            lineno, source = call_site(self.scene_file)
+            pruned = self.prune_invisible() if self.prune else []
+            play(scene, *args, **kwargs)
+            self.record(lineno, source, pruned)
+
+        renderer.play = audited_play
+
+    def label(self, mobject):
+        entry = self.ids.get(id(mobject))
+        if entry is None:
+            entry = self.ids[id(mobject)] = (f"{type(mobject).__name__}#{len(self.ids)}", mobject)
+        return entry[0]
+
+    def camera(self):
+        # Off-screen checks only make sense for a flat camera
+        return None if isinstance(self.scene, ThreeDScene) else self.scene.renderer.camera
+
+    def prune_invisible(self):
+        doomed = [
+            m for m in self.scene.mobjects
+            if visibility(m) == "transparent" and not _has_updaters(m)
+        ]
+        self.scene.remove(*doomed)
+        return [self.label(m) for m in doomed]
+
+    def record(self, lineno, source, pruned):
+        scene = self.scene
+        family = [m for top in scene.mobjects for m in top.get_family()]
+        points = sum(m.points.nbytes for m in family)
+        camera = self.camera()
+        invisible = {}
+        for mobject in scene.mobjects:
+            reason = visibility(mobject, camera)
+            if reason is not None:
+                name = self.label(mobject)
+                invisible[name] = reason
+                self.flagged[name] += 1
+        self.records.append({
+            "index": len(self.records),
+            "line": lineno,
+            "source": source,
+            "animations": [type(a).__name__ for a in scene.animations or []],
+            "mobjects": len(scene.mobjects),
+            "family": len(family),
+            "points": sum(len(m.points) for m in family),
+            "points_mb": points / 1e6,
+            "peak_rss_mb": peak_rss_mb(),
+            "invisible": invisible,
+            "pruned": pruned,
+        })
+
+    def summary(self):
+        last = self.records[-1] if self.records else {}
+        return {
+            "scene": type(self.scene).__name__,
+            "plays": len(self.records),
+            "max_family": max((r["family"] for r in self.records), default=0),
+            "max_points": max((r["points"] for r in self.records), default=0),
+            "final_family": last.get("family", 0),
+            "peak_rss_mb": peak_rss_mb(),
+            "pruned": sum(len(r["pruned"]) for r in self.records),
+            "flagged": dict(self.flagged.most_common()),
+        }
+
+    def report(self):
+        summary = self.summary()
+        lines = [
+            f"{summary['scene']}: {summary['plays']} calls, up to {summary['max_family']} mobjects "
+            f"and {summary['max_points']} points, {summary['final_family']} mobjects at the end, "
+            f"peak RSS {summary['peak_rss_mb']:.0f} MB"
+            + (f", {summary['pruned']} pruned" if self.prune else ""),
+            "",
+            f"{'#':>4} {'line':>5} {'top':>5} {'family':>7} {'points':>8} {'MB':>6} {'hidden':>6}  call",
+        ]
+        for r in self.records:
+            lines.append(
+                f"{r['index']:>4} {r['line'] or '-':>5} {r['mobjects']:>5} {r['family']:>7} {r['points']:>8} "
+                f"{r['points_mb']:>6.2f} {len(r['invisible']):>6}  {r['source']}"
+            )
+        if self.flagged:
+            reasons = {}
+            for r in self.records:
+                reasons.update(r["invisible"])
+            lines += ["", "invisible but still in the scene (calls flagged):"]
+            lines += [f"  {name} {reasons[name]} in {count}" for name, count in self.flagged.most_common()]
+        return "\n".join(lines)
+
+    def write(self, directory=None, name=None):
+        directory = Path(directory or Path(config.media_dir) / "audits")
+        directory.mkdir(parents=True, exist_ok=True)
+        name = name or type(self.scene).__name__
+        json_file = directory / f"{name}.json"
+        json_file.write_text(json.dumps({"summary": self.summary(), "calls": self.records}, indent=1), encoding="utf-8")
+        (directory / f"{name}.txt").write_text(self.report() + "\n", encoding="utf-8")
+        return json_file
@@ -0,0 +1,67 @@
+from pathlib import Path
+
+from manim import tempconfig
+from manim.utils.exceptions import EndSceneEarlyException
+
+
+class ParallelSections:
+    # Mixin for scenes made of independent sections that can be rendered in
+    # separate processes. Subclasses implement get_sections() instead of
+    # construct(); each section is a (name, callable) pair run in order.
+    #
+    # When render_section is set, every other section still runs its Python
+    # code (so the starting state is rebuilt exactly), but manim skips
+    # rasterizing and encoding it, and the scene stops after that section.
+    render_section = None
+
+    def get_sections(self):
+        raise NotImplementedError
+
+    def construct(self):
+        for index, (name, play) in enumerate(self.get_sections()):
+            skip = self.render_section is not None and index != self.render_section
+            self.next_section(name, skip_animations=skip)
+            play()
+            if index == self.render_section:
+                raise EndSceneEarlyException()
+
+
+def count_sections(scene_cls):
+    with tempconfig({"dry_run": True}):
+        return len(scene_cls().get_sections())
+
+
+def concat_movies(paths, output):
+    # Stream-copy the section clips into one movie, the same way manim joins
+    # its partial movie files
+    import av
+
+    output = Path(output)
+    list_file = output.with_suffix(".sections.txt")
+    with list_file.open("w", encoding="utf-8") as fp:
+        for path in paths:
+            fp.write(f"file 'file:{Path(path).as_posix()}'\n")
+
+    source = av.open(str(list_file), format="concat", options={"safe": "0", "an": "1"})
+    source_stream = source.streams.video[0]
+    target = av.open(str(output), mode="w")
+    target_stream = target.add_stream(template=source_stream)
+    for packet in source.demux(source_stream):
+        if packet.dts is None:
+            continue
+        packet.dts = None
+        packet.stream = target_stream
+        target.mux(packet)
+    source.close()
+    target.close()
+    list_file.unlink()
+    return output
+
+
+def section_output_name(scene_name, index):
+    return f"{scene_name}_section{index:02d}"
+
+
+def stitched_output_path(section_outputs, scene_name):
+    first = Path(next(p for p in section_outputs if p))
+    return first.with_name(scene_name + first.suffix)
@@ -0,0 +1,218 @@
+import argparse
+import fcntl
+import json
+import os
+import shutil
+import sys
+import tempfile
+from contextlib import contextmanager
+from pathlib import Path
+
+# Compiled TeX and Pango SVGs are named after a hash of their input, so a
+# file with a given name can be shared by any checkout, worker or CI runner.
+KINDS = ("tex", "texts")
+
+# MB are 10^6 bytes here, as in movie_cache.py
+DEFAULT_MAX_MB = 512
+
+_active = None
+
+
+def _atomic_copy(src, dest):
+    # The file only appears under its final name once it is complete. Always
+    # a real copy: a hard link would keep evicted files alive in every media
+    # folder that fetched them, so the cap wouldn't bound the disk used
+    dest = Path(dest)
+    dest.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp = tempfile.mkstemp(dir=dest.parent, prefix=".tmp-", suffix=dest.suffix)
+    os.close(fd)
+    try:
+        shutil.copyfile(src, tmp)
+        os.replace(tmp, dest)
+    except BaseException:
+        if os.path.exists(tmp):
+            os.unlink(tmp)
+        raise
+
+
+class SharedCache:
+    def __init__(self, root, max_bytes=DEFAULT_MAX_MB * 1e6):
+        self.root = Path(root).expanduser().resolve()
+        self.max_bytes = max_bytes
+        self.stats = {"hits": 0, "misses": 0, "stores": 0}
+        for kind in KINDS:
+            (self.root / kind).mkdir(parents=True, exist_ok=True)
+
+    def path(self, kind, name):
+        return self.root / kind / name
+
+    def fetch(self, kind, dest):
+        dest = Path(dest)
+        cached = self.path(kind, dest.name)
+        try:
+            _atomic_copy(cached, dest)
+        except FileNotFoundError:
+            self.stats["misses"] += 1
+            return False
+        try:
+            os.utime(cached)  # mark as recently used for LRU eviction
+        except FileNotFoundError:
+            # Another worker evicted it after the copy; the copy is complete
+            pass
+        self.stats["hits"] += 1
+        return True
+
+    def store(self, kind, src):
+        src = Path(src)
+        if not src.exists() or self.path(kind, src.name).exists():
+            return
+        _atomic_copy(src, self.path(kind, src.name))
+        self.stats["stores"] += 1
+
+    @contextmanager
+    def locked(self):
+        with open(self.root / ".lock", "w") as lock:
+            fcntl.flock(lock, fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                fcntl.flock(lock, fcntl.LOCK_UN)
+
+    def entries(self):
+        files = []
+        for kind in KINDS:
+            for path in (self.root / kind).iterdir():
+                if path.name.startswith(".tmp-"):
+                    continue
+                try:
+                    st = path.stat()
+                except FileNotFoundError:
+                    continue
+                files.append((st.st_mtime, st.st_size, path))
+        return files
+
+    def evict(self, max_bytes=None):
+        # Drop least recently used files until the cache is under the cap
+        max_bytes = self.max_bytes if max_bytes is None else max_bytes
+        files = sorted(self.entries())
+        total = sum(size for _, size, _ in files)
+        evicted = 0
+        for _, size, path in files:
+            if total <= max_bytes:
+                break
+            try:
+                path.unlink()
+            except FileNotFoundError:
+                pass
+            total -= size
+            evicted += 1
+        return evicted, total
+
+    def totals(self):
+        # Counters every process has flushed so far
+        stats_file = self.root / "stats.json"
+        return json.loads(stats_file.read_text()) if stats_file.exists() else {}
+
+    def flush(self):
+        # Merge this process's counters into the shared totals and enforce the
+        # size cap; called once per rendered scene
+        with self.locked():
+            evicted, total = self.evict()
+            stats_file = self.root / "stats.json"
+            totals = self.totals()
+            for key, value in self.stats.items():
+                totals[key] = totals.get(key, 0) + value
+            totals["evictions"] = totals.get("evictions", 0) + evicted
+            totals["bytes"] = total
+            tmp = stats_file.with_suffix(".tmp")
+            tmp.write_text(json.dumps(totals, indent=2))
+            os.replace(tmp, stats_file)
+        self.stats = dict.fromkeys(self.stats, 0)
+        return totals
+
+
+def active():
+    return _active
+
+
+def install(root, max_mb=DEFAULT_MAX_MB):
+    # Route manim's TeX and Pango SVG lookups through the shared cache
+    global _active
+    from manim import config
+    from manim.mobject.text import tex_mobject, text_mobject
+    from manim.utils.tex_file_writing import generate_tex_file
+
+    if _active is not None:
+        return _active
+    cache = SharedCache(root, int(max_mb * 1e6))
+
+    tex_to_svg_file = tex_mobject.tex_to_svg_file
+
+    def cached_tex_to_svg_file(expression, environment=None, tex_template=None):
+        if tex_template is None:
+            tex_template = config["tex_template"]
+        svg_file = generate_tex_file(expression, environment, tex_template).with_suffix(".svg")
+        if svg_file.exists() or cache.fetch("tex", svg_file):
+            return svg_file
+        svg_file = tex_to_svg_file(expression, environment, tex_template)
+        cache.store("tex", svg_file)
+        return svg_file
+
+    def wrap_text2svg(cls):
+        text2svg = cls._text2svg
+
+        def cached_text2svg(self, color):
+            svg_file = config.get_dir("text_dir") / (self._text2hash(color) + ".svg")
+            if svg_file.exists() or cache.fetch("texts", svg_file):
+                return str(svg_file.resolve())
+            result = text2svg(self, color)
+            cache.store("texts", result)
+            return result
+
+        cls._text2svg = cached_text2svg
+
+    tex_mobject.tex_to_svg_file = cached_tex_to_svg_file
+    wrap_text2svg(text_mobject.Text)
+    wrap_text2svg(text_mobject.MarkupText)
+    _active = cache
+    return cache
+
+
+def install_from_env():
+    root = os.environ.get("MANIM_SHARED_CACHE")
+    if root:
+        return install(root, float(os.environ.get("MANIM_SHARED_CACHE_MB", DEFAULT_MAX_MB)))
+    return None
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Inspect or trim the shared TeX/text SVG cache.")
+    parser.add_argument("command", choices=["stats", "evict", "clear"])
+    parser.add_argument("--root", default=os.environ.get("MANIM_SHARED_CACHE"), required="MANIM_SHARED_CACHE" not in os.environ)
+    parser.add_argument("--max-mb", type=float, default=float(os.environ.get("MANIM_SHARED_CACHE_MB", DEFAULT_MAX_MB)))
+    args = parser.parse_args(argv)
+
+    cache = SharedCache(args.root, int(args.max_mb * 1e6))
+    if args.command == "stats":
+        # Read-only: no eviction, no counters merged
+        totals = cache.totals()
+        files = cache.entries()
+        size = sum(size for _, size, _ in files)
+        lookups = totals.get("hits", 0) + totals.get("misses", 0)
+        hit_rate = totals.get("hits", 0) / lookups if lookups else 0.0
+        print(f"{cache.root}: {len(files)} files, {size / 1e6:.1f} MB of {args.max_mb:g} MB")
+        print(f"hits {totals.get('hits', 0)}, misses {totals.get('misses', 0)} ({hit_rate:.0%} hit rate), "
+              f"stores {totals.get('stores', 0)}, evictions {totals.get('evictions', 0)}")
+    elif args.command == "evict":
+        with cache.locked():
+            evicted, total = cache.evict()
+        print(f"evicted {evicted} files, {total / 1e6:.1f} MB left")
+    else:
+        with cache.locked():
+            evicted, _ = cache.evict(0)
+        print(f"removed {evicted} files")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,105 @@
+import json
+import os
+import shutil
+from pathlib import Path
+
+from manim import config, logger
+from manim.scene.scene_file_writer import SceneFileWriter
+from manim.utils.file_ops import is_gif_format, write_to_movie
+
+# manim encodes every play()/wait() into its own partial movie (one encoder
+# start and one file each) and afterwards reads them all back to concatenate
+# the scene. StreamingFileWriter keeps a single encoder open for the whole
+# scene and writes frames straight into the final movie.
+#
+# With checkpoint_sections every section is streamed into its own file
+# instead, so a finished section survives a crash later in the scene. The
+# section files are joined by stream copy, which doesn't re-encode.
+#
+# Frames go to the encoder in order, so cached plays can't be spliced in:
+# the writer never reports a play as cached, and callers should render with
+# disable_caching. Scenes with sound are not supported.
+
+
+class StreamingFileWriter(SceneFileWriter):
+    def __init__(self, renderer, scene_name, checkpoint_sections=False, **kwargs):
+        # Set before super().__init__, which opens the first section
+        self.checkpoint_sections = checkpoint_sections
+        self.streams = []
+        self.stream_sections = {}
+        self.stream_open = False
+        super().__init__(renderer, scene_name, **kwargs)
+
+    def _stream_path(self):
+        if self.checkpoint_sections:
+            name = f"{self.output_name}_section{len(self.sections) - 1:04}{config.movie_file_extension}"
+            return self.partial_movie_directory / name
+        movie = Path(self.movie_file_path)
+        return movie.with_name(f"{movie.stem}_streaming{config.movie_file_extension}")
+
+    def begin_animation(self, allow_write=False, file_path=None):
+        if write_to_movie() and allow_write and not self.stream_open:
+            path = self._stream_path()
+            self.open_partial_movie_stream(file_path=str(path))
+            self.streams.append(path)
+            self.stream_sections[len(self.sections) - 1] = path
+            self.stream_open = True
+
+    def end_animation(self, allow_write=False):
+        # The encoder stays open across plays
+        pass
+
+    def close_stream(self):
+        if self.stream_open:
+            self.close_partial_movie_stream()
+            self.stream_open = False
+
+    def next_section(self, name, type_, skip_animations):
+        if self.checkpoint_sections:
+            self.close_stream()
+        super().next_section(name, type_, skip_animations)
+
+    def is_already_cached(self, hash_invocation):
+        return False
+
+    def combine_to_movie(self):
+        self.close_stream()
+        if not self.streams:
+            logger.info("No animations are contained in this scene.")
+            return
+        if self.includes_sound:
+            logger.warning("StreamingFileWriter does not write sound; the movie is silent.")
+        movie_file_path = self.gif_file_path if is_gif_format() else Path(self.movie_file_path)
+        if len(self.streams) == 1 and not is_gif_format():
+            if self.checkpoint_sections:
+                shutil.copyfile(self.streams[0], movie_file_path)
+            else:
+                os.replace(self.streams[0], movie_file_path)
+        else:
+            self.combine_files([str(p) for p in self.streams], movie_file_path, is_gif_format())
+            if not self.checkpoint_sections:
+                for path in self.streams:
+                    path.unlink()
+        self.print_file_ready_message(str(movie_file_path))
+
+    def combine_to_section_videos(self):
+        if not self.checkpoint_sections:
+            logger.warning("Section videos need checkpoint_sections when streaming; skipping them.")
+            return
+        self.finish_last_section()
+        sections_index = []
+        for index, section in enumerate(self.sections):
+            source = self.stream_sections.get(index)
+            if section.video is None or source is None:
+                continue
+            shutil.copyfile(source, self.sections_output_dir / section.video)
+            sections_index.append(section.get_dict(self.sections_output_dir))
+        with (self.sections_output_dir / f"{self.output_name}.json").open("w") as file:
+            json.dump(sections_index, file, indent=4)
+
+
+def use_streaming(scene, checkpoint_sections=False):
+    # Swap the writer of a freshly constructed scene, before it renders
+    renderer = scene.renderer
+    renderer.file_writer = StreamingFileWriter(renderer, type(scene).__name__, checkpoint_sections)
+    return renderer.file_writer
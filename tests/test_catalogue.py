@@ -0,0 +1,63 @@
+import numpy as np
+import pytest
+
+pytest.importorskip("manim")
+
+from catalogue import DEDUP_DECIMALS, compute_properties, dedupe, matrix_key  # noqa: E402
+
+
+def test_matrices_equal_after_rounding_share_a_clip():
+    tiny = 10.0 ** -(DEDUP_DECIMALS + 2)
+    entries = [
+        {"name": "shear", "matrix": [[1, 0.5], [0, 1]]},
+        {"name": "shear_again", "matrix": [[1 + tiny, 0.5], [0, 1 - tiny]]},
+        {"name": "scale", "matrix": [[2, 0], [0, 1]]},
+    ]
+    unique = dedupe(entries)
+    assert [e["name"] for e in unique] == ["shear", "scale"]
+    assert unique[0]["aliases"] == ["shear", "shear_again"]
+    assert unique[1]["aliases"] == ["scale"]
+
+
+def test_negative_zero_is_zero():
+    assert matrix_key([[1, -0.0], [0.0, 1]]) == matrix_key([[1, 0], [0, 1]])
+
+
+def test_sizes_never_share_a_key():
+    assert matrix_key(np.zeros((2, 2))) != matrix_key(np.zeros((3, 3)))
+
+
+def test_values_straddling_a_rounding_boundary_stay_apart():
+    half = 0.5 * 10.0 ** -DEDUP_DECIMALS
+    below = [[1, 0.5 + half * 0.99], [0, 1]]
+    above = [[1, 0.5 + half * 1.01], [0, 1]]
+    assert matrix_key(below) != matrix_key(above)
+
+
+def test_properties_of_regular_and_reflecting_matrices():
+    unique = dedupe([
+        {"name": "general", "matrix": [[2, 1], [1, 1]]},
+        {"name": "reflect", "matrix": [[0, 1], [1, 0]]},
+    ])
+    properties = compute_properties(unique)
+    general, reflect = (properties[e["key"]] for e in unique)
+    assert general["det"] == pytest.approx(1)
+    assert general["trace"] == pytest.approx(3)
+    assert not general["orientation_reversed"]
+    assert reflect["det"] == pytest.approx(-1)
+    assert reflect["orientation_reversed"]
+    assert reflect["area_factor"] == pytest.approx(1)
+    assert sorted(v[0] for v in reflect["eigenvalues"]) == pytest.approx([-1, 1])
+
+
+def test_properties_of_singular_matrices():
+    unique = dedupe([
+        {"name": "rank2", "matrix": [[1, 0.5, 0], [0.5, 0.25, 0], [0, 0, 0.8]]},
+        {"name": "rank1", "matrix": [[1, 2, 3], [0.5, 1, 1.5], [0.25, 0.5, 0.75]]},
+        {"name": "zero", "matrix": [[0, 0, 0], [0, 0, 0], [0, 0, 0]]},
+    ])
+    properties = compute_properties(unique)
+    assert [properties[e["key"]]["rank"] for e in unique] == [2, 1, 0]
+    for entry in unique:
+        assert properties[entry["key"]]["det"] == pytest.approx(0, abs=1e-12)
+        assert properties[entry["key"]]["singular_values"][-1] == pytest.approx(0, abs=1e-12)
@@ -0,0 +1,78 @@
+import json
+import shutil
+from types import SimpleNamespace
+
+import numpy as np
+import pytest
+
+pytest.importorskip("manim")
+
+from manim import RIGHT, UP, Circle, Square, Transform, Vector  # noqa: E402
+
+from keyframes import ROOT, KeyframeRecorder, export, plain_tex, transform_matrix  # noqa: E402
+
+
+def recorder():
+    scene = SimpleNamespace(renderer=SimpleNamespace(play=None, time=0.0), mobjects=[])
+    return KeyframeRecorder(scene)
+
+
+def test_identical_geometry_is_stored_once():
+    keyframes = recorder()
+    square = np.array([[0, 0, 0], [1, 0, 0], [1, 1, 0], [0, 1, 0]], dtype=float)
+    first = keyframes.store(square)
+    # z is dropped, so a copy at another depth is the same geometry
+    again = keyframes.store(square + [0, 0, 5])
+    moved = keyframes.store(square + [1, 0, 0])
+    assert first == again == 0
+    assert moved == len(square) * 2
+    assert len(keyframes.chunks) == 2
+    assert keyframes.size == 2 * len(square) * 2
+
+
+def test_object_ids_are_stable():
+    keyframes = recorder()
+    a, b = object(), object()
+    assert [keyframes.object_id(m) for m in (a, b, a)] == [0, 1, 0]
+
+
+def test_plain_tex():
+    assert plain_tex(r"\begin{bmatrix} 1 & 0 \\ 0 & 1 \end{bmatrix}") == "bmatrix 1 0 ; 0 1 bmatrix"
+
+
+def begun(*transforms):
+    for transform in transforms:
+        transform.begin()
+    return transforms
+
+
+def test_transform_to_a_matrix_image_is_fitted():
+    shear = np.array([[1.0, 1.0, 0.0], [0.0, 1.0, 0.0], [0.0, 0.0, 1.0]])
+    square = Square().shift(RIGHT)
+    transforms = begun(Transform(square, square.copy().apply_matrix(shear)))
+    assert np.allclose(transform_matrix(transforms), shear)
+
+
+def test_basis_vectors_are_fitted_by_their_ends():
+    before = np.array([[2.0, 0.0], [0.0, 1.0]])
+    after = np.array([[2.0, 1.0], [1.0, 1.0]])
+    transforms = begun(
+        Transform(Vector(before[:, 0]), Vector(after[:, 0])),
+        Transform(Vector(before[:, 1]), Vector(after[:, 1])),
+    )
+    assert np.allclose(transform_matrix(transforms)[:2, :2], after @ np.linalg.inv(before))
+
+
+def test_transforms_without_a_common_matrix_are_not_recorded():
+    assert transform_matrix(begun(Transform(Square(), Circle()))) is None
+    assert transform_matrix(begun(Transform(Square(), Square().shift(UP)))) is None
+    # One vector alone doesn't pin down a 2D matrix
+    assert transform_matrix(begun(Transform(Vector([1, 0]), Vector([2, 1])))) is None
+
+
+@pytest.mark.skipif(shutil.which("latex") is None, reason="needs LaTeX")
+def test_linear_transform_scene_records_its_shear(tmp_path):
+    json_file, _ = export(ROOT / "linear_transform.py", "LinearTransformationScene2D", tmp_path)
+    index = json.loads(json_file.read_text(encoding="utf-8"))
+    matrices = [entry["matrix"] for keyframe in index["keyframes"] for entry in keyframe["matrices"]]
+    assert matrices == [[[1, 1, 0], [0, 1, 0], [0, 0, 1]]]
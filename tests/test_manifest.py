@@ -0,0 +1,85 @@
+import pytest
+
+from manifest import Manifest, job_hash, job_key, load_state, local_imports
+
+
+@pytest.fixture
+def project(tmp_path):
+    (tmp_path / "helper.py").write_text("import numpy as np\nVALUE = 1\n", encoding="utf-8")
+    (tmp_path / "other.py").write_text("VALUE = 2\n", encoding="utf-8")
+    scene = tmp_path / "scene.py"
+    scene.write_text(
+        "from manim import *\nfrom helper import VALUE\n\n\ndef later():\n    import other\n",
+        encoding="utf-8",
+    )
+    return tmp_path
+
+
+def job(project, **extra):
+    return {"path": project / "scene.py", "scene": "Demo", "settings": {"quality": "low_quality"}, **extra}
+
+
+def test_local_imports_follow_project_modules_only(project):
+    assert local_imports(project / "scene.py", project) == [project / "helper.py", project / "other.py"]
+
+
+def test_hash_changes_with_sources_settings_and_flags(project):
+    base = job_hash(job(project), "0.19.0")
+    assert job_hash(job(project), "0.19.0") == base
+    assert job_hash(job(project), "0.19.1") != base
+    assert job_hash(job(project, settings={"quality": "high_quality"}), "0.19.0") != base
+    assert job_hash(job(project, draft=True), "0.19.0") != base
+    assert job_hash(job(project, audit="prune"), "0.19.0") != base
+    assert job_hash(job(project, audit="report"), "0.19.0") == base
+
+    (project / "other.py").write_text("VALUE = 3\n", encoding="utf-8")
+    assert job_hash(job(project), "0.19.0") != base
+
+
+def test_finished_jobs_are_skipped_until_they_change(project, tmp_path):
+    state = tmp_path / "state.jsonl"
+    output = tmp_path / "Demo.mp4"
+    output.write_bytes(b"movie")
+
+    manifest = Manifest(state)
+    todo, skipped = manifest.pending([job(project)])
+    assert (len(todo), len(skipped)) == (1, 0)
+    manifest.record({"file": str(project / "scene.py"), "scene": "Demo", "seconds": 1.5, "output": str(output)})
+
+    manifest = Manifest(state)
+    todo, skipped = manifest.pending([job(project)])
+    assert (len(todo), len(skipped)) == (0, 1)
+
+    (project / "helper.py").write_text("VALUE = 4\n", encoding="utf-8")
+    todo, skipped = Manifest(state).pending([job(project)])
+    assert (len(todo), len(skipped)) == (1, 0)
+
+
+def test_failed_stopped_and_missing_outputs_are_not_current(project, tmp_path):
+    state = tmp_path / "state.jsonl"
+    output = tmp_path / "Demo.mp4"
+    output.write_bytes(b"movie")
+    key = job_key(project / "scene.py", "Demo")
+    result = {"file": "scene.py", "scene": "Demo", "seconds": 1.0, "output": str(output)}
+
+    manifest = Manifest(state)
+    manifest.pending([job(project)])
+    digest = manifest.hashes[key]
+
+    manifest.record(dict(result, error="boom"))
+    assert not manifest.is_current(key, digest)
+    manifest.record(dict(result, status="stopped"))
+    assert not manifest.is_current(key, digest)
+    manifest.record(result)
+    assert manifest.is_current(key, digest)
+    output.unlink()
+    assert not manifest.is_current(key, digest)
+
+
+def test_later_lines_win(tmp_path):
+    state = tmp_path / "state.jsonl"
+    state.write_text(
+        '{"key": "a.py:A", "status": "failed"}\n\n{"key": "a.py:A", "status": "done"}\n',
+        encoding="utf-8",
+    )
+    assert load_state(state)["a.py:A"]["status"] == "done"
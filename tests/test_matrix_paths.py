@@ -0,0 +1,67 @@
+import numpy as np
+import pytest
+
+from matrix_paths import MatrixPath, MatrixTable, frame_alphas, polar_decompose
+
+
+def rotation_z(angle):
+    c, s = np.cos(angle), np.sin(angle)
+    return np.array([[c, -s, 0], [s, c, 0], [0, 0, 1]])
+
+
+def test_polar_decompose_rebuilds_matrix():
+    matrix = np.array([[2.0, 1.0, 0.0], [0.5, 1.5, 0.3], [0.0, 0.2, 1.0]])
+    rotation, stretch = polar_decompose(matrix)
+    assert np.allclose(rotation @ stretch, matrix)
+    assert np.allclose(rotation.T @ rotation, np.identity(3))
+    assert np.isclose(np.linalg.det(rotation), 1)
+    assert np.allclose(stretch, stretch.T)
+
+
+def test_polar_decompose_keeps_reflections_out_of_the_rotation():
+    mirror = np.diag([-1.0, 1.0, 1.0])
+    rotation, stretch = polar_decompose(mirror)
+    assert np.isclose(np.linalg.det(rotation), 1)
+    assert np.allclose(rotation @ stretch, mirror)
+
+
+def test_lerp_blends_entries():
+    path = MatrixPath(np.identity(3), rotation_z(np.pi / 2))
+    middle = path.at([0.5])[0]
+    assert np.allclose(middle, (np.identity(3) + rotation_z(np.pi / 2)) / 2)
+
+
+def test_polar_turns_at_constant_speed_without_shrinking():
+    path = MatrixPath(np.identity(3), rotation_z(np.pi / 2), mode="polar")
+    matrices = path.at([0, 0.5, 1])
+    assert np.allclose(matrices[0], np.identity(3))
+    assert np.allclose(matrices[1], rotation_z(np.pi / 4))
+    assert np.allclose(matrices[2], rotation_z(np.pi / 2))
+    assert np.allclose(np.linalg.det(matrices), 1)
+
+
+def test_polar_hits_both_ends_with_stretch():
+    start = np.diag([2.0, 1.0, 1.0])
+    end = rotation_z(np.pi / 3) @ np.diag([1.0, 3.0, 1.0])
+    matrices = MatrixPath(start, end, mode="polar").at([0, 1])
+    assert np.allclose(matrices[0], start)
+    assert np.allclose(matrices[1], end)
+
+
+def test_polar_falls_back_to_lerp_for_reflections():
+    path = MatrixPath(np.identity(3), np.diag([-1.0, 1.0, 1.0]), mode="polar")
+    assert path.mode == "lerp"
+
+
+def test_unknown_mode_is_rejected():
+    with pytest.raises(ValueError):
+        MatrixPath(np.identity(3), np.identity(3), mode="slerp")
+
+
+def test_table_matches_path_on_and_off_the_frame_grid():
+    path = MatrixPath(np.identity(3), rotation_z(np.pi), mode="polar")
+    table = MatrixTable(path, run_time=1, frame_rate=10, rate_func=lambda t: t * t)
+    assert len(frame_alphas(1, 10)) == 11
+    assert np.allclose(table(0.3), path.at([0.09])[0])
+    assert np.allclose(table(0.25), path.at([0.0625])[0])
+    assert np.allclose(table(1.0), rotation_z(np.pi))
@@ -0,0 +1,91 @@
+from functools import partialmethod
+
+import numpy as np
+import pytest
+
+from mobject_pool import MobjectPool, _freeze, _key
+
+
+class Label:
+    built = 0
+
+    def __init__(self, text, size=1):
+        Label.built += 1
+        self.text = text
+        self.size = size
+
+    def copy(self):
+        copy = object.__new__(Label)
+        copy.__dict__.update(self.__dict__)
+        return copy
+
+
+@pytest.fixture(autouse=True)
+def reset_label():
+    init = Label.__init__
+    Label.built = 0
+    yield
+    Label.__init__ = init
+
+
+def test_freeze_tells_lists_tuples_and_arrays_apart():
+    assert _freeze([1, 2]) != _freeze((1, 2))
+    assert _freeze(np.array([1.0, 2.0])) == _freeze(np.array([1.0, 2.0]))
+    assert _freeze(np.array([1.0, 2.0])) != _freeze(np.array([[1.0, 2.0]]))
+    assert _freeze({"a": 1, "b": [2]}) == _freeze({"b": [2], "a": 1})
+
+
+def test_freeze_rejects_arbitrary_objects():
+    with pytest.raises(TypeError):
+        _freeze(object())
+    assert _key(Label, (object(),), {}) is None
+
+
+def test_pool_builds_once_and_hands_out_copies():
+    pool = MobjectPool()
+    first = pool.get(Label, "x", size=2)
+    second = pool.get(Label, "x", size=2)
+    assert Label.built == 1
+    assert first is not second
+    assert second.text == "x" and second.size == 2
+    assert pool.stats() == {"templates": 1, "hits": 1, "misses": 1}
+
+
+def test_unpoolable_arguments_are_built_every_time():
+    pool = MobjectPool()
+    marker = object()
+    pool.get(Label, marker)
+    pool.get(Label, marker)
+    assert Label.built == 2
+    assert pool.stats()["templates"] == 0
+
+
+def test_least_recently_used_template_is_evicted():
+    pool = MobjectPool(max_size=2)
+    pool.get(Label, "a")
+    pool.get(Label, "b")
+    pool.get(Label, "a")
+    pool.get(Label, "c")
+    assert Label.built == 3
+    pool.get(Label, "a")
+    assert Label.built == 3
+    pool.get(Label, "b")
+    assert Label.built == 4
+
+
+def test_set_default_changes_the_key():
+    pool = MobjectPool()
+    pool.get(Label, "x")
+    Label.__init__ = partialmethod(Label.__init__, size=5)
+    label = pool.get(Label, "x")
+    assert Label.built == 2
+    assert label.size == 5
+
+
+def test_disabled_pool_keeps_no_templates():
+    pool = MobjectPool()
+    with pool.disabled():
+        pool.get(Label, "x")
+        pool.get(Label, "x")
+    assert Label.built == 2
+    assert pool.enabled and not pool.templates
@@ -0,0 +1,90 @@
+import os
+
+import pytest
+
+from movie_cache import (
+    INDEX_FILE,
+    LIST_FILE,
+    content_digests,
+    dedupe,
+    enforce_budget,
+    evict_unreferenced,
+    index_segments,
+    unique_bytes,
+)
+
+
+@pytest.fixture
+def videos(tmp_path):
+    # Three partial movies of one scene, the last render using a and b
+    scene_dir = tmp_path / "main" / "480p15" / "partial_movie_files" / "LinearTransform"
+    scene_dir.mkdir(parents=True)
+    for age, (name, data) in enumerate([("a", b"same"), ("b", b"same"), ("c", b"stale!")]):
+        path = scene_dir / f"{name}.mp4"
+        path.write_bytes(data)
+        os.utime(path, (1000 + age, 1000 + age))
+    (scene_dir / LIST_FILE).write_text(
+        "# manim partial movies\nfile 'file:/elsewhere/a.mp4'\nfile 'file:/elsewhere/b.mp4'\n",
+        encoding="utf-8",
+    )
+    return tmp_path
+
+
+def by_name(segments):
+    return {s.path.stem: s for s in segments}
+
+
+def test_index_reads_scene_and_references(videos):
+    segments = by_name(index_segments(videos))
+    assert sorted(segments) == ["a", "b", "c"]
+    assert segments["a"].key == "main/480p15/LinearTransform"
+    assert segments["a"].referenced and segments["b"].referenced
+    assert not segments["c"].referenced
+
+
+def test_evict_unreferenced(videos):
+    stale = evict_unreferenced(index_segments(videos), dry_run=False)
+    assert [s.path.stem for s in stale] == ["c"]
+    assert sorted(p.stem for p in videos.rglob("*.mp4")) == ["a", "b"]
+
+
+def test_dry_run_leaves_files_alone(videos):
+    segments = index_segments(videos)
+    evict_unreferenced(segments, dry_run=True)
+    content_digests(segments, videos, dry_run=True)
+    assert dedupe(segments, dry_run=True) == 1
+    assert len(list(videos.rglob("*.mp4"))) == 3
+    assert not (videos / INDEX_FILE).exists()
+    assert unique_bytes(index_segments(videos)) == 2 * len(b"same") + len(b"stale!")
+
+
+def test_digests_are_cached_by_size_and_mtime(videos):
+    segments = index_segments(videos)
+    content_digests(segments, videos, dry_run=False)
+    assert (videos / INDEX_FILE).exists()
+    digests = by_name(segments)
+    assert digests["a"].digest == digests["b"].digest != digests["c"].digest
+
+    # A stale index entry is trusted while size and mtime match
+    path = digests["a"].path
+    path.write_bytes(b"SAME")
+    os.utime(path, (1000, 1000))
+    again = by_name(index_segments(videos))
+    content_digests(again.values(), videos, dry_run=False)
+    assert again["a"].digest == digests["a"].digest
+
+
+def test_dedupe_hard_links_identical_segments(videos):
+    segments = index_segments(videos)
+    content_digests(segments, videos, dry_run=False)
+    assert dedupe(segments, dry_run=False) == 1
+    a, b = (videos.rglob(f"{name}.mp4").__next__() for name in "ab")
+    assert os.path.samefile(a, b)
+    assert unique_bytes(index_segments(videos)) == len(b"same") + len(b"stale!")
+
+
+def test_budget_drops_oldest_segments_first(videos):
+    segments = index_segments(videos)
+    removed = enforce_budget(segments, budget_bytes=len(b"stale!"), dry_run=False)
+    assert sorted(s.path.stem for s in removed) == ["a", "b"]
+    assert [p.stem for p in videos.rglob("*.mp4")] == ["c"]
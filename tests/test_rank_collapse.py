@@ -0,0 +1,58 @@
+import numpy as np
+import pytest
+
+pytest.importorskip("manim")
+
+from manim import Cube, Line, Polygon  # noqa: E402
+
+from rank_collapse import affine_frame, collapse_to_rank, convex_hull_2d, matrix_rank  # noqa: E402
+
+
+def test_matrix_rank():
+    assert matrix_rank(np.identity(3)) == 3
+    assert matrix_rank(np.diag([1.0, 1.0, 0.0])) == 2
+    assert matrix_rank(np.outer([1.0, 2.0, 3.0], [1.0, 0.0, 1.0])) == 1
+    assert matrix_rank(np.zeros((3, 3))) == 0
+    assert matrix_rank(np.diag([1.0, 1.0, 1e-9])) == 2
+
+
+def test_affine_frame_finds_the_containing_plane():
+    points = np.array([[0, 0, 1], [2, 0, 1], [0, 3, 1], [2, 3, 1]], dtype=float)
+    dimension, centroid, basis = affine_frame(points)
+    assert dimension == 2
+    assert np.allclose(centroid, [1, 1.5, 1])
+    assert np.allclose(np.abs(basis[:, 2]), 0)
+
+
+def test_convex_hull_drops_interior_and_collinear_points():
+    coords = [(0, 0), (1, 0), (2, 0), (2, 2), (0, 2), (1, 1)]
+    hull = convex_hull_2d(coords)
+    assert sorted(hull) == [0, 2, 3, 4]
+    # Counter-clockwise
+    area = sum(
+        coords[i][0] * coords[j][1] - coords[j][0] * coords[i][1]
+        for i, j in zip(hull, hull[1:] + hull[:1])
+    )
+    assert area > 0
+
+
+def test_flattened_cube_becomes_a_polygon():
+    cube = Cube()
+    cube.apply_matrix(np.diag([1.0, 1.0, 0.0]))
+    assert collapse_to_rank(cube) == 2
+    assert len(cube.submobjects) == 1
+    assert isinstance(cube.submobjects[0], Polygon)
+
+
+def test_cube_on_a_line_becomes_a_line():
+    cube = Cube()
+    cube.apply_matrix(np.outer([1.0, 0.0, 0.0], [1.0, 1.0, 1.0]))
+    assert collapse_to_rank(cube) == 1
+    assert isinstance(cube.submobjects[0], Line)
+
+
+def test_full_rank_cube_is_left_alone():
+    cube = Cube()
+    faces = list(cube.submobjects)
+    assert collapse_to_rank(cube) == 3
+    assert cube.submobjects == faces
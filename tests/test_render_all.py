@@ -0,0 +1,79 @@
+import pytest
+
+from render_all import discover_scenes, find_scenes_in_file, parse_args
+
+SCENES = '''
+from manim import *
+import manim
+from sections import ParallelSections
+
+
+class Helper:
+    pass
+
+
+class Plain(Scene):
+    pass
+
+
+class Spatial(manim.ThreeDScene):
+    pass
+
+
+class Derived(Plain):
+    pass
+
+
+class _Base(Scene):
+    pass
+
+
+class FromPrivate(_Base):
+    pass
+
+
+class Sectioned(ParallelSections, Scene):
+    pass
+
+
+class SectionedChild(Sectioned):
+    pass
+
+
+class Slow(Scene):
+    render_all = False
+'''
+
+
+def test_find_scenes_in_file(tmp_path):
+    path = tmp_path / "scenes.py"
+    path.write_text(SCENES, encoding="utf-8")
+    assert find_scenes_in_file(path) == [
+        ("Plain", False),
+        ("Spatial", False),
+        ("Derived", False),
+        ("FromPrivate", False),
+        ("Sectioned", True),
+        ("SectionedChild", True),
+    ]
+
+
+def test_discover_scenes_skips_broken_files(tmp_path, capsys):
+    (tmp_path / "b.py").write_text("class B(Scene):\n    pass\n", encoding="utf-8")
+    (tmp_path / "a.py").write_text("class A(MovingCameraScene):\n    pass\n", encoding="utf-8")
+    (tmp_path / "broken.py").write_text("class (:\n", encoding="utf-8")
+    (tmp_path / "notes.txt").write_text("class C(Scene): pass\n", encoding="utf-8")
+    scenes = discover_scenes(tmp_path)
+    assert [(path.name, name, sectioned) for path, name, sectioned in scenes] == [
+        ("a.py", "A", False),
+        ("b.py", "B", False),
+    ]
+    assert "skipping broken.py" in capsys.readouterr().err
+
+
+def test_cache_mb_needs_a_shared_cache(monkeypatch, capsys):
+    monkeypatch.delenv("MANIM_SHARED_CACHE", raising=False)
+    with pytest.raises(SystemExit):
+        parse_args(["--cache-mb", "64"])
+    assert "--cache-mb needs --shared-cache" in capsys.readouterr().err
+    assert parse_args(["--shared-cache", "/tmp/cache", "--cache-mb", "64"]).cache_mb == 64
@@ -0,0 +1,85 @@
+import json
+import os
+
+import pytest
+
+import shared_cache
+from shared_cache import SharedCache
+
+
+@pytest.fixture
+def cache(tmp_path):
+    return SharedCache(tmp_path / "cache", max_bytes=10)
+
+
+def svg(directory, name, data):
+    directory.mkdir(parents=True, exist_ok=True)
+    path = directory / name
+    path.write_bytes(data)
+    return path
+
+
+def test_store_then_fetch(cache, tmp_path):
+    src = svg(tmp_path / "render", "abc.svg", b"<svg/>")
+    cache.store("tex", src)
+    cache.store("tex", src)
+    dest = tmp_path / "other" / "abc.svg"
+    assert cache.fetch("tex", dest)
+    assert dest.read_bytes() == b"<svg/>"
+    assert not cache.fetch("tex", tmp_path / "other" / "missing.svg")
+    assert not cache.fetch("texts", tmp_path / "other" / "abc.svg.txt")
+    assert cache.stats == {"hits": 1, "misses": 2, "stores": 1}
+
+
+def test_fetch_copies_instead_of_linking(cache, tmp_path):
+    cache.store("texts", svg(tmp_path / "render", "t.svg", b"text"))
+    dest = tmp_path / "other" / "t.svg"
+    cache.fetch("texts", dest)
+    assert os.stat(dest).st_nlink == 1
+    assert not os.path.samefile(dest, cache.path("texts", "t.svg"))
+    assert not list(dest.parent.glob(".tmp-*"))
+
+
+def test_least_recently_used_files_are_evicted_first(cache, tmp_path):
+    for age, name in enumerate(["old", "used", "new"]):
+        cache.store("tex", svg(tmp_path / "render", f"{name}.svg", b"12345"))
+        os.utime(cache.path("tex", f"{name}.svg"), (1000 + age, 1000 + age))
+    # Fetching marks a file as recently used
+    cache.fetch("tex", tmp_path / "other" / "used.svg")
+    evicted, total = cache.evict()
+    assert (evicted, total) == (1, 10)
+    assert sorted(p.name for p in (cache.root / "tex").iterdir()) == ["new.svg", "used.svg"]
+
+
+def test_flush_enforces_the_cap_and_merges_counters(cache, tmp_path):
+    for name in ["a", "b", "c"]:
+        cache.store("tex", svg(tmp_path / "render", f"{name}.svg", b"12345"))
+    totals = cache.flush()
+    assert totals == {"hits": 0, "misses": 0, "stores": 3, "evictions": 1, "bytes": 10}
+    assert cache.stats == {"hits": 0, "misses": 0, "stores": 0}
+    assert json.loads((cache.root / "stats.json").read_text())["stores"] == 3
+
+
+def test_fetch_survives_an_eviction_after_the_copy(cache, tmp_path, monkeypatch):
+    cache.store("tex", svg(tmp_path / "render", "abc.svg", b"<svg/>"))
+    atomic_copy = shared_cache._atomic_copy
+
+    def copy_then_evict(src, dest):
+        atomic_copy(src, dest)
+        # Another worker's flush() gets in before the touch
+        os.unlink(src)
+
+    monkeypatch.setattr(shared_cache, "_atomic_copy", copy_then_evict)
+    dest = tmp_path / "other" / "abc.svg"
+    assert cache.fetch("tex", dest)
+    assert dest.read_bytes() == b"<svg/>"
+    assert cache.stats["hits"] == 1
+
+
+def test_stats_command_does_not_evict(cache, tmp_path, capsys):
+    for name in ["a", "b", "c"]:
+        cache.store("tex", svg(tmp_path / "render", f"{name}.svg", b"12345"))
+    shared_cache.main(["stats", "--root", str(cache.root), "--max-mb", "0.00001"])
+    assert len(list((cache.root / "tex").iterdir())) == 3
+    assert not (cache.root / "stats.json").exists()
+    assert "3 files" in capsys.readouterr().out
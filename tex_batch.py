@@ -0,0 +1,179 @@
+import argparse
+import hashlib
+import os
+import subprocess
+import sys
+import tempfile
+from pathlib import Path
+
+from manim import config, logger, tempconfig
+from manim.mobject.text import tex_mobject
+from manim.utils.tex_file_writing import (
+    delete_nonsvg_files,
+    generate_tex_file,
+    make_tex_compilation_command,
+)
+
+import shared_cache
+from mobject_pool import POOL
+
+BEGIN_DOCUMENT = r"\begin{document}"
+END_DOCUMENT = r"\end{document}"
+
+PLACEHOLDER_SVG = (
+    '<svg xmlns="http://www.w3.org/2000/svg" width="10" height="10" viewBox="0 0 10 10">'
+    '<path d="M0 0 L10 0 L10 10 L0 10 Z"/></svg>'
+)
+
+
+def collect_tex(scene_cls):
+    # Run the scene without rendering any frame and record every TeX file it
+    # asks for whose SVG is not compiled yet. MathTex gets a placeholder SVG
+    # so the scene keeps running; the real render happens afterwards.
+    missing = {}
+    original = tex_mobject.tex_to_svg_file
+
+    with tempfile.TemporaryDirectory() as tmp:
+        placeholder = Path(tmp) / "placeholder.svg"
+        placeholder.write_text(PLACEHOLDER_SVG, encoding="utf-8")
+
+        def record(expression, environment=None, tex_template=None):
+            if tex_template is None:
+                tex_template = config["tex_template"]
+            tex_file = generate_tex_file(expression, environment, tex_template)
+            svg_file = tex_file.with_suffix(".svg")
+            cache = shared_cache.active()
+            if svg_file.exists() or (cache and cache.fetch("tex", svg_file)):
+                return svg_file
+            missing.setdefault(tex_file, tex_template)
+            return placeholder
+
+        tex_mobject.tex_to_svg_file = record
+        try:
+            # Placeholder MathTex must not become pooled templates
+            with tempconfig({"dry_run": True}), POOL.disabled():
+                scene = scene_cls(skip_animations=True)
+                scene.render()
+        finally:
+            tex_mobject.tex_to_svg_file = original
+    return missing
+
+
+def _split_document(tex_code):
+    head, _, rest = tex_code.partition(BEGIN_DOCUMENT)
+    body = rest.rpartition(END_DOCUMENT)[0]
+    return head, body
+
+
+def _multi_page_head(head):
+    # standalone's `multi` option puts every standalone environment on its
+    # own page, which is what lets one run produce one SVG per expression
+    lines = head.split("\n")
+    for i, line in enumerate(lines):
+        stripped = line.strip()
+        if stripped.startswith(r"\documentclass") and stripped.endswith("{standalone}"):
+            if "[" in stripped:
+                lines[i] = stripped.replace("[", "[multi,", 1)
+            else:
+                lines[i] = stripped.replace(r"\documentclass", r"\documentclass[multi]", 1)
+            return "\n".join(lines)
+    return None
+
+
+def _page_number(svg_file):
+    return int(svg_file.stem.rsplit("-", 1)[1])
+
+
+def compile_batch(tex_files, tex_template):
+    # Compile many .tex files sharing one preamble as a single multi-page
+    # document and split the pages back into the per-hash SVGs manim expects.
+    # Returns False when the template can't be batched or the run fails, in
+    # which case manim compiles the expressions one by one as usual.
+    tex_dir = config.get_dir("tex_dir")
+    heads, bodies = set(), []
+    for tex_file in tex_files:
+        head, body = _split_document(tex_file.read_text(encoding="utf-8"))
+        heads.add(head)
+        bodies.append(body)
+    head = _multi_page_head(heads.pop()) if len(heads) == 1 else None
+    if head is None:
+        return False
+
+    pages = "".join(r"\begin{standalone}" + body + r"\end{standalone}" + "\n" for body in bodies)
+    document = head + BEGIN_DOCUMENT + "\n" + pages + END_DOCUMENT + "\n"
+    digest = hashlib.sha256(document.encode()).hexdigest()[:16]
+    batch_file = tex_dir / f"batch_{digest}.tex"
+    batch_file.write_text(document, encoding="utf-8")
+
+    output_format = tex_template.output_format
+    command = make_tex_compilation_command(tex_template.tex_compiler, output_format, batch_file, tex_dir)
+    if subprocess.run(command, stdout=subprocess.DEVNULL).returncode != 0:
+        logger.warning(f"Batched TeX compilation failed, see {batch_file.with_suffix('.log')}")
+        return False
+
+    dvi_file = batch_file.with_suffix(output_format)
+    subprocess.run(
+        [
+            "dvisvgm",
+            *(["--pdf"] if output_format == ".pdf" else []),
+            "--page=1-",
+            "--no-fonts",
+            "--verbosity=0",
+            f"--output={(tex_dir / batch_file.stem).as_posix()}-%p.svg",
+            dvi_file.as_posix(),
+        ],
+        stdout=subprocess.DEVNULL,
+    )
+    svg_pages = sorted(tex_dir.glob(f"{batch_file.stem}-*.svg"), key=_page_number)
+    if len(svg_pages) != len(tex_files):
+        logger.warning(f"Batched TeX produced {len(svg_pages)} pages for {len(tex_files)} expressions")
+        for page in svg_pages:
+            page.unlink()
+        return False
+
+    cache = shared_cache.active()
+    for tex_file, page in zip(tex_files, svg_pages):
+        os.replace(page, tex_file.with_suffix(".svg"))
+        if cache:
+            cache.store("tex", tex_file.with_suffix(".svg"))
+    if not config["no_latex_cleanup"]:
+        batch_file.unlink()
+        delete_nonsvg_files()
+    return True
+
+
+def precompile_tex(scene_cls):
+    missing = collect_tex(scene_cls)
+    groups = {}
+    for tex_file, tex_template in missing.items():
+        head = _split_document(tex_file.read_text(encoding="utf-8"))[0]
+        key = (tex_template.tex_compiler, tex_template.output_format, head)
+        groups.setdefault(key, ([], tex_template))[0].append(tex_file)
+
+    compiled = 0
+    for tex_files, tex_template in groups.values():
+        # Anything left uncompiled here is compiled one by one by manim itself
+        if compile_batch(tex_files, tex_template):
+            compiled += len(tex_files)
+    logger.info(f"Precompiled {compiled} of {len(missing)} missing TeX expressions")
+    return compiled
+
+
+def main(argv=None):
+    from render_all import load_module
+
+    parser = argparse.ArgumentParser(description="Compile all TeX a scene needs in one LaTeX run.")
+    parser.add_argument("file")
+    parser.add_argument("scenes", nargs="+")
+    parser.add_argument("--media-dir", default=str(Path(__file__).resolve().parent / "media"))
+    args = parser.parse_args(argv)
+
+    module = load_module(args.file)
+    with tempconfig({"media_dir": args.media_dir, "input_file": args.file}):
+        for name in args.scenes:
+            print(f"{name}: {precompile_tex(getattr(module, name))} expressions compiled")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())